@@ -0,0 +1,93 @@
+# Benchmark de ReminderStore. Se ejecuta contra cualquier backend:
+#
+#   python -m benchmarks.bench_reminder_store --backend sqlite
+#   REMINDERS_TABLE=reminders python -m benchmarks.bench_reminder_store --backend dynamodb
+#
+# Con dynamodb la tabla (y TriggerTimeIndex) debe existir; IF_OFFLINE=true
+# apunta a DynamoDB Local.
+import argparse
+import os
+import time
+import uuid
+from store.reminder_store import get_reminder_store
+
+
+def timed(label, operations, fn):
+  start = time.perf_counter()
+  fn()
+  elapsed = time.perf_counter() - start
+  print(f"{label:<16} {operations:>8} ops  {elapsed:8.3f}s  {elapsed / operations * 1e6:10.1f} us/op")
+
+
+def main():
+  parser = argparse.ArgumentParser(description='ReminderStore benchmark')
+  parser.add_argument('--backend', choices=['sqlite', 'dynamodb'], default='sqlite')
+  parser.add_argument('--sqlite-path', default=':memory:')
+  parser.add_argument('--users', type=int, default=100)
+  parser.add_argument('--reminders-per-user', type=int, default=100)
+  parser.add_argument('--page-size', type=int, default=25)
+  args = parser.parse_args()
+
+  os.environ['REMINDER_STORE'] = args.backend
+  os.environ['SQLITE_PATH'] = args.sqlite_path
+  store = get_reminder_store()
+
+  # Prefijo único para no mezclar datos entre ejecuciones
+  run_id = uuid.uuid4().hex[:8]
+  now = int(time.time() * 1000)
+  users = [f'bench-{run_id}-{u}' for u in range(args.users)]
+  items = [
+    {
+      'userId': user_id,
+      'reminderId': f'{r:08d}',
+      'title': f'Reminder {r}',
+      'description': 'Benchmark reminder',
+      # La mitad de los recordatorios ya están vencidos
+      'triggerAt': now + (r - args.reminders_per_user // 2) * 60000,
+      'status': 'pending',
+      'notificationTypes': ['email']
+    }
+    for user_id in users
+    for r in range(args.reminders_per_user)
+  ]
+  total = len(items)
+
+  print(f"backend={args.backend} users={args.users} reminders={total}")
+
+  timed('batch_write', total, lambda: store.batch_write(put_items=items))
+
+  def get_all():
+    for item in items[::10]:
+      store.get(item['userId'], item['reminderId'])
+  timed('get', len(items[::10]), get_all)
+
+  def query_users():
+    for user_id in users:
+      start_key = None
+      while True:
+        _, start_key = store.query_by_user(user_id, limit=args.page_size, start_key=start_key)
+        if not start_key:
+          break
+  timed('query_by_user', args.users, query_users)
+
+  due = []
+  def query_due():
+    start_key = None
+    while True:
+      page, start_key = store.query_due(now, limit=args.page_size * 40, start_key=start_key)
+      due.extend(item for item in page if item['userId'].startswith(f'bench-{run_id}-'))
+      if not start_key:
+        break
+  timed('query_due', 1, query_due)
+
+  def mark_sent():
+    for item in due:
+      store.update(item['userId'], item['reminderId'], {'status': 'sent'}, expected={'status': 'pending'})
+  timed('update', max(len(due), 1), mark_sent)
+
+  keys = [{'userId': item['userId'], 'reminderId': item['reminderId']} for item in items]
+  timed('batch_delete', total, lambda: store.batch_write(delete_keys=keys))
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,58 @@
+# Micro-benchmark del motor de plantillas: coste de render por recordatorio
+# y canal para lotes grandes. El LRU se vacía antes de cada canal, así que la
+# compilación queda incluida (una por locale). Como referencia se mide el
+# f-string que se usaba antes en send_scheduled:
+#
+#   python -m benchmarks.bench_templates
+#   python -m benchmarks.bench_templates --batch-sizes 10000 100000 --locales es en
+import argparse
+import time
+from helpers.templates import compile_template, render
+
+
+def timed(label, operations, fn):
+  start = time.perf_counter()
+  fn()
+  elapsed = time.perf_counter() - start
+  print(f"{label:<24} {operations:>8} ops  {elapsed:8.3f}s  {elapsed / operations * 1e6:10.2f} us/op")
+
+
+def main():
+  parser = argparse.ArgumentParser(description='Template render benchmark')
+  parser.add_argument('--batch-sizes', type=int, nargs='+', default=[10000, 50000, 100000])
+  parser.add_argument('--locales', nargs='+', default=['es', 'en'])
+  parser.add_argument('--title-length', type=int, default=40)
+  args = parser.parse_args()
+
+  for batch_size in args.batch_sizes:
+    reminders = [
+      {
+        'userId': f'user-{i % 1000}',
+        'reminderId': f'{i:08d}',
+        'title': f'Reminder {i} ' + 'x' * args.title_length,
+        'description': 'Benchmark reminder',
+        'metadata': {'place': 'Centro'},
+        'locale': args.locales[i % len(args.locales)]
+      }
+      for i in range(batch_size)
+    ]
+    print(f"batch_size={batch_size} locales={','.join(args.locales)}")
+
+    def render_fstring():
+      for reminder in reminders:
+        f"Recordatorio: {reminder['title']}"
+    timed('f-string (reference)', batch_size, render_fstring)
+
+    for channel in ['email', 'sms', 'push']:
+      compile_template.cache_clear()
+      def render_all():
+        for reminder in reminders:
+          render(reminder, channel, reminder['locale'])
+      timed(f'render {channel}', batch_size, render_all)
+
+    info = compile_template.cache_info()
+    print(f"template cache: hits={info.hits} misses={info.misses}")
+
+
+if __name__ == '__main__':
+  main()
@@ -1,4 +1,7 @@
 const AWS = require('aws-sdk')
+const { searchIndexRequests, writeSearchIndex } = require('../helpers/searchIndex')
+const { adjustSummary } = require('../helpers/summary')
+const { tombstone, writeTombstones } = require('../helpers/sync')
 const db = new AWS.DynamoDB.DocumentClient()
 
 const cleanupOldReminders = async (event) => {
@@ -11,13 +14,15 @@ const cleanupOldReminders = async (event) => {
       TableName: process.env.DB_TABLE,
       FilterExpression: '#status = :sent AND triggerAt <= :oldDate',
       ExpressionAttributeNames: {
-        '#status': 'status'
+        '#status': 'status',
+        '#title': 'title'
       },
       ExpressionAttributeValues: {
         ':sent': 'sent',
         ':oldDate': thirtyDaysAgo
       },
-      ProjectionExpression: 'userId, reminderId'
+      // El texto hace falta para limpiar el índice de búsqueda
+      ProjectionExpression: 'userId, reminderId, #title, tile, description'
     };
     
     const itemsToDelete = [];
@@ -54,6 +59,23 @@ const cleanupOldReminders = async (event) => {
       }).promise();
     }
     
+    // 3. Quitar sus términos del índice de búsqueda
+    await writeSearchIndex(db, itemsToDelete.flatMap(item => searchIndexRequests(item, null)))
+    
+    // 4. Descontar los enviados eliminados del resumen de cada usuario
+    if (process.env.SUMMARY_TABLE) {
+      const deletedByUser = {}
+      for (const item of itemsToDelete) {
+        deletedByUser[item.userId] = (deletedByUser[item.userId] || 0) + 1
+      }
+      for (const [userId, count] of Object.entries(deletedByUser)) {
+        await adjustSummary(db, userId, { sent: -count })
+      }
+    }
+    
+    // 5. Tombstones para que los clientes eliminen su copia al sincronizar
+    await writeTombstones(db, itemsToDelete.map(item => tombstone(item.userId, item.reminderId)))
+    
     return {
       statusCode: 200,
       body: `Recordatorios eliminados: ${itemsToDelete.length}`
@@ -1,6 +1,10 @@
 const AWS = require('aws-sdk')
 const { v4: uuidv4 } = require('uuid')
 const sendNotification = require('../helpers/notification')
+const { searchIndexRequests, writeSearchIndex } = require('../helpers/searchIndex')
+const { recordTransition } = require('../helpers/summary')
+const { syncKey } = require('../helpers/sync')
+const { toEpochMillis } = require('../helpers/triggerAt')
 
 const createReminder = async (event) => {
   const db = new AWS.DynamoDB.DocumentClient()
@@ -25,14 +29,27 @@ const createReminder = async (event) => {
       }
     }
 
+    let triggerAt
+    try {
+      triggerAt = toEpochMillis(data.triggerAt)
+    } catch (err) {
+      return {
+        statusCode: 400,
+        body: JSON.stringify({ message: 'Invalid request data' }),
+      }
+    }
+
+    const reminderId = uuidv4()
+    const now = new Date().toISOString()
     const params = {
       userId: userId,
-      reminderId: uuidv4(),
+      reminderId,
       tile: data.tile,
       description: data.description || '',
-      triggerAt: data.triggerAt,
-      createdAt: new Date().toISOString(),
-      updatedAt: new Date().toISOString(),
+      triggerAt,
+      createdAt: now,
+      updatedAt: now,
+      syncKey: syncKey(now, reminderId),
       status: 'pending',
       notificationType: data.notificationType || 'email',
       metadata: data.metadata || {},
@@ -43,6 +60,9 @@ const createReminder = async (event) => {
       Item: params,
     }).promise()
 
+    await writeSearchIndex(db, searchIndexRequests(null, params))
+    await recordTransition(db, process.env.REMINDERS_TABLE, null, params)
+
     return {
       statusCode: 201,
       body: JSON.stringify(params),
@@ -1,4 +1,7 @@
-const AWS = requiere('aws-sdk')
+const AWS = require('aws-sdk')
+const { searchIndexRequests, writeSearchIndex } = require('../helpers/searchIndex')
+const { recordTransition } = require('../helpers/summary')
+const { tombstone, writeTombstones } = require('../helpers/sync')
 const db = new AWS.DynamoDB.DocumentClient()
 
 const deleteReminder = async (event) => {
@@ -6,7 +9,7 @@ const deleteReminder = async (event) => {
     const { userId } = event.requestContext.authorizer.claims
     const reminderId = event.pathParameters.id
     
-    await db.delete({
+    const { Attributes } = await db.delete({
       TableName: process.env.DB_TABLE,
       Key: {
         userId,
@@ -18,6 +21,13 @@ const deleteReminder = async (event) => {
       },
       ReturnValues: 'ALL_OLD'
     }).promise();
+
+    if (Attributes) {
+      await writeSearchIndex(db, searchIndexRequests(Attributes, null))
+      await recordTransition(db, process.env.DB_TABLE, Attributes, null)
+      // Los clientes se enteran del borrado en la siguiente sincronización
+      await writeTombstones(db, [tombstone(userId, reminderId)])
+    }
     
     return {
       statusCode: 204,
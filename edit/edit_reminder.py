@@ -1,18 +1,13 @@
-import os
 import json
-import boto3
-from boto3.dynamodb.conditions import Key
+from helpers.search_index import reindex
+from helpers.serialization import DecimalEncoder
+from helpers.summary import record_transition
+from helpers.sync import touched
+from helpers.trigger_at import to_epoch_ms
+from store.reminder_store import get_reminder_store, get_search_index, get_summary_store
 
 def edit_reminder (event, context):
-  dynamodb = boto3.resource('dynamodb')
-  IF_OFLINE = os.environ.get('IF_OFFLINE', 'false').lower() == 'true'
-  if IF_OFLINE:
-    boto3.Session(
-      aws_access_key_id='fakeMyKeyId',
-      aws_secret_access_key='fakeSecretAccessKey',
-    )
-    dynamodb = boto3.resource('dynamodb', endpoint_url='http://localhost:8000')
-  table = dynamodb.Table(os.environ['REMINDERS_TABLE'])
+  store = get_reminder_store()
 
   try:
 
@@ -22,27 +17,26 @@ def edit_reminder (event, context):
     
     body = json.loads(event['body'])
 
-    update_expression = {}
-    expression_value = {}
-    expression_name = {}
+    changes = {}
 
     if 'title' in body:
-      update_expression['#title'] = body['title']
-      expression_value[':title'] = body['title']
-      expression_name['#title'] = 'title'
-
+      changes['title'] = body['title']
 
     if 'description' in body:
-      update_expression['#description'] = body['description']
-      expression_value[':description'] = body['description']
-      expression_name['#description'] = 'description'
+      changes['description'] = body['description']
 
     if 'triggerAt' in body:
-      update_expression['#triggerAt'] = body['triggerAt']
-      expression_value[':triggerAt'] = body['triggerAt']
-      expression_name['#triggerAt'] = 'triggerAt'
+      try:
+        changes['triggerAt'] = to_epoch_ms(body['triggerAt'])
+      except ValueError:
+        return {
+          'statusCode': 400,
+          'body': json.dumps({
+            'error': 'Invalid triggerAt'
+          })
+        }
 
-    if not update_expression:
+    if not changes:
       return {
         'statusCode': 400,
         'body': json.dumps({
@@ -51,21 +45,19 @@ def edit_reminder (event, context):
       }
     
 
-    response = table.update_item(
-      Key={
-        'userId': user_id,
-        'reminderId': reminder_id
-      },
-      UpdateExpression='SET ' + ', '.join([f'{k} = {v}' for k, v in update_expression.items()]),
-      ExpressionAttributeValues=expression_value,
-      ExpressionAttributeNames=expression_name,
-      ConditionExpression=Attr('userId').eq(user_id),
-      ReturnValues='ALL_NEW'
-    )
+    # update devuelve también el item anterior: hace falta para quitar del
+    # índice los tokens que ya no están y para saber si era el próximo
+    # vencimiento del resumen
+    old_item, item = store.update(user_id, reminder_id, touched(changes, reminder_id), expected={'userId': user_id})
+
+    if 'title' in changes or 'description' in changes:
+      reindex(get_search_index(), old_item, item)
+    if 'triggerAt' in changes:
+      record_transition(get_summary_store(), old_item, item)
 
     return {
       'statusCode': 200,
-      'body': json.dumps(response['Attributes'])
+      'body': json.dumps(item, cls=DecimalEncoder)
     }
 
   except Exception as err:
@@ -75,4 +67,4 @@ def edit_reminder (event, context):
       'body': json.dumps({
         'error': 'Could not edit reminder'
       })
-    }
\ No newline at end of file
+    }
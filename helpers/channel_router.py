@@ -0,0 +1,199 @@
+import os
+import json
+from concurrent.futures import ThreadPoolExecutor
+from helpers.templates import render
+
+# Cada canal tiene su propio pool y tamaño de lote, así un canal lento no
+# marca el ritmo de los demás. Se pueden ajustar con <CANAL>_BATCH_SIZE y
+# <CANAL>_CONCURRENCY
+CHANNELS = {
+  'email': {'batch_size': 50, 'concurrency': 4},
+  'sms': {'batch_size': 10, 'concurrency': 4},
+  'push': {'batch_size': 1, 'concurrency': 16}
+}
+# Cola de respaldo: sin dirección del usuario, el canal se publica en
+# NOTIFICATION_TOPIC y lo entregan sus suscripciones, como antes del enrutado
+TOPIC_QUEUE = 'topic'
+QUEUES = {**CHANNELS, TOPIC_QUEUE: {'batch_size': 10, 'concurrency': 4}}
+# Límites de AWS: SendBulkTemplatedEmail admite 50 destinos por llamada y
+# PublishBatch 10 mensajes; push se publica mensaje a mensaje
+MAX_BATCH_SIZE = {'email': 50, 'sms': 10, 'push': 1, TOPIC_QUEUE: 10}
+
+
+def channel_config(queue):
+  defaults = QUEUES[queue]
+  prefix = queue.upper()
+  batch_size = int(os.environ.get(f'{prefix}_BATCH_SIZE', defaults['batch_size']))
+  concurrency = int(os.environ.get(f'{prefix}_CONCURRENCY', defaults['concurrency']))
+  return min(max(batch_size, 1), MAX_BATCH_SIZE[queue]), max(concurrency, 1)
+
+
+def reminder_key(reminder):
+  return (reminder['userId'], reminder['reminderId'])
+
+
+def reminder_channels(reminder):
+  # createReminder guarda notificationType; los recordatorios antiguos,
+  # notificationTypes
+  channels = reminder.get('notificationTypes') or [reminder.get('notificationType') or 'email']
+  return list(dict.fromkeys(channels))
+
+
+def remaining_channels(reminder, delivered=()):
+  # Canales que aún faltan: los ya aceptados en ejecuciones anteriores se
+  # guardan en deliveredChannels y no se vuelven a enviar
+  done = set(reminder.get('deliveredChannels') or []) | set(delivered)
+  return [channel for channel in reminder_channels(reminder) if channel not in done]
+
+
+def reminder_locale(reminder, contacts):
+  return reminder.get('locale') or contacts.get(reminder['userId'], {}).get('locale')
+
+
+# Cada sender recibe una lista de (recordatorio, canal) y devuelve los
+# (clave, canal) entregados
+
+
+def send_email_batch(clients, batch, contacts):
+  # Un único envío masivo. La plantilla de SES EMAIL_TEMPLATE solo contiene
+  # {{subject}} y {{body}}: el texto se renderiza aquí por locale
+  response = clients['ses'].send_bulk_templated_email(
+    Source=os.environ['EMAIL_SENDER'],
+    Template=os.environ.get('EMAIL_TEMPLATE', 'reminder'),
+    DefaultTemplateData=json.dumps({'subject': '', 'body': ''}),
+    Destinations=[
+      {
+        'Destination': {'ToAddresses': [contacts[reminder['userId']]['email']]},
+        'ReplacementTemplateData': json.dumps(render(reminder, 'email', reminder_locale(reminder, contacts)))
+      }
+      for reminder, _ in batch
+    ]
+  )
+  delivered = []
+  for (reminder, channel), status in zip(batch, response['Status']):
+    if status['Status'] == 'Success':
+      delivered.append((reminder_key(reminder), channel))
+    else:
+      print(f"Error sending email for reminder {reminder['reminderId']}: {status.get('Error')}")
+  return delivered
+
+
+def _publish_batch(clients, topic_arn, batch, contacts):
+  # Los suscriptores del topic filtran por userId y notificationTypes
+  entries = []
+  for i, (reminder, channel) in enumerate(batch):
+    message = render(reminder, channel, reminder_locale(reminder, contacts))
+    entry = {
+      'Id': str(i),
+      'Message': message['body'],
+      'MessageAttributes': {
+        'userId': {
+          'DataType': 'String',
+          'StringValue': reminder['userId']
+        },
+        'notificationTypes': {
+          'DataType': 'String.Array',
+          'StringValue': json.dumps([channel])
+        }
+      }
+    }
+    if 'subject' in message:
+      entry['Subject'] = message['subject']
+    entries.append(entry)
+
+  response = clients['sns'].publish_batch(TopicArn=topic_arn, PublishBatchRequestEntries=entries)
+  for failed in response.get('Failed', []):
+    reminder, channel = batch[int(failed['Id'])]
+    print(f"Error sending {channel} for reminder {reminder['reminderId']}: {failed.get('Message')}")
+  return [
+    (reminder_key(batch[int(entry['Id'])][0]), batch[int(entry['Id'])][1])
+    for entry in response.get('Successful', [])
+  ]
+
+
+def send_sms_batch(clients, batch, contacts):
+  return _publish_batch(clients, os.environ.get('SMS_TOPIC') or os.environ['NOTIFICATION_TOPIC'], batch, contacts)
+
+
+def send_topic_batch(clients, batch, contacts):
+  return _publish_batch(clients, os.environ['NOTIFICATION_TOPIC'], batch, contacts)
+
+
+def send_push_batch(clients, batch, contacts):
+  delivered = []
+  for reminder, channel in batch:
+    message = render(reminder, 'push', reminder_locale(reminder, contacts))['body']
+    clients['sns'].publish(
+      TargetArn=contacts[reminder['userId']]['pushEndpointArn'],
+      Message=json.dumps({'default': message}),
+      MessageStructure='json'
+    )
+    delivered.append((reminder_key(reminder), channel))
+  return delivered
+
+
+SENDERS = {
+  'email': send_email_batch,
+  'sms': send_sms_batch,
+  'push': send_push_batch,
+  TOPIC_QUEUE: send_topic_batch
+}
+# Canales que necesitan una dirección del usuario en USERS_TABLE
+CONTACT_FIELDS = {
+  'email': 'email',
+  'push': 'pushEndpointArn'
+}
+
+
+def route(reminders, contacts):
+  # Reparte los canales que faltan de cada recordatorio en una cola por
+  # canal y devuelve también el motivo de los que no se pueden entregar
+  queues = {queue: [] for queue in QUEUES}
+  failed = {}
+  for reminder in reminders:
+    key = reminder_key(reminder)
+    for channel in remaining_channels(reminder):
+      if channel not in CHANNELS:
+        failed[key] = f'Unsupported channel {channel}'
+        continue
+      field = CONTACT_FIELDS.get(channel)
+      if field and not contacts.get(reminder['userId'], {}).get(field):
+        print(f"No {field} for user {reminder['userId']}, publishing {channel} to the topic")
+        queues[TOPIC_QUEUE].append((reminder, channel))
+        continue
+      queues[channel].append((reminder, channel))
+  return queues, failed
+
+
+def dispatch(reminders, contacts, clients):
+  # Devuelve, por recordatorio, los canales aceptados en esta ejecución, los
+  # que no se pueden entregar con su motivo y los errores de los lotes que
+  # fallaron
+  queues, failed = route(reminders, contacts)
+
+  pools = []
+  futures = []
+  try:
+    for queue_name, queue in queues.items():
+      if not queue:
+        continue
+      batch_size, concurrency = channel_config(queue_name)
+      pool = ThreadPoolExecutor(max_workers=concurrency)
+      pools.append(pool)
+      for i in range(0, len(queue), batch_size):
+        futures.append((queue_name, pool.submit(SENDERS[queue_name], clients, queue[i:i + batch_size], contacts)))
+
+    delivered = {}
+    errors = []
+    for queue_name, future in futures:
+      try:
+        for key, channel in future.result():
+          delivered.setdefault(key, set()).add(channel)
+      except Exception as err:
+        print(f"Error sending {queue_name} batch: {err}")
+        errors.append(err)
+  finally:
+    for pool in pools:
+      pool.shutdown()
+
+  return delivered, failed, errors
@@ -0,0 +1,30 @@
+import os
+from store.dynamodb_store import get_resource
+
+# BatchGetItem admite como máximo 100 claves por llamada
+BATCH_SIZE = 100
+
+
+def load_contacts(user_ids):
+  # Datos de contacto (email, pushEndpointArn, locale) de USERS_TABLE por userId
+  table_name = os.environ.get('USERS_TABLE')
+  user_ids = sorted(set(user_ids))
+  if not table_name or not user_ids:
+    return {}
+
+  dynamodb = get_resource()
+  contacts = {}
+  for i in range(0, len(user_ids), BATCH_SIZE):
+    request = {
+      table_name: {
+        'Keys': [{'userId': user_id} for user_id in user_ids[i:i + BATCH_SIZE]],
+        'ProjectionExpression': 'userId, email, pushEndpointArn, #locale',
+        'ExpressionAttributeNames': {'#locale': 'locale'}
+      }
+    }
+    while request:
+      response = dynamodb.batch_get_item(RequestItems=request)
+      for item in response['Responses'].get(table_name, []):
+        contacts[item['userId']] = item
+      request = response.get('UnprocessedKeys')
+  return contacts
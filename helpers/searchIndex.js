@@ -0,0 +1,82 @@
+// Debe coincidir con helpers/search_index.py, que mantiene el índice al
+// editar y resuelve las búsquedas
+const MIN_TOKEN_LENGTH = 2
+const MAX_TOKEN_LENGTH = 32
+const TITLE_WEIGHT = 3
+const DESCRIPTION_WEIGHT = 1
+const BATCH_SIZE = 25
+
+const tokenize = (text) => {
+  if (!text) {
+    return []
+  }
+  // Minúsculas y sin acentos: "Reunión" y "reunion" son el mismo token
+  const normalized = String(text).toLowerCase().normalize('NFKD').replace(/\p{M}/gu, '')
+  return (normalized.match(/[\p{L}\p{N}]+/gu) || [])
+    .filter(token => token.length >= MIN_TOKEN_LENGTH)
+    .map(token => token.slice(0, MAX_TOKEN_LENGTH))
+}
+
+const searchTerms = (item) => {
+  const terms = {}
+  if (!item) {
+    return terms
+  }
+  for (const token of tokenize(item.title !== undefined ? item.title : item.tile)) {
+    terms[token] = (terms[token] || 0) + TITLE_WEIGHT
+  }
+  for (const token of tokenize(item.description)) {
+    terms[token] = (terms[token] || 0) + DESCRIPTION_WEIGHT
+  }
+  return terms
+}
+
+// Peticiones de batchWrite para pasar del item anterior al nuevo
+const searchIndexRequests = (oldItem, newItem) => {
+  const { userId, reminderId } = newItem || oldItem
+  const oldTerms = searchTerms(oldItem)
+  const newTerms = searchTerms(newItem)
+  const requests = []
+
+  for (const token of Object.keys(oldTerms)) {
+    if (!(token in newTerms)) {
+      requests.push({
+        DeleteRequest: {
+          Key: { userId, termKey: `${token}#${reminderId}` }
+        }
+      })
+    }
+  }
+  for (const [token, weight] of Object.entries(newTerms)) {
+    if (oldTerms[token] !== weight) {
+      requests.push({
+        PutRequest: {
+          Item: { userId, termKey: `${token}#${reminderId}`, token, reminderId, weight }
+        }
+      })
+    }
+  }
+  return requests
+}
+
+const writeSearchIndex = async (db, requests) => {
+  const table = process.env.SEARCH_INDEX_TABLE
+  if (!table) {
+    return
+  }
+  // Máximo 25 items por batch
+  for (let i = 0; i < requests.length; i += BATCH_SIZE) {
+    await db.batchWrite({
+      RequestItems: {
+        [table]: requests.slice(i, i + BATCH_SIZE)
+      }
+    }).promise()
+  }
+}
+
+module.exports = {
+  tokenize,
+  searchTerms,
+  searchIndexRequests,
+  writeSearchIndex,
+}
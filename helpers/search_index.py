@@ -0,0 +1,87 @@
+import re
+import unicodedata
+
+# Debe coincidir con helpers/searchIndex.js, que mantiene el índice al crear
+# y borrar recordatorios
+MIN_TOKEN_LENGTH = 2
+MAX_TOKEN_LENGTH = 32
+MAX_QUERY_TOKENS = 8
+TITLE_WEIGHT = 3
+DESCRIPTION_WEIGHT = 1
+# Un token igual al término buscado puntúa el doble que uno que solo
+# empieza por él
+EXACT_MATCH_FACTOR = 2
+
+TOKEN_PATTERN = re.compile(r'[^\W_]+')
+
+
+def tokenize(text):
+  if not text:
+    return []
+  # Minúsculas y sin acentos: "Reunión" y "reunion" son el mismo token
+  normalized = unicodedata.normalize('NFKD', str(text).lower())
+  normalized = ''.join(c for c in normalized if not unicodedata.combining(c))
+  return [
+    token[:MAX_TOKEN_LENGTH]
+    for token in TOKEN_PATTERN.findall(normalized)
+    if len(token) >= MIN_TOKEN_LENGTH
+  ]
+
+
+def search_terms(item):
+  # createReminder guarda el título en "tile"
+  if not item:
+    return {}
+  terms = {}
+  for token in tokenize(item.get('title', item.get('tile'))):
+    terms[token] = terms.get(token, 0) + TITLE_WEIGHT
+  for token in tokenize(item.get('description')):
+    terms[token] = terms.get(token, 0) + DESCRIPTION_WEIGHT
+  return terms
+
+
+def reindex(index, old_item, new_item):
+  # Solo escribe la diferencia entre los términos anteriores y los nuevos
+  item = new_item or old_item
+  old_terms = search_terms(old_item)
+  new_terms = search_terms(new_item)
+
+  removed = [token for token in old_terms if token not in new_terms]
+  changed = {
+    token: weight
+    for token, weight in new_terms.items()
+    if old_terms.get(token) != weight
+  }
+  index.delete_search_terms(item['userId'], item['reminderId'], removed)
+  index.put_search_terms(item['userId'], item['reminderId'], changed)
+
+
+def search(index, user_id, query, limit=10, offset=0):
+  # Cada término se busca por prefijo; un recordatorio debe coincidir con
+  # todos. Devuelve ([(reminder_id, score)], next_offset)
+  query_tokens = list(dict.fromkeys(tokenize(query)))[:MAX_QUERY_TOKENS]
+  if not query_tokens:
+    return [], None
+
+  scores = None
+  for query_token in query_tokens:
+    token_scores = {}
+    for token, reminder_id, weight in index.query_search_terms(user_id, query_token):
+      score = weight * (EXACT_MATCH_FACTOR if token == query_token else 1)
+      token_scores[reminder_id] = max(token_scores.get(reminder_id, 0), score)
+
+    if scores is None:
+      scores = token_scores
+    else:
+      scores = {
+        reminder_id: score + token_scores[reminder_id]
+        for reminder_id, score in scores.items()
+        if reminder_id in token_scores
+      }
+    if not scores:
+      return [], None
+
+  ranked = sorted(scores.items(), key=lambda hit: (-hit[1], hit[0]))
+  page = ranked[offset:offset + limit]
+  next_offset = offset + limit if offset + limit < len(ranked) else None
+  return page, next_offset
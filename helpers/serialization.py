@@ -0,0 +1,10 @@
+import json
+from decimal import Decimal
+
+
+class DecimalEncoder(json.JSONEncoder):
+  # boto3 devuelve los numeros de DynamoDB como Decimal
+  def default(self, o):
+    if isinstance(o, Decimal):
+      return int(o) if o == o.to_integral_value() else float(o)
+    return super().default(o)
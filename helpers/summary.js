@@ -0,0 +1,147 @@
+// Debe coincidir con helpers/summary.py, que actualiza el resumen al editar
+// y enviar recordatorios. Resumen por usuario en SUMMARY_TABLE:
+// userId (HASH) con atributos <status>Count y nextDueAt
+const { toEpochMillis } = require('./triggerAt')
+
+const isConditionFailed = (err) => err && err.code === 'ConditionalCheckFailedException'
+
+const dueOf = (item) => {
+  if (!item || item.status !== 'pending') {
+    return null
+  }
+  try {
+    return toEpochMillis(item.triggerAt)
+  } catch (err) {
+    return null
+  }
+}
+
+const adjustSummary = async (db, userId, deltas, dueCandidate = null) => {
+  const table = process.env.SUMMARY_TABLE
+  const statuses = Object.keys(deltas)
+
+  if (statuses.length) {
+    // ADD es atómico y crea el atributo si no existe
+    await db.update({
+      TableName: table,
+      Key: { userId },
+      UpdateExpression: 'ADD ' + statuses.map((_, i) => `#c${i} :c${i}`).join(', '),
+      ExpressionAttributeNames: Object.fromEntries(statuses.map((status, i) => [`#c${i}`, `${status}Count`])),
+      ExpressionAttributeValues: Object.fromEntries(statuses.map((status, i) => [`:c${i}`, deltas[status]])),
+    }).promise()
+  }
+
+  if (dueCandidate !== null) {
+    try {
+      await db.update({
+        TableName: table,
+        Key: { userId },
+        UpdateExpression: 'SET nextDueAt = :due',
+        ConditionExpression: 'attribute_not_exists(nextDueAt) OR nextDueAt > :due',
+        ExpressionAttributeValues: { ':due': dueCandidate },
+      }).promise()
+    } catch (err) {
+      if (!isConditionFailed(err)) {
+        throw err
+      }
+    }
+  }
+}
+
+// UserTriggerIndex: userId (HASH) + triggerAt (RANGE), en orden ascendente
+const nextPendingTriggerAt = async (db, remindersTable, userId, after) => {
+  const params = {
+    TableName: remindersTable,
+    IndexName: 'UserTriggerIndex',
+    KeyConditionExpression: 'userId = :userId AND triggerAt >= :after',
+    FilterExpression: '#status = :pending',
+    ExpressionAttributeNames: { '#status': 'status' },
+    ExpressionAttributeValues: { ':userId': userId, ':after': after, ':pending': 'pending' },
+    ProjectionExpression: 'triggerAt',
+    ScanIndexForward: true,
+  }
+  let lastEvaluatedKey = null
+
+  do {
+    if (lastEvaluatedKey) {
+      params.ExclusiveStartKey = lastEvaluatedKey
+    }
+    const result = await db.query(params).promise()
+    if (result.Items.length) {
+      return result.Items[0].triggerAt
+    }
+    lastEvaluatedKey = result.LastEvaluatedKey
+  } while (lastEvaluatedKey)
+
+  return null
+}
+
+const replaceNextDue = async (db, userId, oldValue, newValue) => {
+  const params = {
+    TableName: process.env.SUMMARY_TABLE,
+    Key: { userId },
+    ConditionExpression: 'nextDueAt = :old',
+    ExpressionAttributeValues: { ':old': oldValue },
+  }
+  if (newValue === null) {
+    params.UpdateExpression = 'REMOVE nextDueAt'
+  } else {
+    params.UpdateExpression = 'SET nextDueAt = :new'
+    params.ExpressionAttributeValues[':new'] = newValue
+  }
+
+  try {
+    await db.update(params).promise()
+    return true
+  } catch (err) {
+    if (isConditionFailed(err)) {
+      return false
+    }
+    throw err
+  }
+}
+
+// Actualiza el resumen tras crear (oldItem = null) o borrar (newItem = null)
+// un recordatorio ya persistido
+const recordTransition = async (db, remindersTable, oldItem, newItem) => {
+  if (!process.env.SUMMARY_TABLE) {
+    return
+  }
+  const { userId } = newItem || oldItem
+  const oldStatus = oldItem ? oldItem.status : null
+  const newStatus = newItem ? newItem.status : null
+
+  const deltas = {}
+  if (oldStatus !== newStatus) {
+    if (oldStatus) {
+      deltas[oldStatus] = -1
+    }
+    if (newStatus) {
+      deltas[newStatus] = 1
+    }
+  }
+
+  const oldDue = dueOf(oldItem)
+  const newDue = dueOf(newItem)
+  const candidate = newDue !== null && newDue !== oldDue ? newDue : null
+  if (Object.keys(deltas).length || candidate !== null) {
+    await adjustSummary(db, userId, deltas, candidate)
+  }
+
+  // Si era el próximo vencimiento, se busca el siguiente; el condicional
+  // evita pisar un valor que otra escritura ya cambió
+  if (oldDue !== null && oldDue !== newDue) {
+    const { Item } = await db.get({ TableName: process.env.SUMMARY_TABLE, Key: { userId } }).promise()
+    if (Item && Item.nextDueAt === oldDue) {
+      const nextDue = await nextPendingTriggerAt(db, remindersTable, userId, oldDue)
+      await replaceNextDue(db, userId, oldDue, nextDue)
+    }
+  }
+}
+
+module.exports = {
+  adjustSummary,
+  nextPendingTriggerAt,
+  replaceNextDue,
+  recordTransition,
+}
@@ -0,0 +1,51 @@
+from helpers.trigger_at import to_epoch_ms
+
+# Debe coincidir con helpers/summary.js, que actualiza el resumen al crear
+# y borrar recordatorios
+
+
+def _due(item):
+  if not item or item.get('status') != 'pending':
+    return None
+  try:
+    return to_epoch_ms(item.get('triggerAt'))
+  except ValueError:
+    return None
+
+
+def record_transition(summaries, old_item, new_item):
+  # Actualiza el resumen del usuario tras crear (old_item=None), editar,
+  # enviar o borrar (new_item=None) un recordatorio ya persistido. Sin
+  # resumen configurado no hace nada, como helpers/summary.js
+  if summaries is None:
+    return
+
+  item = new_item or old_item
+  user_id = item['userId']
+  old_status = old_item.get('status') if old_item else None
+  new_status = new_item.get('status') if new_item else None
+
+  deltas = {}
+  if old_status != new_status:
+    if old_status:
+      deltas[old_status] = -1
+    if new_status:
+      deltas[new_status] = 1
+
+  old_due = _due(old_item)
+  new_due = _due(new_item)
+  candidate = new_due if new_due is not None and new_due != old_due else None
+  if deltas or candidate is not None:
+    summaries.adjust_summary(user_id, deltas, due_candidate=candidate)
+
+  # Si era el próximo vencimiento, se busca el siguiente; el condicional
+  # evita pisar un valor que otra escritura ya cambió
+  if old_due is not None and old_due != new_due:
+    summary = summaries.get_summary(user_id)
+    if summary and summary.get('nextDueAt') == old_due:
+      next_due = summaries.next_pending_trigger_at(user_id, after=old_due)
+      summaries.replace_next_due(user_id, old_due, next_due)
+
+
+def empty_summary(user_id):
+  return {'userId': user_id, 'counts': {}, 'nextDueAt': None}
@@ -0,0 +1,37 @@
+// Debe coincidir con helpers/sync.py. syncKey = "<updatedAt>#<reminderId>":
+// updatedAt es el ISO de toISOString, así que el orden lexicográfico es el
+// orden temporal y el reminderId desempata escrituras en el mismo milisegundo
+const TOMBSTONE_RETENTION_DAYS = 30
+const BATCH_SIZE = 25
+
+const syncKey = (updatedAt, reminderId) => `${updatedAt}#${reminderId}`
+
+const tombstone = (userId, reminderId, deletedAt = new Date().toISOString()) => ({
+  userId,
+  reminderId,
+  deletedAt,
+  syncKey: syncKey(deletedAt, reminderId),
+  // TTL de DynamoDB (epoch en segundos)
+  expiresAt: Math.floor(Date.now() / 1000) + TOMBSTONE_RETENTION_DAYS * 24 * 60 * 60,
+})
+
+const writeTombstones = async (db, tombstones) => {
+  const table = process.env.TOMBSTONES_TABLE
+  if (!table) {
+    return
+  }
+  // Máximo 25 items por batch
+  for (let i = 0; i < tombstones.length; i += BATCH_SIZE) {
+    await db.batchWrite({
+      RequestItems: {
+        [table]: tombstones.slice(i, i + BATCH_SIZE).map(item => ({ PutRequest: { Item: item } }))
+      }
+    }).promise()
+  }
+}
+
+module.exports = {
+  syncKey,
+  tombstone,
+  writeTombstones,
+}
@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta, timezone
+
+# Debe coincidir con helpers/sync.js. syncKey = "<updatedAt>#<reminderId>":
+# updatedAt es ISO 8601 UTC con milisegundos (mismo formato que
+# toISOString), así que el orden lexicográfico es el orden temporal y el
+# reminderId desempata escrituras en el mismo milisegundo
+TOMBSTONE_RETENTION_DAYS = 30
+# Margen para escrituras en vuelo: un updatedAt se calcula antes de que la
+# escritura sea visible, así que la marca no avanza más allá de ahora - margen
+CLOCK_SKEW_MS = 5000
+
+
+def _iso(moment):
+  return moment.isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+def now_iso():
+  return _iso(datetime.now(timezone.utc))
+
+
+def safe_watermark():
+  # Todo lo posterior a esta marca se vuelve a enviar; repetir es inocuo
+  return sync_key(_iso(datetime.now(timezone.utc) - timedelta(milliseconds=CLOCK_SKEW_MS)), '')
+
+
+def sync_key(updated_at, reminder_id):
+  return f'{updated_at}#{reminder_id}'
+
+
+def touched(changes, reminder_id):
+  # Añade updatedAt y syncKey a los cambios de una escritura
+  updated_at = now_iso()
+  return dict(changes, updatedAt=updated_at, syncKey=sync_key(updated_at, reminder_id))
+
+
+def tombstone(user_id, reminder_id, deleted_at=None):
+  deleted_at = deleted_at or now_iso()
+  expires_at = datetime.now(timezone.utc) + timedelta(days=TOMBSTONE_RETENTION_DAYS)
+  return {
+    'userId': user_id,
+    'reminderId': reminder_id,
+    'deletedAt': deleted_at,
+    'syncKey': sync_key(deleted_at, reminder_id),
+    # TTL de DynamoDB (epoch en segundos)
+    'expiresAt': int(expires_at.timestamp())
+  }
+
+
+def watermark_expired(watermark):
+  # Con una marca más antigua que la retención de tombstones se pueden haber
+  # perdido borrados: el cliente debe resincronizar desde cero
+  oldest = datetime.now(timezone.utc) - timedelta(days=TOMBSTONE_RETENTION_DAYS)
+  return watermark.split('#', 1)[0] < _iso(oldest)
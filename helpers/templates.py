@@ -0,0 +1,105 @@
+import os
+import re
+from decimal import Decimal
+from functools import lru_cache
+
+# Plantillas por (locale, canal). Cada parte admite {title}, {description}
+# y {metadata.<clave>}; se compilan una vez y se cachean en un LRU
+TEMPLATES = {
+  ('es', 'email'): {'subject': 'Recordatorio', 'body': '{title}\n{description}'},
+  ('es', 'sms'): {'body': 'Recordatorio: {title}'},
+  ('es', 'push'): {'body': 'Recordatorio: {title}'},
+  ('en', 'email'): {'subject': 'Reminder', 'body': '{title}\n{description}'},
+  ('en', 'sms'): {'body': 'Reminder: {title}'},
+  ('en', 'push'): {'body': 'Reminder: {title}'}
+}
+DEFAULT_LOCALE = os.environ.get('DEFAULT_LOCALE', 'es')
+TEMPLATE_CACHE_SIZE = int(os.environ.get('TEMPLATE_CACHE_SIZE', 64))
+
+# Sustitución acotada: cada valor se recorta antes de insertarlo y nunca se
+# vuelve a interpretar como plantilla
+MAX_VALUE_LENGTH = 256
+# Límites por canal y parte, en caracteres. SMS se calcula por segmentos
+SIZE_LIMITS = {
+  ('email', 'subject'): 150,
+  ('email', 'body'): 10000,
+  ('push', 'body'): 200
+}
+SMS_MAX_SEGMENTS = int(os.environ.get('SMS_MAX_SEGMENTS', 1))
+
+FIELD = re.compile(r'\{(title|description|metadata\.[A-Za-z0-9_]+)\}')
+UNKNOWN_FIELD = re.compile(r'\{[^}]*\}')
+
+# Alfabeto GSM 03.38 básico: con cualquier otro carácter (incluidos los de la
+# tabla extendida, que ocupan dos) el SMS se mide como UCS-2
+GSM7 = frozenset(
+  '@£$¥èéùìòÇ\nØø\rÅåΔ_ΦΓΛΩΠΨΣΘΞÆæßÉ !"#¤%&\'()*+,-./0123456789:;<=>?'
+  '¡ABCDEFGHIJKLMNOPQRSTUVWXYZÄÖÑÜ§¿abcdefghijklmnopqrstuvwxyzäöñüà'
+)
+
+
+def _compile_part(source):
+  # Lista de literales y rutas de campo, p. ej. ['Recordatorio: ', ('title',)]
+  pieces = []
+  position = 0
+  for match in FIELD.finditer(source):
+    pieces.append(source[position:match.start()])
+    pieces.append(tuple(match.group(1).split('.')))
+    position = match.end()
+  pieces.append(source[position:])
+  literals = ''.join(piece for piece in pieces if isinstance(piece, str))
+  if UNKNOWN_FIELD.search(literals):
+    raise ValueError(f'Unsupported placeholder in template: {source!r}')
+  return tuple(piece for piece in pieces if piece != '')
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_template(locale, channel):
+  # 'es-MX' usa 'es'; un locale desconocido usa DEFAULT_LOCALE
+  for candidate in (locale, locale.split('-')[0], DEFAULT_LOCALE):
+    source = TEMPLATES.get((candidate, channel))
+    if source:
+      return tuple((part, _compile_part(text)) for part, text in source.items())
+  raise ValueError(f'No template for channel {channel}')
+
+
+def _value(reminder, path):
+  if path[0] == 'metadata':
+    value = (reminder.get('metadata') or {}).get(path[1])
+  else:
+    value = reminder.get(path[0]) or (reminder.get('tile') if path[0] == 'title' else None)
+  # Solo valores escalares; dicts o listas de metadata no se expanden
+  if value is None or not isinstance(value, (str, int, float, Decimal)):
+    return ''
+  return str(value)[:MAX_VALUE_LENGTH]
+
+
+def sms_limit(text, segments=SMS_MAX_SEGMENTS):
+  # 160 caracteres GSM-7 o 70 UCS-2 en un segmento; concatenados, 153 y 67
+  gsm7 = all(char in GSM7 for char in text)
+  if segments <= 1:
+    return 160 if gsm7 else 70
+  return (153 if gsm7 else 67) * segments
+
+
+def truncate(text, limit):
+  if len(text) <= limit:
+    return text
+  return text[:limit - 3].rstrip() + '...'
+
+
+def render(reminder, channel, locale=None):
+  # Devuelve las partes del mensaje ({'subject', 'body'} en email, {'body'}
+  # en sms y push) dentro de los límites del canal
+  rendered = {}
+  for part, pieces in compile_template(locale or DEFAULT_LOCALE, channel):
+    text = ''.join(
+      piece if isinstance(piece, str) else _value(reminder, piece)
+      for piece in pieces
+    )
+    if channel == 'sms':
+      limit = sms_limit(text)
+    else:
+      limit = SIZE_LIMITS.get((channel, part))
+    rendered[part] = truncate(text, limit) if limit else text
+  return rendered
@@ -0,0 +1,78 @@
+// Gramática compartida con helpers/trigger_at.py: epoch en milisegundos o
+// ISO 8601 (fecha, o fecha y hora con segundos, fracción y zona opcionales)
+const EPOCH_MS = /^-?[0-9]+$/
+const ISO_8601 = /^([0-9]{4})-([0-9]{2})-([0-9]{2})(?:[Tt ]([0-9]{2}):([0-9]{2})(?::([0-9]{2})(?:\.([0-9]{1,9}))?)?([Zz]|[+-][0-9]{2}:?[0-9]{2})?)?$/
+
+const invalid = (value) => new Error(`Invalid triggerAt: ${value}`)
+
+const parseIso = (raw) => {
+  const match = ISO_8601.exec(raw)
+  if (!match) {
+    throw invalid(raw)
+  }
+  const [, year, month, day, hour = '0', minute = '0', second = '0', fraction = '', zone] = match
+  const parts = [year, month, day, hour, minute, second].map(part => parseInt(part, 10))
+  // La fracción se trunca a milisegundos
+  const millis = parseInt(fraction.padEnd(3, '0').slice(0, 3), 10)
+
+  // Date.UTC desborda en silencio (mes 13, 31 de febrero...): se comprueba
+  // que la fecha resultante conserve los mismos campos
+  // (setUTCFullYear, a diferencia de Date.UTC, no convierte 0-99 en 19xx)
+  const date = new Date(0)
+  date.setUTCFullYear(parts[0], parts[1] - 1, parts[2])
+  date.setUTCHours(parts[3], parts[4], parts[5], millis)
+  const time = date.getTime()
+  const roundTrip = [
+    date.getUTCFullYear(), date.getUTCMonth() + 1, date.getUTCDate(),
+    date.getUTCHours(), date.getUTCMinutes(), date.getUTCSeconds()
+  ]
+  if (parts[0] < 1 || roundTrip.some((part, i) => part !== parts[i])) {
+    throw invalid(raw)
+  }
+
+  // Las fechas sin zona horaria se interpretan como UTC
+  let offset = 0
+  if (zone && zone !== 'Z' && zone !== 'z') {
+    const digits = zone.slice(1).replace(':', '')
+    const hours = parseInt(digits.slice(0, 2), 10)
+    const minutes = parseInt(digits.slice(2), 10)
+    if (hours > 23 || minutes > 59) {
+      throw invalid(raw)
+    }
+    offset = (hours * 60 + minutes) * (zone[0] === '+' ? 1 : -1)
+  }
+  return time - offset * 60000
+}
+
+// triggerAt se guarda siempre como epoch UTC en milisegundos (numero) para
+// que TriggerTimeIndex pueda ordenarlo y filtrarlo por rango
+const toEpochMillis = (value) => {
+  if (typeof value === 'number') {
+    if (!Number.isFinite(value)) {
+      throw invalid(value)
+    }
+    return Math.round(value)
+  }
+
+  if (value instanceof Date) {
+    const time = value.getTime()
+    if (Number.isNaN(time)) {
+      throw invalid(value)
+    }
+    return time
+  }
+
+  if (typeof value === 'string') {
+    const raw = value.trim()
+    if (EPOCH_MS.test(raw)) {
+      return parseInt(raw, 10)
+    }
+    return parseIso(raw)
+  }
+
+  throw invalid(value)
+}
+
+module.exports = {
+  toEpochMillis,
+}
@@ -0,0 +1,66 @@
+import math
+import re
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+# Gramática compartida con helpers/triggerAt.js: epoch en milisegundos o
+# ISO 8601 (fecha, o fecha y hora con segundos, fracción y zona opcionales)
+EPOCH_MS = re.compile(r'-?[0-9]+')
+ISO_8601 = re.compile(
+  r'([0-9]{4})-([0-9]{2})-([0-9]{2})'
+  r'(?:[Tt ]([0-9]{2}):([0-9]{2})(?::([0-9]{2})(?:\.([0-9]{1,9}))?)?'
+  r'([Zz]|[+-][0-9]{2}:?[0-9]{2})?)?'
+)
+
+
+def _parse_iso(raw):
+  match = ISO_8601.fullmatch(raw)
+  if not match:
+    raise ValueError(f"Invalid triggerAt: {raw!r}")
+  year, month, day, hour, minute, second, fraction, zone = match.groups()
+
+  # La fracción se trunca a milisegundos, como en JS
+  millis = int((fraction or '').ljust(3, '0')[:3])
+  # datetime valida los rangos (mes 13, 31 de febrero, 24:00...)
+  parsed = datetime(
+    int(year), int(month), int(day),
+    int(hour or 0), int(minute or 0), int(second or 0),
+    millis * 1000, tzinfo=timezone.utc
+  )
+
+  # Las fechas sin zona horaria se interpretan como UTC
+  offset = 0
+  if zone and zone not in ('Z', 'z'):
+    digits = zone[1:].replace(':', '')
+    hours, minutes = int(digits[:2]), int(digits[2:])
+    if hours > 23 or minutes > 59:
+      raise ValueError(f"Invalid triggerAt: {raw!r}")
+    offset = (hours * 60 + minutes) * (1 if zone[0] == '+' else -1)
+  epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+  return (parsed - timedelta(minutes=offset) - epoch) // timedelta(milliseconds=1)
+
+
+def to_epoch_ms(value):
+  # triggerAt se guarda siempre como epoch UTC en milisegundos (numero) para
+  # que TriggerTimeIndex pueda ordenarlo y filtrarlo por rango
+  if isinstance(value, bool) or value is None:
+    raise ValueError(f"Invalid triggerAt: {value!r}")
+
+  if isinstance(value, int):
+    return value
+
+  if isinstance(value, (float, Decimal)):
+    finite = value.is_finite() if isinstance(value, Decimal) else math.isfinite(value)
+    if not finite:
+      raise ValueError(f"Invalid triggerAt: {value!r}")
+    # Mismo redondeo que Math.round en helpers/triggerAt.js (.5 hacia arriba)
+    half = Decimal('0.5') if isinstance(value, Decimal) else 0.5
+    return int(math.floor(value + half))
+
+  if isinstance(value, str):
+    raw = value.strip()
+    if EPOCH_MS.fullmatch(raw):
+      return int(raw)
+    return _parse_iso(raw)
+
+  raise ValueError(f"Invalid triggerAt: {value!r}")
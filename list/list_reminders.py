@@ -1,20 +1,9 @@
-import os
 import json
-import boto3
-from boto3.dynamodb.conditions import Key
+from helpers.serialization import DecimalEncoder
+from store.reminder_store import get_reminder_store
 
 def list_reminders(event, context):
-  dynamodb = boto3.resource('dynamodb')
-  IF_OFLINE = os.environ.get('IF_OFFLINE', 'false').lower() == 'true'
-  if IF_OFLINE:
-    boto3.Session(
-      aws_access_key_id='fakeMyKeyId',
-      aws_secret_access_key='fakeSecretAccessKey',
-    )
-
-    dynamodb = boto3.resource('dynamodb', endpoint_url='http://localhost:8000')
-
-  table = dynamodb.Table(os.environ['REMINDERS_TABLE'])
+  store = get_reminder_store()
 
   try: 
 
@@ -26,24 +15,16 @@ def list_reminders(event, context):
     limit = int(query_params.get('limit', 10))
     next_token = query_params.get('nextToken')
     
-    # Consulta a DynamoDB
-    query_args = {
-      'KeyConditionExpression': Key('userId').eq(user_id),
-      'Limit': limit,
-      'ScanIndexForward': False  # Orden descendente (más recientes primero)
-    }
-    
-    if next_token:
-        query_args['ExclusiveStartKey'] = json.loads(next_token)
-        
-    response = table.query(**query_args)
+    # Orden descendente (más recientes primero)
+    start_key = json.loads(next_token) if next_token else None
+    items, next_key = store.query_by_user(user_id, limit=limit, start_key=start_key)
     
     return {
       'statusCode': 200,
       'body': json.dumps({
-        'items': response['Items'],
-        'nextToken': response.get('LastEvaluatedKey')
-      })
+        'items': items,
+        'nextToken': json.dumps(next_key, cls=DecimalEncoder) if next_key else None
+      }, cls=DecimalEncoder)
     }
 
   except Exception as err:
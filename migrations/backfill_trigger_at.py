@@ -0,0 +1,122 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from boto3.dynamodb.conditions import Attr
+from botocore.exceptions import ClientError
+from helpers.trigger_at import to_epoch_ms
+from store.dynamodb_store import get_table
+
+DEFAULT_TOTAL_SEGMENTS = 4
+# Margen para devolver el estado antes de que Lambda corte la ejecución
+SAFETY_MARGIN_MS = 10000
+
+
+def _has_time_left(context):
+  if context is None or not hasattr(context, 'get_remaining_time_in_millis'):
+    return True
+  return context.get_remaining_time_in_millis() > SAFETY_MARGIN_MS
+
+
+def _backfill_segment(segment, total_segments, start_key, max_pages, context):
+  # Cada segmento corre en su propio hilo con su propio recurso
+  table = get_table()
+  stats = {'scanned': 0, 'updated': 0, 'skipped': 0, 'invalid': 0}
+  pages = 0
+
+  while _has_time_left(context) and (max_pages is None or pages < max_pages):
+    scan_args = {
+      'Segment': segment,
+      'TotalSegments': total_segments,
+      # Solo los items cuyo triggerAt no es numérico necesitan migrarse
+      'FilterExpression': Attr('triggerAt').attribute_type('S'),
+      'ProjectionExpression': 'userId, reminderId, triggerAt'
+    }
+    if start_key:
+      scan_args['ExclusiveStartKey'] = start_key
+
+    response = table.scan(**scan_args)
+    pages += 1
+    stats['scanned'] += response.get('ScannedCount', 0)
+
+    for item in response.get('Items', []):
+      try:
+        trigger_at = to_epoch_ms(item['triggerAt'])
+      except ValueError:
+        print(f"Invalid triggerAt for {item['userId']}/{item['reminderId']}: {item['triggerAt']}")
+        stats['invalid'] += 1
+        continue
+
+      try:
+        # Solo se sobreescribe si nadie editó el recordatorio mientras tanto
+        table.update_item(
+          Key={
+            'userId': item['userId'],
+            'reminderId': item['reminderId']
+          },
+          UpdateExpression='SET #triggerAt = :new',
+          ConditionExpression=Attr('triggerAt').eq(item['triggerAt']),
+          ExpressionAttributeNames={
+            '#triggerAt': 'triggerAt'
+          },
+          ExpressionAttributeValues={
+            ':new': trigger_at
+          }
+        )
+        stats['updated'] += 1
+      except ClientError as err:
+        if err.response['Error']['Code'] != 'ConditionalCheckFailedException':
+          raise
+        stats['skipped'] += 1
+
+    start_key = response.get('LastEvaluatedKey')
+    if not start_key:
+      return segment, 'done', stats
+
+  return segment, start_key, stats
+
+
+def backfill_trigger_at(event, context):
+  try:
+    # El estado devuelto por una invocación se pasa como evento de la siguiente
+    event = event or {}
+    total_segments = int(event.get('totalSegments', DEFAULT_TOTAL_SEGMENTS))
+    max_pages = event.get('maxPagesPerSegment')
+    max_pages = int(max_pages) if max_pages is not None else None
+    segments = event.get('segments') or {str(i): None for i in range(total_segments)}
+
+    pending = {
+      int(segment): start_key
+      for segment, start_key in segments.items()
+      if start_key != 'done'
+    }
+
+    totals = {'scanned': 0, 'updated': 0, 'skipped': 0, 'invalid': 0}
+    if pending:
+      with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+        futures = [
+          executor.submit(_backfill_segment, segment, total_segments, start_key, max_pages, context)
+          for segment, start_key in pending.items()
+        ]
+        for future in futures:
+          segment, start_key, stats = future.result()
+          segments[str(segment)] = start_key
+          for key, value in stats.items():
+            totals[key] += value
+
+    return {
+      'statusCode': 200,
+      'body': json.dumps({
+        'totalSegments': total_segments,
+        'segments': segments,
+        'done': all(start_key == 'done' for start_key in segments.values()),
+        **totals
+      })
+    }
+
+  except Exception as err:
+    print(f"Error backfilling triggerAt: {err}")
+    return {
+      'statusCode': 500,
+      'body': json.dumps({
+        'error': 'Could not backfill triggerAt'
+      })
+    }
@@ -0,0 +1,53 @@
+import json
+from helpers.search_index import search
+from helpers.serialization import DecimalEncoder
+from store.reminder_store import get_reminder_store, get_search_index
+
+def search_reminders(event, context):
+  store = get_reminder_store()
+  index = get_search_index()
+
+  try:
+
+    claims = event['requestContext']['authorizer']['claims']
+    user_id = claims['userId']
+
+    query_params = event.get('queryStringParameters') or {}
+    query = query_params.get('q', '')
+    limit = int(query_params.get('limit', 10))
+    next_token = query_params.get('nextToken')
+    offset = json.loads(next_token)['offset'] if next_token else 0
+
+    if not query.strip():
+      return {
+        'statusCode': 400,
+        'body': json.dumps({
+          'error': 'Missing search query'
+        })
+      }
+
+    hits, next_offset = search(index, user_id, query, limit=limit, offset=offset)
+
+    items = []
+    for reminder_id, score in hits:
+      item = store.get(user_id, reminder_id)
+      # El índice puede ir por detrás de un borrado reciente
+      if item:
+        items.append(dict(item, score=score))
+
+    return {
+      'statusCode': 200,
+      'body': json.dumps({
+        'items': items,
+        'nextToken': json.dumps({'offset': next_offset}) if next_offset is not None else None
+      }, cls=DecimalEncoder)
+    }
+
+  except Exception as err:
+    print(f"Error searching reminders: {err}")
+    return {
+      'statusCode': 500,
+      'body': json.dumps({
+        'error': 'Could not search reminders'
+      })
+    }
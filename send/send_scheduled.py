@@ -1,80 +1,73 @@
 import boto3
-import os
 import json
 from datetime import datetime, timezone
+from helpers.channel_router import CONTACT_FIELDS, dispatch, remaining_channels, reminder_key
+from helpers.contacts import load_contacts
+from helpers.summary import record_transition
+from helpers.sync import touched
+from store.reminder_store import ConditionFailedError, get_reminder_store, get_summary_store
 
 
 def send_scheduled_reminders (event, context):
-  dynamodb = boto3.resource('dynamodb')
-  IF_OFLINE = os.environ.get('IF_OFFLINE', 'false').lower() == 'true'
-  if IF_OFLINE:
-    boto3.Session(
-      aws_access_key_id='fakeMyKeyId',
-      aws_secret_access_key='fakeSecretAccessKey',
-    )
-    dynamodb = boto3.resource('dynamodb', endpoint_url='http://localhost:8000')
-  table = dynamodb.Table(os.environ['REMINDERS_TABLE'])
+  store = get_reminder_store()
+  summaries = get_summary_store()
   sns = boto3.client('sns')
+  ses = boto3.client('ses')
 
   try:
 
     # miliseconds
     now = int(datetime.now().timestamp() * 1000)
 
-    response = table.query(
-      IndexName='TriggerTimeIndex',
-      KeyConditionExpression='userId = :userId AND triggerAt <= :now',
-      FilterExpression='#status = :pending',
-      ExpressionAttributeNames={
-        '#status': 'status'
-      },
-      ExpressionAttributeValues={
-        ':userId': 'all',  # Escaneo global
-        ':now': now,
-        ':pending': 'pending'
-      },
-      ProjectionExpression='reminderId, userId, title, description, notificationTypes, metadata'
-    )
+    # Recorre todas las páginas de recordatorios pendientes vencidos
+    reminders = []
+    start_key = None
+    while True:
+      items, start_key = store.query_due(now, start_key=start_key)
+      reminders.extend(items)
+      if not start_key:
+        break
 
-    reminders = response.get('Items', [])
+    # Etapa de enrutado: cada canal envía en lotes con su propia concurrencia
+    contacts = load_contacts(
+      reminder['userId'] for reminder in reminders
+      if set(remaining_channels(reminder)) & set(CONTACT_FIELDS)
+    )
+    delivered, failed, errors = dispatch(reminders, contacts, {'ses': ses, 'sns': sns})
 
+    # Los canales aceptados se guardan en deliveredChannels para no repetirlos.
+    # Se marcan como enviados los que ya no tienen canales por entregar y
+    # como fallidos los que tienen un canal que no se puede entregar; el
+    # resto sigue pendiente y se reintenta en la siguiente ejecución
     for reminder in reminders:
-      message = {
-        'default': f"Recordatorio: {reminder['title']}",
-        'email': f"Subject: Recordatorio\n\n{reminder['title']}\n{reminder.get('description', '')}",
-        'sms': f"Recordatorio: {reminder['title']}"
-      }
+      key = reminder_key(reminder)
+      accepted = delivered.get(key, set())
+      changes = {}
+      if accepted:
+        changes['deliveredChannels'] = sorted(set(reminder.get('deliveredChannels') or []) | accepted)
+      if key in failed:
+        changes.update(status='failed', failureReason=failed[key])
+      elif not remaining_channels(reminder, accepted):
+        changes['status'] = 'sent'
+      if not changes:
+        continue
+
+      # Solo si sigue pendiente: si otra ejecución solapada ya lo marcó,
+      # también ajustó el resumen y no hay que contarlo dos veces
+      try:
+        old_item, new_item = store.update(
+          reminder['userId'],
+          reminder['reminderId'],
+          touched(changes, reminder['reminderId']),
+          expected={'status': 'pending'}
+        )
+      except ConditionFailedError:
+        print(f"Reminder {reminder['reminderId']} is no longer pending, skipping")
+        continue
+      record_transition(summaries, old_item, new_item)
 
-      sns.publish(
-        TopicArn=os.environ['NOTIFICATION_TOPIC'],
-        Message=json.dumps(message),
-        MessageStructure='json',
-        MessageAttributes={
-          'userId': {
-            'DataType': 'String',
-            'StringValue': reminder['userId']
-          },
-          'notificationTypes': {
-            'DataType': 'String.Array',
-            'StringValue': json.dumps(reminder['notificationTypes'])
-          }
-        }
-      )
-            
-      # Marcar como enviado
-      table.update_item(
-        Key={
-          'userId': reminder['userId'],
-          'reminderId': reminder['reminderId']
-        },
-        UpdateExpression='SET #status = :sent',
-        ExpressionAttributeNames={
-          '#status': 'status'
-        },
-        ExpressionAttributeValues={
-          ':sent': 'sent'
-        }
-      )
+    if errors:
+      raise errors[0]
 
     return {
       'statusCode': 200,
@@ -0,0 +1,369 @@
+import os
+import boto3
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.exceptions import ClientError
+from store.reminder_store import ConditionFailedError, ReminderStore, SearchIndex, SummaryStore, SyncLog
+
+
+def get_resource():
+  # Cada llamada crea su propia sesión: los recursos de boto3 no son
+  # thread-safe
+  session = boto3.session.Session()
+  IF_OFLINE = os.environ.get('IF_OFFLINE', 'false').lower() == 'true'
+  if IF_OFLINE:
+    session = boto3.session.Session(
+      aws_access_key_id='fakeMyKeyId',
+      aws_secret_access_key='fakeSecretAccessKey',
+    )
+    return session.resource('dynamodb', endpoint_url='http://localhost:8000')
+  return session.resource('dynamodb')
+
+
+def get_table(table_name=None):
+  return get_resource().Table(table_name or os.environ['REMINDERS_TABLE'])
+
+
+def dynamodb_backend():
+  # Un objeto por interfaz, cada uno sobre su tabla (ver reminder_store).
+  # Sin SUMMARY_TABLE no hay resumen: record_transition no hace nada
+  table = get_table()
+  search_table_name = os.environ.get('SEARCH_INDEX_TABLE')
+  summary_table_name = os.environ.get('SUMMARY_TABLE')
+  tombstones_table_name = os.environ.get('TOMBSTONES_TABLE')
+  return {
+    'reminders': DynamoDBReminderStore(table),
+    'search': DynamoDBSearchIndex(get_table(search_table_name) if search_table_name else None),
+    'summary': DynamoDBSummaryStore(table, get_table(summary_table_name)) if summary_table_name else None,
+    'sync': DynamoDBSyncLog(table, get_table(tombstones_table_name) if tombstones_table_name else None)
+  }
+
+
+class DynamoDBReminderStore(ReminderStore):
+  def __init__(self, table):
+    self.table = table
+
+  def get(self, user_id, reminder_id):
+    response = self.table.get_item(
+      Key={
+        'userId': user_id,
+        'reminderId': reminder_id
+      }
+    )
+    return response.get('Item')
+
+  def query_by_user(self, user_id, limit=10, start_key=None, descending=True):
+    query_args = {
+      'KeyConditionExpression': Key('userId').eq(user_id),
+      'Limit': limit,
+      'ScanIndexForward': not descending
+    }
+    if start_key:
+      query_args['ExclusiveStartKey'] = start_key
+
+    response = self.table.query(**query_args)
+    return response['Items'], response.get('LastEvaluatedKey')
+
+  def query_due(self, now, limit=None, start_key=None):
+    # TriggerTimeIndex: status (HASH) + triggerAt (RANGE). Todos los
+    # pendientes comparten la partición 'pending' del índice; basta mientras
+    # el volumen de altas y envíos quede bajo el límite por partición
+    query_args = {
+      'IndexName': 'TriggerTimeIndex',
+      'KeyConditionExpression': Key('status').eq('pending') & Key('triggerAt').lte(now)
+    }
+    if limit:
+      query_args['Limit'] = limit
+    if start_key:
+      query_args['ExclusiveStartKey'] = start_key
+
+    response = self.table.query(**query_args)
+    return response.get('Items', []), response.get('LastEvaluatedKey')
+
+  def update(self, user_id, reminder_id, changes, expected=None):
+    expression_name = {}
+    expression_value = {}
+    assignments = []
+    for i, (name, value) in enumerate(changes.items()):
+      expression_name[f'#u{i}'] = name
+      expression_value[f':u{i}'] = value
+      assignments.append(f'#u{i} = :u{i}')
+
+    condition = Attr('userId').exists()
+    for name, value in (expected or {}).items():
+      condition = condition & Attr(name).eq(value)
+
+    try:
+      response = self.table.update_item(
+        Key={
+          'userId': user_id,
+          'reminderId': reminder_id
+        },
+        UpdateExpression='SET ' + ', '.join(assignments),
+        ExpressionAttributeNames=expression_name,
+        ExpressionAttributeValues=expression_value,
+        ConditionExpression=condition,
+        ReturnValues='ALL_OLD'
+      )
+    except ClientError as err:
+      if err.response['Error']['Code'] == 'ConditionalCheckFailedException':
+        raise ConditionFailedError(f"Condition failed for {user_id}/{reminder_id}") from err
+      raise
+
+    # ALL_OLD devuelve la imagen previa; la nueva es esa más los cambios
+    old_item = response['Attributes']
+    return old_item, {**old_item, **changes}
+
+  def batch_write(self, put_items=(), delete_keys=()):
+    # batch_writer agrupa de 25 en 25 y reintenta los UnprocessedItems
+    with self.table.batch_writer() as batch:
+      for item in put_items:
+        batch.put_item(Item=item)
+      for key in delete_keys:
+        batch.delete_item(Key=key)
+
+
+class DynamoDBSearchIndex(SearchIndex):
+  def __init__(self, search_table):
+    # Índice invertido: userId (HASH) + termKey "token#reminderId" (RANGE)
+    self.search_table = search_table
+
+  def put_search_terms(self, user_id, reminder_id, terms):
+    if self.search_table is None or not terms:
+      return
+    with self.search_table.batch_writer() as batch:
+      for token, weight in terms.items():
+        batch.put_item(Item={
+          'userId': user_id,
+          'termKey': f'{token}#{reminder_id}',
+          'token': token,
+          'reminderId': reminder_id,
+          'weight': weight
+        })
+
+  def delete_search_terms(self, user_id, reminder_id, tokens):
+    if self.search_table is None or not tokens:
+      return
+    with self.search_table.batch_writer() as batch:
+      for token in tokens:
+        batch.delete_item(Key={
+          'userId': user_id,
+          'termKey': f'{token}#{reminder_id}'
+        })
+
+  def query_search_terms(self, user_id, prefix):
+    if self.search_table is None:
+      raise ValueError('SEARCH_INDEX_TABLE is not configured')
+
+    matches = []
+    query_args = {
+      'KeyConditionExpression': Key('userId').eq(user_id) & Key('termKey').begins_with(prefix),
+      'ProjectionExpression': '#token, reminderId, weight',
+      'ExpressionAttributeNames': {
+        '#token': 'token'
+      }
+    }
+    while True:
+      response = self.search_table.query(**query_args)
+      matches.extend(
+        (item['token'], item['reminderId'], int(item['weight']))
+        for item in response.get('Items', [])
+      )
+      if not response.get('LastEvaluatedKey'):
+        return matches
+      query_args['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+class DynamoDBSummaryStore(SummaryStore):
+  def __init__(self, table, summary_table):
+    self.table = table
+    # Resumen por usuario: userId (HASH) con atributos <status>Count y nextDueAt
+    self.summary_table = summary_table
+
+  def scan(self, start_key=None, limit=None):
+    scan_args = {}
+    if limit:
+      scan_args['Limit'] = limit
+    if start_key:
+      scan_args['ExclusiveStartKey'] = start_key
+
+    response = self.table.scan(**scan_args)
+    return response.get('Items', []), response.get('LastEvaluatedKey')
+
+  def next_pending_trigger_at(self, user_id, after=None):
+    # UserTriggerIndex: userId (HASH) + triggerAt (RANGE), en orden ascendente
+    key_condition = Key('userId').eq(user_id)
+    if after is not None:
+      key_condition = key_condition & Key('triggerAt').gte(after)
+    query_args = {
+      'IndexName': 'UserTriggerIndex',
+      'KeyConditionExpression': key_condition,
+      'FilterExpression': Attr('status').eq('pending'),
+      'ProjectionExpression': 'triggerAt',
+      'ScanIndexForward': True
+    }
+    while True:
+      response = self.table.query(**query_args)
+      items = response.get('Items', [])
+      if items:
+        return int(items[0]['triggerAt'])
+      if not response.get('LastEvaluatedKey'):
+        return None
+      query_args['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+  def _summary_from_item(self, item):
+    return {
+      'userId': item['userId'],
+      'counts': {
+        name[:-len('Count')]: int(value)
+        for name, value in item.items()
+        if name.endswith('Count')
+      },
+      'nextDueAt': int(item['nextDueAt']) if 'nextDueAt' in item else None
+    }
+
+  def get_summary(self, user_id):
+    item = self.summary_table.get_item(Key={'userId': user_id}).get('Item')
+    return self._summary_from_item(item) if item else None
+
+  def adjust_summary(self, user_id, deltas, due_candidate=None):
+    if deltas:
+      expression_name = {}
+      expression_value = {}
+      for i, (status, delta) in enumerate(deltas.items()):
+        expression_name[f'#c{i}'] = f'{status}Count'
+        expression_value[f':c{i}'] = delta
+      # ADD es atómico y crea el atributo si no existe
+      self.summary_table.update_item(
+        Key={'userId': user_id},
+        UpdateExpression='ADD ' + ', '.join(f'#c{i} :c{i}' for i in range(len(deltas))),
+        ExpressionAttributeNames=expression_name,
+        ExpressionAttributeValues=expression_value
+      )
+
+    if due_candidate is not None:
+      try:
+        self.summary_table.update_item(
+          Key={'userId': user_id},
+          UpdateExpression='SET nextDueAt = :due',
+          ConditionExpression=Attr('nextDueAt').not_exists() | Attr('nextDueAt').gt(due_candidate),
+          ExpressionAttributeValues={
+            ':due': due_candidate
+          }
+        )
+      except ClientError as err:
+        if err.response['Error']['Code'] != 'ConditionalCheckFailedException':
+          raise
+
+  def replace_next_due(self, user_id, old_value, new_value):
+    update_args = {'Key': {'userId': user_id}}
+    if old_value is None:
+      update_args['ConditionExpression'] = Attr('nextDueAt').not_exists()
+    else:
+      update_args['ConditionExpression'] = Attr('nextDueAt').eq(old_value)
+    if new_value is None:
+      update_args['UpdateExpression'] = 'REMOVE nextDueAt'
+    else:
+      update_args['UpdateExpression'] = 'SET nextDueAt = :new'
+      update_args['ExpressionAttributeValues'] = {':new': new_value}
+
+    try:
+      self.summary_table.update_item(**update_args)
+    except ClientError as err:
+      if err.response['Error']['Code'] == 'ConditionalCheckFailedException':
+        return False
+      raise
+    return True
+
+  def _item_from_summary(self, summary):
+    item = {'userId': summary['userId']}
+    for status, count in summary['counts'].items():
+      item[f'{status}Count'] = count
+    if summary.get('nextDueAt') is not None:
+      item['nextDueAt'] = summary['nextDueAt']
+    return item
+
+  def put_summary(self, summary):
+    self.summary_table.put_item(Item=self._item_from_summary(summary))
+
+  def replace_summary(self, summary, expected):
+    # Condición sobre los valores leídos: cada contador que se lee o se
+    # escribe y nextDueAt deben seguir como estaban
+    if expected is None:
+      condition = Attr('userId').not_exists()
+    else:
+      condition = Attr('userId').exists()
+      for status in {**summary['counts'], **expected['counts']}:
+        if status in expected['counts']:
+          condition = condition & Attr(f'{status}Count').eq(expected['counts'][status])
+        else:
+          condition = condition & Attr(f'{status}Count').not_exists()
+      if expected.get('nextDueAt') is None:
+        condition = condition & Attr('nextDueAt').not_exists()
+      else:
+        condition = condition & Attr('nextDueAt').eq(expected['nextDueAt'])
+
+    try:
+      self.summary_table.put_item(Item=self._item_from_summary(summary), ConditionExpression=condition)
+    except ClientError as err:
+      if err.response['Error']['Code'] == 'ConditionalCheckFailedException':
+        raise ConditionFailedError(f"Summary changed for {summary['userId']}") from err
+      raise
+
+  def scan_summaries(self, start_key=None, limit=None):
+    scan_args = {}
+    if limit:
+      scan_args['Limit'] = limit
+    if start_key:
+      scan_args['ExclusiveStartKey'] = start_key
+
+    response = self.summary_table.scan(**scan_args)
+    summaries = [self._summary_from_item(item) for item in response.get('Items', [])]
+    return summaries, response.get('LastEvaluatedKey')
+
+
+class DynamoDBSyncLog(SyncLog):
+  def __init__(self, table, tombstones_table):
+    self.table = table
+    # Borrados para sincronización: userId (HASH) + syncKey (RANGE), con TTL
+    # en expiresAt
+    self.tombstones_table = tombstones_table
+
+  def _query_after(self, table, user_id, after, limit, index_name=None):
+    # DynamoDB no admite '' en condiciones de clave: sin marca se lee todo
+    condition = Key('userId').eq(user_id)
+    if after:
+      condition = condition & Key('syncKey').gt(after)
+    query_args = {
+      'KeyConditionExpression': condition,
+      'ScanIndexForward': True,
+      'Limit': limit
+    }
+    if index_name:
+      query_args['IndexName'] = index_name
+
+    items = []
+    while len(items) < limit:
+      response = table.query(**query_args)
+      items.extend(response.get('Items', []))
+      if not response.get('LastEvaluatedKey'):
+        break
+      query_args['ExclusiveStartKey'] = response['LastEvaluatedKey']
+      query_args['Limit'] = limit - len(items)
+    return items[:limit]
+
+  def query_changes(self, user_id, after, limit):
+    # UserSyncIndex: userId (HASH) + syncKey (RANGE); índice disperso, solo
+    # contiene recordatorios escritos desde que existe syncKey
+    return self._query_after(self.table, user_id, after, limit, index_name='UserSyncIndex')
+
+  def put_tombstones(self, tombstones):
+    if self.tombstones_table is None:
+      return
+    with self.tombstones_table.batch_writer() as batch:
+      for item in tombstones:
+        batch.put_item(Item=item)
+
+  def query_tombstones(self, user_id, after, limit):
+    if self.tombstones_table is None:
+      raise ValueError('TOMBSTONES_TABLE is not configured')
+    return self._query_after(self.tombstones_table, user_id, after, limit)
@@ -0,0 +1,193 @@
+import os
+from abc import ABC, abstractmethod
+
+
+class ConditionFailedError(Exception):
+  # La condición de una escritura condicional no se cumplió
+  # (el recordatorio no existe o cambió mientras tanto)
+  pass
+
+
+class ReminderStore(ABC):
+  # Interfaz común de persistencia de recordatorios. Las claves de paginación
+  # (start_key / next_key) son diccionarios opacos serializables a JSON.
+
+  @abstractmethod
+  def get(self, user_id, reminder_id):
+    pass
+
+  @abstractmethod
+  def query_by_user(self, user_id, limit=10, start_key=None, descending=True):
+    # Devuelve (items, next_key) ordenados por reminderId
+    pass
+
+  @abstractmethod
+  def query_due(self, now, limit=None, start_key=None):
+    # Devuelve (items, next_key) pendientes con triggerAt <= now
+    pass
+
+  @abstractmethod
+  def update(self, user_id, reminder_id, changes, expected=None):
+    # Aplica changes solo si el recordatorio existe y cada atributo de
+    # expected tiene el valor indicado; devuelve (item anterior, item
+    # actualizado) para que quien llama no tenga que leerlo antes
+    pass
+
+  @abstractmethod
+  def batch_write(self, put_items=(), delete_keys=()):
+    pass
+
+  def close(self):
+    pass
+
+
+class SearchIndex(ABC):
+  # Índice invertido de búsqueda por usuario (helpers/search_index.py)
+
+  @abstractmethod
+  def put_search_terms(self, user_id, reminder_id, terms):
+    # terms: {token: peso}; sobreescribe los pesos existentes
+    pass
+
+  @abstractmethod
+  def delete_search_terms(self, user_id, reminder_id, tokens):
+    pass
+
+  @abstractmethod
+  def query_search_terms(self, user_id, prefix):
+    # Devuelve [(token, reminder_id, peso)] cuyos tokens empiezan por prefix
+    pass
+
+  def close(self):
+    pass
+
+
+class SummaryStore(ABC):
+  # Resúmenes por usuario (helpers/summary.py) y las lecturas de
+  # recordatorios que necesitan su mantenimiento y su reconciliación
+
+  @abstractmethod
+  def get_summary(self, user_id):
+    # {'userId', 'counts': {status: n}, 'nextDueAt'} o None
+    pass
+
+  @abstractmethod
+  def adjust_summary(self, user_id, deltas, due_candidate=None):
+    # Suma deltas ({status: n}) de forma atómica y, si due_candidate es
+    # menor que nextDueAt (o no hay), lo guarda como nextDueAt
+    pass
+
+  @abstractmethod
+  def replace_next_due(self, user_id, old_value, new_value):
+    # Cambia nextDueAt solo si sigue valiendo old_value (None lo elimina);
+    # devuelve si se aplicó
+    pass
+
+  @abstractmethod
+  def put_summary(self, summary):
+    pass
+
+  @abstractmethod
+  def replace_summary(self, summary, expected):
+    # Escribe summary solo si el guardado sigue siendo expected (None: no
+    # existe); si cambió entretanto lanza ConditionFailedError
+    pass
+
+  @abstractmethod
+  def scan_summaries(self, start_key=None, limit=None):
+    # Recorre todos los resúmenes; devuelve (summaries, next_key)
+    pass
+
+  @abstractmethod
+  def next_pending_trigger_at(self, user_id, after=None):
+    # Menor triggerAt pendiente del usuario (>= after), o None
+    pass
+
+  @abstractmethod
+  def scan(self, start_key=None, limit=None):
+    # Recorre todos los recordatorios; devuelve (items, next_key)
+    pass
+
+  def close(self):
+    pass
+
+
+class SyncLog(ABC):
+  # Cambios ordenados por syncKey y tombstones de borrados
+  # (sync/sync_reminders.py)
+
+  @abstractmethod
+  def query_changes(self, user_id, after, limit):
+    # Recordatorios con syncKey > after, en orden ascendente (máx. limit)
+    pass
+
+  @abstractmethod
+  def put_tombstones(self, tombstones):
+    pass
+
+  @abstractmethod
+  def query_tombstones(self, user_id, after, limit):
+    # Tombstones con syncKey > after, en orden ascendente (máx. limit)
+    pass
+
+  def close(self):
+    pass
+
+
+# Un backend por proceso y configuración: los contenedores de Lambda
+# reutilizan la conexión entre invocaciones. Cada backend expone un objeto
+# por interfaz: 'reminders', 'search', 'summary' y 'sync'
+_backends = {}
+
+
+def _get_backend():
+  backend = os.environ.get('REMINDER_STORE', 'dynamodb').lower()
+
+  if backend == 'sqlite':
+    key = (backend, os.environ.get('SQLITE_PATH', 'reminders.db'))
+  elif backend == 'dynamodb':
+    key = (
+      backend,
+      os.environ['REMINDERS_TABLE'],
+      os.environ.get('SEARCH_INDEX_TABLE'),
+      os.environ.get('SUMMARY_TABLE'),
+      os.environ.get('TOMBSTONES_TABLE'),
+      os.environ.get('IF_OFFLINE', 'false').lower() == 'true'
+    )
+  else:
+    raise ValueError(f"Unsupported REMINDER_STORE: {backend}")
+
+  if key not in _backends:
+    if backend == 'sqlite':
+      from store.sqlite_store import SQLiteReminderStore
+      store = SQLiteReminderStore(key[1])
+      _backends[key] = {'reminders': store, 'search': store, 'summary': store, 'sync': store}
+    else:
+      from store.dynamodb_store import dynamodb_backend
+      _backends[key] = dynamodb_backend()
+  return _backends[key]
+
+
+def get_reminder_store():
+  return _get_backend()['reminders']
+
+
+def get_search_index():
+  return _get_backend()['search']
+
+
+def get_summary_store():
+  # None si el backend no tiene resumen configurado
+  return _get_backend()['summary']
+
+
+def get_sync_log():
+  return _get_backend()['sync']
+
+
+def reset_reminder_stores():
+  # Cierra y olvida los backends cacheados (tests y cambios de configuración)
+  for backend in _backends.values():
+    for store in {id(store): store for store in backend.values() if store is not None}.values():
+      store.close()
+  _backends.clear()
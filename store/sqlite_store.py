@@ -0,0 +1,342 @@
+import json
+import sqlite3
+import threading
+from helpers.serialization import DecimalEncoder
+from helpers.trigger_at import to_epoch_ms
+from store.reminder_store import ConditionFailedError, ReminderStore, SearchIndex, SummaryStore, SyncLog
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reminders (
+  user_id TEXT NOT NULL,
+  reminder_id TEXT NOT NULL,
+  trigger_at INTEGER,
+  status TEXT,
+  sync_key TEXT,
+  item TEXT NOT NULL,
+  PRIMARY KEY (user_id, reminder_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS reminders_due
+  ON reminders (status, trigger_at, user_id, reminder_id);
+
+CREATE INDEX IF NOT EXISTS reminders_user_due
+  ON reminders (user_id, status, trigger_at);
+
+CREATE INDEX IF NOT EXISTS reminders_user_sync
+  ON reminders (user_id, sync_key) WHERE sync_key IS NOT NULL;
+
+CREATE TABLE IF NOT EXISTS tombstones (
+  user_id TEXT NOT NULL,
+  sync_key TEXT NOT NULL,
+  item TEXT NOT NULL,
+  PRIMARY KEY (user_id, sync_key)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS summaries (
+  user_id TEXT NOT NULL PRIMARY KEY,
+  item TEXT NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS search_terms (
+  user_id TEXT NOT NULL,
+  token TEXT NOT NULL,
+  reminder_id TEXT NOT NULL,
+  weight INTEGER NOT NULL,
+  PRIMARY KEY (user_id, token, reminder_id)
+) WITHOUT ROWID;
+"""
+
+
+class SQLiteReminderStore(ReminderStore, SearchIndex, SummaryStore, SyncLog):
+  # Backend embebido para tests y desarrollo local: una sola base implementa
+  # todas las interfaces. El item completo se guarda como JSON y los
+  # atributos consultados se duplican en columnas indexadas.
+
+  def __init__(self, path=':memory:'):
+    self.lock = threading.RLock()
+    self.conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+    self.conn.execute('PRAGMA journal_mode=WAL')
+    self.conn.execute('PRAGMA synchronous=NORMAL')
+    self._migrate()
+    self.conn.executescript(SCHEMA)
+
+  def _migrate(self):
+    # Bases locales creadas antes de la columna sync_key
+    columns = [row[1] for row in self.conn.execute('PRAGMA table_info(reminders)')]
+    if columns and 'sync_key' not in columns:
+      self.conn.execute('ALTER TABLE reminders ADD COLUMN sync_key TEXT')
+      for user_id, reminder_id, item in self.conn.execute('SELECT user_id, reminder_id, item FROM reminders').fetchall():
+        sync_key = json.loads(item).get('syncKey')
+        if sync_key:
+          self.conn.execute(
+            'UPDATE reminders SET sync_key = ? WHERE user_id = ? AND reminder_id = ?',
+            (sync_key, user_id, reminder_id)
+          )
+
+  def close(self):
+    with self.lock:
+      self.conn.close()
+
+  def _row(self, item):
+    try:
+      trigger_at = to_epoch_ms(item.get('triggerAt'))
+    except ValueError:
+      trigger_at = None
+    return (
+      item['userId'],
+      item['reminderId'],
+      trigger_at,
+      item.get('status'),
+      item.get('syncKey'),
+      json.dumps(item, cls=DecimalEncoder)
+    )
+
+  def _put(self, item):
+    self.conn.execute(
+      'INSERT OR REPLACE INTO reminders (user_id, reminder_id, trigger_at, status, sync_key, item) '
+      'VALUES (?, ?, ?, ?, ?, ?)',
+      self._row(item)
+    )
+
+  def get(self, user_id, reminder_id):
+    with self.lock:
+      row = self.conn.execute(
+        'SELECT item FROM reminders WHERE user_id = ? AND reminder_id = ?',
+        (user_id, reminder_id)
+      ).fetchone()
+    return json.loads(row[0]) if row else None
+
+  def query_by_user(self, user_id, limit=10, start_key=None, descending=True):
+    sql = 'SELECT reminder_id, item FROM reminders WHERE user_id = ?'
+    args = [user_id]
+    if start_key:
+      sql += ' AND reminder_id < ?' if descending else ' AND reminder_id > ?'
+      args.append(start_key['reminderId'])
+    sql += ' ORDER BY reminder_id ' + ('DESC' if descending else 'ASC') + ' LIMIT ?'
+    args.append(limit + 1)
+
+    with self.lock:
+      rows = self.conn.execute(sql, args).fetchall()
+
+    # Se pide una fila extra para saber si hay más páginas
+    items = [json.loads(item) for _, item in rows[:limit]]
+    next_key = None
+    if len(rows) > limit:
+      next_key = {'userId': user_id, 'reminderId': rows[limit - 1][0]}
+    return items, next_key
+
+  def query_due(self, now, limit=None, start_key=None):
+    sql = "SELECT trigger_at, user_id, reminder_id, item FROM reminders WHERE status = 'pending' AND trigger_at <= ?"
+    args = [now]
+    if start_key:
+      sql += ' AND (trigger_at, user_id, reminder_id) > (?, ?, ?)'
+      args.extend([start_key['triggerAt'], start_key['userId'], start_key['reminderId']])
+    sql += ' ORDER BY trigger_at, user_id, reminder_id'
+    if limit:
+      sql += ' LIMIT ?'
+      args.append(limit + 1)
+
+    with self.lock:
+      rows = self.conn.execute(sql, args).fetchall()
+
+    next_key = None
+    if limit and len(rows) > limit:
+      trigger_at, user_id, reminder_id, _ = rows[limit - 1]
+      next_key = {
+        'status': 'pending',
+        'triggerAt': trigger_at,
+        'userId': user_id,
+        'reminderId': reminder_id
+      }
+      rows = rows[:limit]
+    return [json.loads(row[3]) for row in rows], next_key
+
+  def update(self, user_id, reminder_id, changes, expected=None):
+    with self.lock:
+      self.conn.execute('BEGIN IMMEDIATE')
+      try:
+        row = self.conn.execute(
+          'SELECT item FROM reminders WHERE user_id = ? AND reminder_id = ?',
+          (user_id, reminder_id)
+        ).fetchone()
+        item = json.loads(row[0]) if row else None
+        if item is None or any(item.get(name) != value for name, value in (expected or {}).items()):
+          raise ConditionFailedError(f"Condition failed for {user_id}/{reminder_id}")
+
+        new_item = {**item, **json.loads(json.dumps(changes, cls=DecimalEncoder))}
+        self._put(new_item)
+        self.conn.execute('COMMIT')
+      except BaseException:
+        self.conn.execute('ROLLBACK')
+        raise
+    return item, new_item
+
+  def batch_write(self, put_items=(), delete_keys=()):
+    with self.lock:
+      self.conn.execute('BEGIN IMMEDIATE')
+      try:
+        for item in put_items:
+          self._put(item)
+        self.conn.executemany(
+          'DELETE FROM reminders WHERE user_id = ? AND reminder_id = ?',
+          [(key['userId'], key['reminderId']) for key in delete_keys]
+        )
+        self.conn.execute('COMMIT')
+      except BaseException:
+        self.conn.execute('ROLLBACK')
+        raise
+
+  def put_search_terms(self, user_id, reminder_id, terms):
+    with self.lock:
+      self.conn.executemany(
+        'INSERT OR REPLACE INTO search_terms (user_id, token, reminder_id, weight) VALUES (?, ?, ?, ?)',
+        [(user_id, token, reminder_id, weight) for token, weight in terms.items()]
+      )
+
+  def delete_search_terms(self, user_id, reminder_id, tokens):
+    with self.lock:
+      self.conn.executemany(
+        'DELETE FROM search_terms WHERE user_id = ? AND token = ? AND reminder_id = ?',
+        [(user_id, token, reminder_id) for token in tokens]
+      )
+
+  def query_search_terms(self, user_id, prefix):
+    # Rango sobre la clave primaria: equivale a begins_with en DynamoDB
+    with self.lock:
+      return self.conn.execute(
+        'SELECT token, reminder_id, weight FROM search_terms '
+        'WHERE user_id = ? AND token >= ? AND token < ?',
+        (user_id, prefix, prefix + '\U0010ffff')
+      ).fetchall()
+
+  def scan(self, start_key=None, limit=None):
+    sql = 'SELECT user_id, reminder_id, item FROM reminders'
+    args = []
+    if start_key:
+      sql += ' WHERE (user_id, reminder_id) > (?, ?)'
+      args.extend([start_key['userId'], start_key['reminderId']])
+    sql += ' ORDER BY user_id, reminder_id'
+    if limit:
+      sql += ' LIMIT ?'
+      args.append(limit + 1)
+
+    with self.lock:
+      rows = self.conn.execute(sql, args).fetchall()
+
+    next_key = None
+    if limit and len(rows) > limit:
+      rows = rows[:limit]
+      next_key = {'userId': rows[-1][0], 'reminderId': rows[-1][1]}
+    return [json.loads(row[2]) for row in rows], next_key
+
+  def next_pending_trigger_at(self, user_id, after=None):
+    sql = "SELECT MIN(trigger_at) FROM reminders WHERE user_id = ? AND status = 'pending'"
+    args = [user_id]
+    if after is not None:
+      sql += ' AND trigger_at >= ?'
+      args.append(after)
+    with self.lock:
+      return self.conn.execute(sql, args).fetchone()[0]
+
+  def _get_summary(self, user_id):
+    row = self.conn.execute('SELECT item FROM summaries WHERE user_id = ?', (user_id,)).fetchone()
+    return json.loads(row[0]) if row else None
+
+  def _put_summary(self, summary):
+    self.conn.execute(
+      'INSERT OR REPLACE INTO summaries (user_id, item) VALUES (?, ?)',
+      (summary['userId'], json.dumps(summary, cls=DecimalEncoder))
+    )
+
+  def get_summary(self, user_id):
+    with self.lock:
+      return self._get_summary(user_id)
+
+  def adjust_summary(self, user_id, deltas, due_candidate=None):
+    with self.lock:
+      self.conn.execute('BEGIN IMMEDIATE')
+      try:
+        summary = self._get_summary(user_id) or {'userId': user_id, 'counts': {}, 'nextDueAt': None}
+        for status, delta in deltas.items():
+          summary['counts'][status] = summary['counts'].get(status, 0) + delta
+        if due_candidate is not None and (summary['nextDueAt'] is None or due_candidate < summary['nextDueAt']):
+          summary['nextDueAt'] = due_candidate
+        self._put_summary(summary)
+        self.conn.execute('COMMIT')
+      except BaseException:
+        self.conn.execute('ROLLBACK')
+        raise
+
+  def replace_next_due(self, user_id, old_value, new_value):
+    with self.lock:
+      self.conn.execute('BEGIN IMMEDIATE')
+      try:
+        summary = self._get_summary(user_id)
+        applied = summary is not None and summary.get('nextDueAt') == old_value
+        if applied:
+          summary['nextDueAt'] = new_value
+          self._put_summary(summary)
+        self.conn.execute('COMMIT')
+      except BaseException:
+        self.conn.execute('ROLLBACK')
+        raise
+    return applied
+
+  def put_summary(self, summary):
+    with self.lock:
+      self._put_summary(summary)
+
+  def replace_summary(self, summary, expected):
+    with self.lock:
+      self.conn.execute('BEGIN IMMEDIATE')
+      try:
+        if self._get_summary(summary['userId']) != expected:
+          raise ConditionFailedError(f"Summary changed for {summary['userId']}")
+        self._put_summary(summary)
+        self.conn.execute('COMMIT')
+      except BaseException:
+        self.conn.execute('ROLLBACK')
+        raise
+
+  def scan_summaries(self, start_key=None, limit=None):
+    sql = 'SELECT user_id, item FROM summaries'
+    args = []
+    if start_key:
+      sql += ' WHERE user_id > ?'
+      args.append(start_key['userId'])
+    sql += ' ORDER BY user_id'
+    if limit:
+      sql += ' LIMIT ?'
+      args.append(limit + 1)
+
+    with self.lock:
+      rows = self.conn.execute(sql, args).fetchall()
+
+    next_key = None
+    if limit and len(rows) > limit:
+      rows = rows[:limit]
+      next_key = {'userId': rows[-1][0]}
+    return [json.loads(row[1]) for row in rows], next_key
+
+  def query_changes(self, user_id, after, limit):
+    with self.lock:
+      rows = self.conn.execute(
+        'SELECT item FROM reminders WHERE user_id = ? AND sync_key > ? ORDER BY sync_key LIMIT ?',
+        (user_id, after, limit)
+      ).fetchall()
+    return [json.loads(row[0]) for row in rows]
+
+  def put_tombstones(self, tombstones):
+    with self.lock:
+      self.conn.executemany(
+        'INSERT OR REPLACE INTO tombstones (user_id, sync_key, item) VALUES (?, ?, ?)',
+        [(item['userId'], item['syncKey'], json.dumps(item, cls=DecimalEncoder)) for item in tombstones]
+      )
+
+  def query_tombstones(self, user_id, after, limit):
+    with self.lock:
+      rows = self.conn.execute(
+        'SELECT item FROM tombstones WHERE user_id = ? AND sync_key > ? ORDER BY sync_key LIMIT ?',
+        (user_id, after, limit)
+      ).fetchall()
+    return [json.loads(row[0]) for row in rows]
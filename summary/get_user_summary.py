@@ -0,0 +1,39 @@
+import json
+from helpers.serialization import DecimalEncoder
+from helpers.summary import empty_summary
+from store.reminder_store import get_summary_store
+
+def get_user_summary(event, context):
+  summaries = get_summary_store()
+
+  try:
+
+    claims = event['requestContext']['authorizer']['claims']
+    user_id = claims['userId']
+
+    if summaries is None:
+      raise ValueError('SUMMARY_TABLE is not configured')
+
+    # Lectura de un solo item, independiente del número de recordatorios
+    summary = summaries.get_summary(user_id) or empty_summary(user_id)
+    counts = summary['counts']
+
+    return {
+      'statusCode': 200,
+      'body': json.dumps({
+        'userId': user_id,
+        'pending': counts.get('pending', 0),
+        'sent': counts.get('sent', 0),
+        'counts': counts,
+        'nextDueAt': summary.get('nextDueAt')
+      }, cls=DecimalEncoder)
+    }
+
+  except Exception as err:
+    print(f"Error getting reminder summary: {err}")
+    return {
+      'statusCode': 500,
+      'body': json.dumps({
+        'error': 'Could not get reminder summary'
+      })
+    }
@@ -0,0 +1,149 @@
+import json
+from helpers.summary import empty_summary
+from helpers.trigger_at import to_epoch_ms
+from store.reminder_store import ConditionFailedError, get_reminder_store, get_summary_store
+
+SCAN_PAGE_SIZE = 500
+# Reintentos por usuario cuando una transición concurrente cambia el resumen
+MAX_ATTEMPTS = 3
+# Margen para devolver el estado antes de que Lambda corte la ejecución
+SAFETY_MARGIN_MS = 10000
+# Fases del recorrido completo: primero los resúmenes existentes (incluidos
+# los de usuarios sin recordatorios) y después los usuarios sin resumen
+PHASES = ('summaries', 'reminders')
+
+
+def _has_time_left(context):
+  if context is None or not hasattr(context, 'get_remaining_time_in_millis'):
+    return True
+  return context.get_remaining_time_in_millis() > SAFETY_MARGIN_MS
+
+
+def _accumulate(summaries, item):
+  summary = summaries.setdefault(item['userId'], empty_summary(item['userId']))
+  status = item.get('status')
+  if status:
+    summary['counts'][status] = summary['counts'].get(status, 0) + 1
+  if status == 'pending':
+    try:
+      trigger_at = to_epoch_ms(item.get('triggerAt'))
+    except ValueError:
+      return
+    if summary['nextDueAt'] is None or trigger_at < summary['nextDueAt']:
+      summary['nextDueAt'] = trigger_at
+
+
+def _normalize(summary):
+  # Los contadores a cero equivalen a no tener el estado
+  return (
+    {status: count for status, count in summary['counts'].items() if count},
+    summary.get('nextDueAt')
+  )
+
+
+def _recompute(store, user_id):
+  expected = {user_id: empty_summary(user_id)}
+  start_key = None
+  while True:
+    items, start_key = store.query_by_user(user_id, limit=SCAN_PAGE_SIZE, start_key=start_key)
+    for item in items:
+      _accumulate(expected, item)
+    if not start_key:
+      return expected[user_id]
+
+
+def _reconcile_user(store, summaries, user_id):
+  # Recalcula el resumen y lo reescribe solo si el guardado sigue como se
+  # leyó; si otra escritura lo cambió entretanto se vuelve a calcular.
+  # Devuelve 'ok', 'repaired' o 'conflict'
+  for _ in range(MAX_ATTEMPTS):
+    stored = summaries.get_summary(user_id)
+    summary = _recompute(store, user_id)
+    if _normalize(stored or empty_summary(user_id)) == _normalize(summary):
+      return 'ok'
+    try:
+      summaries.replace_summary(summary, stored)
+      return 'repaired'
+    except ConditionFailedError:
+      continue
+  print(f"Summary for user {user_id} kept changing, skipping")
+  return 'conflict'
+
+
+def reconcile_summaries(event, context):
+  # Recalcula los resúmenes desde los recordatorios y repara los que
+  # difieren. Sin userIds recorre las tablas por páginas y, si se acaba el
+  # tiempo o maxPages, devuelve el estado para continuar en la siguiente
+  # invocación (como migrations/backfill_trigger_at.py)
+  store = get_reminder_store()
+  summaries = get_summary_store()
+
+  try:
+    if summaries is None:
+      raise ValueError('SUMMARY_TABLE is not configured')
+
+    event = event or {}
+    stats = {'checked': 0, 'repaired': 0, 'conflicts': 0}
+
+    def check(user_id):
+      result = _reconcile_user(store, summaries, user_id)
+      stats['checked'] += 1
+      if result == 'repaired':
+        stats['repaired'] += 1
+      elif result == 'conflict':
+        stats['conflicts'] += 1
+
+    user_ids = event.get('userIds')
+    if user_ids:
+      for user_id in user_ids:
+        check(user_id)
+      return {
+        'statusCode': 200,
+        'body': json.dumps(stats)
+      }
+
+    # El estado devuelto por una invocación se pasa como evento de la siguiente
+    phase = event.get('phase') or PHASES[0]
+    start_key = event.get('startKey')
+    max_pages = event.get('maxPages')
+    max_pages = int(max_pages) if max_pages is not None else None
+    pages = 0
+    seen = set()
+
+    while phase != 'done' and _has_time_left(context) and (max_pages is None or pages < max_pages):
+      if phase == 'summaries':
+        page, start_key = summaries.scan_summaries(start_key=start_key, limit=SCAN_PAGE_SIZE)
+        for summary in page:
+          check(summary['userId'])
+      else:
+        items, start_key = summaries.scan(start_key=start_key, limit=SCAN_PAGE_SIZE)
+        # Los usuarios con resumen ya se revisaron en la fase anterior
+        for user_id in dict.fromkeys(item['userId'] for item in items):
+          if user_id in seen:
+            continue
+          seen.add(user_id)
+          if summaries.get_summary(user_id) is None:
+            check(user_id)
+      pages += 1
+
+      if not start_key:
+        phase = PHASES[PHASES.index(phase) + 1] if phase != PHASES[-1] else 'done'
+
+    return {
+      'statusCode': 200,
+      'body': json.dumps({
+        'phase': phase,
+        'startKey': start_key,
+        'done': phase == 'done',
+        **stats
+      })
+    }
+
+  except Exception as err:
+    print(f"Error reconciling reminder summaries: {err}")
+    return {
+      'statusCode': 500,
+      'body': json.dumps({
+        'error': 'Could not reconcile reminder summaries'
+      })
+    }
@@ -0,0 +1,89 @@
+import json
+from helpers.serialization import DecimalEncoder
+from helpers.sync import safe_watermark, watermark_expired
+from store.reminder_store import get_reminder_store, get_sync_log
+
+def sync_reminders(event, context):
+  store = get_reminder_store()
+  sync_log = get_sync_log()
+
+  try:
+
+    claims = event['requestContext']['authorizer']['claims']
+    user_id = claims['userId']
+
+    query_params = event.get('queryStringParameters') or {}
+    limit = int(query_params.get('limit', 100))
+    since = query_params.get('since')
+    next_token = query_params.get('nextToken')
+
+    if not since:
+      # Sincronización completa desde la tabla base (incluye recordatorios
+      # escritos antes de syncKey). La marca se fija al empezar el recorrido
+      state = json.loads(next_token) if next_token else {'watermark': safe_watermark(), 'startKey': None}
+      items, start_key = store.query_by_user(user_id, limit=limit, start_key=state['startKey'], descending=False)
+      return {
+        'statusCode': 200,
+        'body': json.dumps({
+          'items': items,
+          'deleted': [],
+          'watermark': state['watermark'],
+          'hasMore': bool(start_key),
+          'nextToken': json.dumps({'watermark': state['watermark'], 'startKey': start_key}) if start_key else None
+        }, cls=DecimalEncoder)
+      }
+
+    if watermark_expired(since):
+      # Los tombstones ya caducaron: el cliente debe empezar de cero
+      return {
+        'statusCode': 200,
+        'body': json.dumps({
+          'items': [],
+          'deleted': [],
+          'watermark': None,
+          'hasMore': False,
+          'fullResync': True
+        })
+      }
+
+    # Cambios y borrados llegan ordenados por syncKey; se mezclan y se
+    # devuelven los primeros limit. Las páginas siguientes mantienen since y
+    # continúan desde el nextToken
+    after = json.loads(next_token)['after'] if next_token else since
+    changes = sync_log.query_changes(user_id, after, limit + 1)
+    tombstones = sync_log.query_tombstones(user_id, after, limit + 1)
+    entries = sorted(
+      [(item['syncKey'], False, item) for item in changes] +
+      [(item['syncKey'], True, item) for item in tombstones],
+      key=lambda entry: entry[0]
+    )
+    has_more = len(entries) > limit
+    page = entries[:limit]
+    last_key = page[-1][0] if page else after
+
+    # La marca solo se entrega en la última página y nunca más allá de las
+    # escrituras que aún pueden estar en vuelo: el nextToken no lo está
+    if has_more:
+      watermark = None
+    else:
+      watermark = min(last_key, max(since, safe_watermark()))
+
+    return {
+      'statusCode': 200,
+      'body': json.dumps({
+        'items': [item for _, deleted, item in page if not deleted],
+        'deleted': [item['reminderId'] for _, deleted, item in page if deleted],
+        'watermark': watermark,
+        'hasMore': has_more,
+        'nextToken': json.dumps({'after': last_key}) if has_more else None
+      }, cls=DecimalEncoder)
+    }
+
+  except Exception as err:
+    print(f"Error syncing reminders: {err}")
+    return {
+      'statusCode': 500,
+      'body': json.dumps({
+        'error': 'Could not sync reminders'
+      })
+    }
@@ -50,7 +50,7 @@ describe('createReminder', () => {
       reminderId: 'mocked-uuid',
       tile: testData.tile,
       description: testData.description,
-      triggerAt: testData.triggerAt,
+      triggerAt: Date.parse(testData.triggerAt),
       status: 'pending',
       notificationType: 'sms',
       metadata: { important: true }
@@ -83,7 +83,8 @@ describe('createReminder', () => {
   it('should return 400 when required fields are missing', async () => {
     const testCases = [
       { triggerAt: '2023-12-31T00:00:00Z' }, // missing tile
-      { tile: 'Test Reminder' } // missing triggerAt
+      { tile: 'Test Reminder' }, // missing triggerAt
+      { tile: 'Test Reminder', triggerAt: 'not-a-date' } // invalid triggerAt
     ];
 
     for (const testData of testCases) {
@@ -126,6 +127,23 @@ describe('createReminder', () => {
     });
   });
 
+  it('should store triggerAt as UTC epoch milliseconds', async () => {
+    const testCases = [
+      ['2023-12-31T00:00:00Z', 1703980800000],
+      ['2023-12-31T01:00:00+01:00', 1703980800000],
+      ['2023-12-31T00:00:00', 1703980800000],
+      [1703980800000, 1703980800000],
+      ['1703980800000', 1703980800000]
+    ];
+
+    ddbMock.on(PutCommand).resolves({});
+
+    for (const [triggerAt, expected] of testCases) {
+      const result = await createReminder(mockEvent({ tile: 'Test Reminder', triggerAt }));
+      expect(JSON.parse(result.body).triggerAt).toBe(expected);
+    }
+  });
+
   it('should use userId from authorizer claims', async () => {
     const testData = {
       tile: 'Test Reminder',
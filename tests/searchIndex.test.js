@@ -0,0 +1,54 @@
+// searchIndex.test.js
+const { tokenize, searchTerms, searchIndexRequests, writeSearchIndex } = require('../helpers/searchIndex');
+
+beforeEach(() => {
+  process.env.SEARCH_INDEX_TABLE = 'search-index';
+});
+
+describe('searchIndex', () => {
+  it('should tokenize lowercased text without accents', () => {
+    expect(tokenize('Reunión con el_equipo a las 10!')).toEqual(['reunion', 'con', 'el', 'equipo', 'las', '10']);
+    expect(tokenize(undefined)).toEqual([]);
+  });
+
+  it('should weight title tokens above description tokens', () => {
+    const terms = searchTerms({ tile: 'Comprar pan', description: 'pan integral' });
+    expect(terms).toEqual({ comprar: 3, pan: 4, integral: 1 });
+  });
+
+  it('should only write the difference between old and new items', () => {
+    const oldItem = { userId: 'user1', reminderId: 'rem1', tile: 'Comprar pan', description: 'pan' };
+    const newItem = { userId: 'user1', reminderId: 'rem1', tile: 'Comprar leche' };
+
+    const requests = searchIndexRequests(oldItem, newItem);
+
+    expect(requests).toEqual([
+      { DeleteRequest: { Key: { userId: 'user1', termKey: 'pan#rem1' } } },
+      {
+        PutRequest: {
+          Item: { userId: 'user1', termKey: 'leche#rem1', token: 'leche', reminderId: 'rem1', weight: 3 }
+        }
+      }
+    ]);
+  });
+
+  it('should batch writes in groups of 25', async () => {
+    const db = { batchWrite: jest.fn(() => ({ promise: () => Promise.resolve({}) })) };
+    const description = Array.from({ length: 30 }, (_, i) => `word${i}`).join(' ');
+
+    await writeSearchIndex(db, searchIndexRequests(null, { userId: 'user1', reminderId: 'rem1', description }));
+
+    expect(db.batchWrite).toHaveBeenCalledTimes(2);
+    expect(db.batchWrite.mock.calls[0][0].RequestItems['search-index']).toHaveLength(25);
+    expect(db.batchWrite.mock.calls[1][0].RequestItems['search-index']).toHaveLength(5);
+  });
+
+  it('should skip writes when SEARCH_INDEX_TABLE is not set', async () => {
+    delete process.env.SEARCH_INDEX_TABLE;
+    const db = { batchWrite: jest.fn() };
+
+    await writeSearchIndex(db, searchIndexRequests(null, { userId: 'user1', reminderId: 'rem1', tile: 'Comprar pan' }));
+
+    expect(db.batchWrite).not.toHaveBeenCalled();
+  });
+});
@@ -0,0 +1,55 @@
+// summary.test.js
+const { recordTransition } = require('../helpers/summary');
+
+const mockDb = ({ summary = null, pending = [] } = {}) => {
+  const respond = (value) => ({ promise: () => Promise.resolve(value) });
+  return {
+    update: jest.fn(() => respond({})),
+    get: jest.fn(() => respond({ Item: summary })),
+    query: jest.fn(() => respond({ Items: pending })),
+  };
+};
+
+beforeEach(() => {
+  process.env.SUMMARY_TABLE = 'summary-table';
+});
+
+describe('recordTransition', () => {
+  it('should count a created reminder and offer its triggerAt as next due', async () => {
+    const db = mockDb();
+
+    await recordTransition(db, 'reminders-table', null, {
+      userId: 'user1', reminderId: 'rem1', status: 'pending', triggerAt: 1000
+    });
+
+    const [add, due] = db.update.mock.calls.map(call => call[0]);
+    expect(add.UpdateExpression).toBe('ADD #c0 :c0');
+    expect(add.ExpressionAttributeNames).toEqual({ '#c0': 'pendingCount' });
+    expect(add.ExpressionAttributeValues).toEqual({ ':c0': 1 });
+    expect(due.ConditionExpression).toBe('attribute_not_exists(nextDueAt) OR nextDueAt > :due');
+    expect(due.ExpressionAttributeValues).toEqual({ ':due': 1000 });
+    expect(db.get).not.toHaveBeenCalled();
+  });
+
+  it('should recompute next due when the earliest pending reminder is deleted', async () => {
+    const db = mockDb({ summary: { userId: 'user1', nextDueAt: 1000 }, pending: [{ triggerAt: 2000 }] });
+
+    await recordTransition(db, 'reminders-table', {
+      userId: 'user1', reminderId: 'rem1', status: 'pending', triggerAt: 1000
+    }, null);
+
+    expect(db.query.mock.calls[0][0].IndexName).toBe('UserTriggerIndex');
+    const replace = db.update.mock.calls[1][0];
+    expect(replace.ConditionExpression).toBe('nextDueAt = :old');
+    expect(replace.ExpressionAttributeValues).toEqual({ ':old': 1000, ':new': 2000 });
+  });
+
+  it('should skip writes when SUMMARY_TABLE is not set', async () => {
+    delete process.env.SUMMARY_TABLE;
+    const db = mockDb();
+
+    await recordTransition(db, 'reminders-table', null, { userId: 'user1', status: 'pending', triggerAt: 1000 });
+
+    expect(db.update).not.toHaveBeenCalled();
+  });
+});
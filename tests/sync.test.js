@@ -0,0 +1,42 @@
+// sync.test.js
+const { syncKey, tombstone, writeTombstones } = require('../helpers/sync');
+
+const mockDb = () => ({
+  batchWrite: jest.fn(() => ({ promise: () => Promise.resolve({}) })),
+});
+
+afterEach(() => {
+  delete process.env.TOMBSTONES_TABLE;
+});
+
+describe('tombstone', () => {
+  it('should key the tombstone by deletion time and reminderId', () => {
+    const item = tombstone('user1', 'rem1', '2026-01-01T00:00:00.000Z');
+
+    expect(item.syncKey).toBe(syncKey('2026-01-01T00:00:00.000Z', 'rem1'));
+    expect(item.syncKey).toBe('2026-01-01T00:00:00.000Z#rem1');
+    expect(item.expiresAt).toBeGreaterThan(Date.now() / 1000);
+  });
+});
+
+describe('writeTombstones', () => {
+  it('should write tombstones in batches of 25', async () => {
+    process.env.TOMBSTONES_TABLE = 'tombstones-table';
+    const db = mockDb();
+    const tombstones = Array.from({ length: 30 }, (_, i) => tombstone('user1', `rem${i}`));
+
+    await writeTombstones(db, tombstones);
+
+    expect(db.batchWrite).toHaveBeenCalledTimes(2);
+    expect(db.batchWrite.mock.calls[0][0].RequestItems['tombstones-table']).toHaveLength(25);
+    expect(db.batchWrite.mock.calls[1][0].RequestItems['tombstones-table']).toHaveLength(5);
+  });
+
+  it('should skip writes when TOMBSTONES_TABLE is not configured', async () => {
+    const db = mockDb();
+
+    await writeTombstones(db, [tombstone('user1', 'rem1')]);
+
+    expect(db.batchWrite).not.toHaveBeenCalled();
+  });
+});
@@ -0,0 +1,109 @@
+import unittest
+import os
+import json
+import boto3
+from moto import mock_dynamodb
+from migrations.backfill_trigger_at import backfill_trigger_at
+
+@mock_dynamodb
+class TestBackfillTriggerAt(unittest.TestCase):
+  def setUp(self):
+    # Configurar entorno para pruebas
+    os.environ['REMINDERS_TABLE'] = 'test-reminders'
+    os.environ['IF_OFFLINE'] = 'false'
+    os.environ['AWS_DEFAULT_REGION'] = 'us-east-1'
+    os.environ['AWS_ACCESS_KEY_ID'] = 'testing'
+    os.environ['AWS_SECRET_ACCESS_KEY'] = 'testing'
+    
+    # Crear tabla de DynamoDB mock
+    self.dynamodb = boto3.resource('dynamodb', region_name='us-east-1')
+    self.table = self.dynamodb.create_table(
+      TableName=os.environ['REMINDERS_TABLE'],
+      KeySchema=[
+        {'AttributeName': 'userId', 'KeyType': 'HASH'},
+        {'AttributeName': 'reminderId', 'KeyType': 'RANGE'}
+      ],
+      AttributeDefinitions=[
+        {'AttributeName': 'userId', 'AttributeType': 'S'},
+        {'AttributeName': 'reminderId', 'AttributeType': 'S'}
+      ],
+      ProvisionedThroughput={'ReadCapacityUnits': 1, 'WriteCapacityUnits': 1}
+    )
+    
+    # Insertar datos de prueba con formatos mezclados
+    self.test_reminders = [
+      {'userId': 'user1', 'reminderId': '1', 'triggerAt': '2023-12-31T00:00:00Z'},
+      {'userId': 'user1', 'reminderId': '2', 'triggerAt': '1703980800000'},
+      {'userId': 'user2', 'reminderId': '3', 'triggerAt': 1703980800000},
+      {'userId': 'user2', 'reminderId': '4', 'triggerAt': 'not-a-date'}
+    ]
+    for reminder in self.test_reminders:
+      self.table.put_item(Item=reminder)
+
+  def tearDown(self):
+    # Limpiar mocks
+    self.dynamodb = None
+    self.table = None
+
+  def get_trigger_at(self, user_id, reminder_id):
+    return self.table.get_item(
+      Key={'userId': user_id, 'reminderId': reminder_id}
+    )['Item']['triggerAt']
+
+  def test_backfill_converts_string_trigger_at(self):
+    # Ejecutar migración
+    response = backfill_trigger_at({'totalSegments': 1}, None)
+    
+    # Verificar respuesta
+    self.assertEqual(response['statusCode'], 200)
+    response_body = json.loads(response['body'])
+    self.assertTrue(response_body['done'])
+    self.assertEqual(response_body['updated'], 2)
+    self.assertEqual(response_body['invalid'], 1)
+    
+    # Verificar que todos los valores válidos son numéricos
+    self.assertEqual(self.get_trigger_at('user1', '1'), 1703980800000)
+    self.assertEqual(self.get_trigger_at('user1', '2'), 1703980800000)
+    self.assertEqual(self.get_trigger_at('user2', '3'), 1703980800000)
+    self.assertEqual(self.get_trigger_at('user2', '4'), 'not-a-date')
+
+  def test_backfill_parallel_segments(self):
+    # Ejecutar migración con varios segmentos en paralelo
+    response = backfill_trigger_at({'totalSegments': 4}, None)
+    
+    # Verificar respuesta
+    self.assertEqual(response['statusCode'], 200)
+    response_body = json.loads(response['body'])
+    self.assertTrue(response_body['done'])
+    self.assertEqual(sorted(response_body['segments']), ['0', '1', '2', '3'])
+    self.assertEqual(self.get_trigger_at('user1', '1'), 1703980800000)
+    self.assertEqual(self.get_trigger_at('user1', '2'), 1703980800000)
+
+  def test_backfill_is_resumable(self):
+    # Una página por invocación hasta completar todos los segmentos
+    event = {'totalSegments': 1, 'maxPagesPerSegment': 1}
+    for _ in range(10):
+      response = backfill_trigger_at(event, None)
+      self.assertEqual(response['statusCode'], 200)
+      event = json.loads(response['body'])
+      event['maxPagesPerSegment'] = 1
+      if event['done']:
+        break
+    
+    self.assertTrue(event['done'])
+    self.assertEqual(self.get_trigger_at('user1', '1'), 1703980800000)
+
+  def test_backfill_skips_completed_segments(self):
+    # Segmentos ya completados no se vuelven a escanear
+    response = backfill_trigger_at({
+      'totalSegments': 1,
+      'segments': {'0': 'done'}
+    }, None)
+    
+    response_body = json.loads(response['body'])
+    self.assertTrue(response_body['done'])
+    self.assertEqual(response_body['scanned'], 0)
+    self.assertEqual(self.get_trigger_at('user1', '1'), '2023-12-31T00:00:00Z')
+
+if __name__ == '__main__':
+  unittest.main()
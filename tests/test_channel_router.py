@@ -0,0 +1,152 @@
+import unittest
+import os
+import threading
+import unittest.mock
+from helpers.channel_router import channel_config, dispatch, route
+
+class TestChannelRouter(unittest.TestCase):
+  def setUp(self):
+    self.env = unittest.mock.patch.dict(os.environ, {
+      'EMAIL_SENDER': 'reminders@example.com',
+      'NOTIFICATION_TOPIC': 'arn:aws:sns:us-east-1:123456789012:test-topic'
+    })
+    self.env.start()
+    self.contacts = {
+      f'user{i}': {'userId': f'user{i}', 'email': f'user{i}@example.com', 'pushEndpointArn': f'arn:push:user{i}'}
+      for i in range(120)
+    }
+
+    # Clientes falsos: SES y SNS aceptan todo
+    self.ses = unittest.mock.MagicMock()
+    self.ses.send_bulk_templated_email.side_effect = lambda **params: {
+      'Status': [{'Status': 'Success'} for _ in params['Destinations']]
+    }
+    self.sns = unittest.mock.MagicMock()
+    self.sns.publish_batch.side_effect = lambda **params: {
+      'Successful': [{'Id': entry['Id']} for entry in params['PublishBatchRequestEntries']],
+      'Failed': []
+    }
+    self.clients = {'ses': self.ses, 'sns': self.sns}
+
+  def tearDown(self):
+    self.env.stop()
+
+  def reminders(self, count, channels):
+    return [
+      {'userId': f'user{i}', 'reminderId': str(i), 'title': f'Reminder {i}', 'notificationTypes': channels}
+      for i in range(count)
+    ]
+
+  def test_batches_per_channel(self):
+    delivered, failed, errors = dispatch(self.reminders(120, ['email', 'sms', 'push']), self.contacts, self.clients)
+
+    self.assertEqual(errors, [])
+    self.assertEqual(len(delivered), 120)
+    self.assertEqual(delivered[('user7', '7')], {'email', 'sms', 'push'})
+    # 50 destinos por envío masivo, 10 mensajes por PublishBatch, push de uno en uno
+    batches = [len(call.kwargs['Destinations']) for call in self.ses.send_bulk_templated_email.call_args_list]
+    self.assertEqual(sorted(batches), [20, 50, 50])
+    self.assertEqual(self.sns.publish_batch.call_count, 12)
+    self.assertEqual(self.sns.publish.call_count, 120)
+
+  def test_channel_config_from_environment(self):
+    os.environ['SMS_BATCH_SIZE'] = '5'
+    os.environ['SMS_CONCURRENCY'] = '2'
+    os.environ['EMAIL_BATCH_SIZE'] = '500'
+    self.assertEqual(channel_config('sms'), (5, 2))
+    # No se supera el límite de la API
+    self.assertEqual(channel_config('email'), (50, 4))
+
+    dispatch(self.reminders(12, ['sms']), self.contacts, self.clients)
+    self.assertEqual(self.sns.publish_batch.call_count, 3)
+
+  def test_slow_channel_does_not_block_others(self):
+    release = threading.Event()
+    lock = threading.Lock()
+    sent_sms = []
+    def slow_email(**params):
+      # El email espera hasta que todos los SMS hayan salido
+      release.wait(5)
+      return {'Status': [{'Status': 'Success'} for _ in params['Destinations']]}
+    def sms(**params):
+      entries = params['PublishBatchRequestEntries']
+      with lock:
+        sent_sms.extend(entries)
+        if len(sent_sms) == 50:
+          release.set()
+      return {'Successful': [{'Id': entry['Id']} for entry in entries]}
+    self.ses.send_bulk_templated_email.side_effect = slow_email
+    self.sns.publish_batch.side_effect = sms
+
+    reminders = self.reminders(100, ['email'])
+    for reminder in reminders[50:]:
+      reminder['notificationTypes'] = ['sms']
+    delivered, failed, errors = dispatch(reminders, self.contacts, self.clients)
+
+    self.assertTrue(release.is_set())
+    self.assertEqual(len(delivered), 100)
+
+  def test_partial_failures_stay_pending(self):
+    self.ses.send_bulk_templated_email.side_effect = lambda **params: {
+      'Status': [{'Status': 'Success'}] + [{'Status': 'MessageRejected', 'Error': 'rejected'} for _ in params['Destinations'][1:]]
+    }
+    self.sns.publish.side_effect = Exception('push down')
+
+    delivered, failed, errors = dispatch(
+      self.reminders(3, ['email']) + [{'userId': 'user9', 'reminderId': '9', 'title': 'Push', 'notificationTypes': ['push']}],
+      self.contacts,
+      self.clients
+    )
+
+    self.assertEqual(delivered, {('user0', '0'): {'email'}})
+    self.assertEqual(len(errors), 1)
+
+  def test_missing_contact_falls_back_to_topic(self):
+    reminders = [
+      {'userId': 'user1', 'reminderId': '1', 'title': 'Email', 'notificationType': 'email'},
+      {'userId': 'nobody', 'reminderId': '2', 'title': 'Email', 'notificationTypes': ['email', 'sms', 'push']}
+    ]
+
+    queues, failed = route(reminders, self.contacts)
+
+    self.assertEqual([(reminder['reminderId'], channel) for reminder, channel in queues['email']], [('1', 'email')])
+    self.assertEqual([(reminder['reminderId'], channel) for reminder, channel in queues['sms']], [('2', 'sms')])
+    self.assertEqual([(reminder['reminderId'], channel) for reminder, channel in queues['topic']], [('2', 'email'), ('2', 'push')])
+    self.assertEqual(failed, {})
+
+    delivered, failed, errors = dispatch(reminders, self.contacts, self.clients)
+    self.assertEqual(delivered, {('user1', '1'): {'email'}, ('nobody', '2'): {'email', 'sms', 'push'}})
+    topic_entries = [
+      entry
+      for call in self.sns.publish_batch.call_args_list
+      for entry in call.kwargs['PublishBatchRequestEntries']
+    ]
+    self.assertEqual(
+      sorted(entry['MessageAttributes']['notificationTypes']['StringValue'] for entry in topic_entries),
+      ['["email"]', '["push"]', '["sms"]']
+    )
+
+  def test_unknown_channel_is_never_delivered(self):
+    reminders = [
+      {'userId': 'user3', 'reminderId': '3', 'title': 'Fax', 'notificationTypes': ['email', 'fax']}
+    ]
+
+    delivered, failed, errors = dispatch(reminders, self.contacts, self.clients)
+
+    # El email sale, pero el recordatorio no se da por entregado
+    self.assertEqual(delivered, {('user3', '3'): {'email'}})
+    self.assertEqual(failed, {('user3', '3'): 'Unsupported channel fax'})
+    self.assertEqual(errors, [])
+
+  def test_route_skips_delivered_channels(self):
+    reminders = [
+      {'userId': 'user1', 'reminderId': '1', 'title': 'Retry', 'notificationTypes': ['email', 'sms'], 'deliveredChannels': ['sms']}
+    ]
+
+    queues, failed = route(reminders, self.contacts)
+
+    self.assertEqual([channel for _, channel in queues['email']], ['email'])
+    self.assertEqual(queues['sms'], [])
+
+if __name__ == '__main__':
+  unittest.main()
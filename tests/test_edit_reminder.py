@@ -2,31 +2,24 @@
 import unittest
 import os
 import json
-import boto3
-from moto import mock_dynamodb
-from botocore.exceptions import ClientError
-from ..edit import edit_reminder
+import tempfile
+import unittest.mock
+from botocore.exceptions import ClientError, EndpointConnectionError
+from edit.edit_reminder import edit_reminder
+from store.reminder_store import get_reminder_store, reset_reminder_stores
 
 class TestEditReminder(unittest.TestCase):
   def setUp(self):
-    # Configurar entorno para pruebas
-    os.environ['REMINDERS_TABLE'] = 'test-reminders'
-    os.environ['IF_OFFLINE'] = 'false'
-    
-    # Crear tabla de DynamoDB mock
-    self.dynamodb = boto3.resource('dynamodb', region_name='us-east-1')
-    self.table = self.dynamodb.create_table(
-      TableName=os.environ['REMINDERS_TABLE'],
-      KeySchema=[
-        {'AttributeName': 'userId', 'KeyType': 'HASH'},
-        {'AttributeName': 'reminderId', 'KeyType': 'RANGE'}
-      ],
-      AttributeDefinitions=[
-        {'AttributeName': 'userId', 'AttributeType': 'S'},
-        {'AttributeName': 'reminderId', 'AttributeType': 'S'}
-      ],
-      ProvisionedThroughput={'ReadCapacityUnits': 1, 'WriteCapacityUnits': 1}
-    )
+    # Configurar entorno para pruebas: SQLite embebido, sin red
+    self.tmpdir = tempfile.TemporaryDirectory()
+    self.env = unittest.mock.patch.dict(os.environ, {
+      'REMINDER_STORE': 'sqlite',
+      'SQLITE_PATH': os.path.join(self.tmpdir.name, 'reminders.db'),
+      'REMINDERS_TABLE': 'test-reminders',
+      'IF_OFFLINE': 'false'
+    })
+    self.env.start()
+    self.store = get_reminder_store()
       
     # Insertar datos de prueba
     self.test_reminder = {
@@ -37,7 +30,7 @@ class TestEditReminder(unittest.TestCase):
       'triggerAt': '2023-01-01T00:00:00Z',
       'status': 'pending'
     }
-    self.table.put_item(Item=self.test_reminder)
+    self.store.batch_write(put_items=[self.test_reminder])
     
     # Mock event base
     self.base_event = {
@@ -55,9 +48,10 @@ class TestEditReminder(unittest.TestCase):
     }
 
   def tearDown(self):
-    # Limpiar mocks
-    self.dynamodb = None
-    self.table = None
+    # Limpiar store y entorno
+    reset_reminder_stores()
+    self.env.stop()
+    self.tmpdir.cleanup()
 
   def test_edit_title_successfully(self):
     # Configurar evento
@@ -73,10 +67,8 @@ class TestEditReminder(unittest.TestCase):
     self.assertEqual(response_body['title'], 'New Title')
     self.assertEqual(response_body['description'], 'Original Description')
     
-    # Verificar que se actualizó en DynamoDB
-    item = self.table.get_item(
-      Key={'userId': 'test-user', 'reminderId': '123'}
-    ).get('Item')
+    # Verificar que se actualizó en el store
+    item = self.store.get('test-user', '123')
     self.assertEqual(item['title'], 'New Title')
 
   def test_edit_multiple_fields(self):
@@ -96,7 +88,33 @@ class TestEditReminder(unittest.TestCase):
     response_body = json.loads(response['body'])
     self.assertEqual(response_body['title'], 'New Title')
     self.assertEqual(response_body['description'], 'New Description')
-    self.assertEqual(response_body['triggerAt'], '2023-12-31T00:00:00Z')
+    self.assertEqual(response_body['triggerAt'], 1703980800000)
+
+  def test_trigger_at_normalized_to_epoch_ms(self):
+    # Configurar evento con zona horaria distinta de UTC
+    event = self.base_event.copy()
+    event['body'] = json.dumps({'triggerAt': '2023-12-31T01:00:00+01:00'})
+    
+    # Ejecutar función
+    response = edit_reminder(event, None)
+    
+    # Verificar que se guardó como número en milisegundos UTC
+    self.assertEqual(response['statusCode'], 200)
+    item = self.store.get('test-user', '123')
+    self.assertEqual(item['triggerAt'], 1703980800000)
+
+  def test_invalid_trigger_at(self):
+    # Configurar evento
+    event = self.base_event.copy()
+    event['body'] = json.dumps({'triggerAt': 'not-a-date'})
+    
+    # Ejecutar función
+    response = edit_reminder(event, None)
+    
+    # Verificar respuesta
+    self.assertEqual(response['statusCode'], 400)
+    response_body = json.loads(response['body'])
+    self.assertEqual(response_body['error'], 'Invalid triggerAt')
 
   def test_no_fields_to_update(self):
     # Configurar evento
@@ -140,28 +158,34 @@ class TestEditReminder(unittest.TestCase):
     self.assertEqual(response_body['error'], 'Could not edit reminder')
 
   def test_offline_mode(self):
-    # Configurar entorno offline
+    # Configurar entorno offline (DynamoDB Local)
+    os.environ['REMINDER_STORE'] = 'dynamodb'
     os.environ['IF_OFFLINE'] = 'true'
     
     # Configurar evento
     event = self.base_event.copy()
     event['body'] = json.dumps({'title': 'Offline Title'})
-    
-    # Ejecutar función
-    response = edit_reminder(event, None)
+
+    with unittest.mock.patch('boto3.session.Session') as mock_session:
+      mock_resource = mock_session.return_value.resource
+      mock_resource.return_value.Table.return_value.update_item.side_effect = EndpointConnectionError(
+        endpoint_url='http://localhost:8000'
+      )
+      
+      # Ejecutar función
+      response = edit_reminder(event, None)
     
     # Verificar que intentó usar DynamoDB local
-    self.assertEqual(response['statusCode'], 500)  # Fallará porque no hay DynamoDB local
+    mock_resource.assert_called_with('dynamodb', endpoint_url='http://localhost:8000')
+    self.assertEqual(response['statusCode'], 500)
 
   def test_dynamodb_error(self):
-    # Simular error de DynamoDB
-    with unittest.mock.patch('boto3.resource') as mock_resource:
-      mock_table = unittest.mock.MagicMock()
-      mock_table.update_item.side_effect = ClientError(
+    # Simular error del store
+    with unittest.mock.patch('edit.edit_reminder.get_reminder_store') as mock_store:
+      mock_store.return_value.update.side_effect = ClientError(
         {'Error': {'Code': '500', 'Message': 'Internal Server Error'}}, 
         'UpdateItem'
       )
-      mock_resource.return_value.Table.return_value = mock_table
       
       # Configurar evento
       event = self.base_event.copy()
@@ -2,30 +2,24 @@
 import unittest
 import os
 import json
-import boto3
-from botocore.exceptions import ClientError
-from list import list_reminders
+import tempfile
+import unittest.mock
+from botocore.exceptions import ClientError, EndpointConnectionError
+from list.list_reminders import list_reminders
+from store.reminder_store import get_reminder_store, reset_reminder_stores
 
 class TestListReminders(unittest.TestCase):
   def setUp(self):
-    # Configurar entorno para pruebas
-    os.environ['REMINDERS_TABLE'] = 'test-reminders'
-    os.environ['IF_OFFLINE'] = 'false'
-    
-    # Crear tabla de DynamoDB mock
-    self.dynamodb = boto3.resource('dynamodb', region_name='us-east-1')
-    self.table = self.dynamodb.create_table(
-      TableName=os.environ['REMINDERS_TABLE'],
-      KeySchema=[
-          {'AttributeName': 'userId', 'KeyType': 'HASH'},
-          {'AttributeName': 'reminderId', 'KeyType': 'RANGE'}
-      ],
-      AttributeDefinitions=[
-          {'AttributeName': 'userId', 'AttributeType': 'S'},
-          {'AttributeName': 'reminderId', 'AttributeType': 'S'}
-      ],
-      ProvisionedThroughput={'ReadCapacityUnits': 1, 'WriteCapacityUnits': 1}
-    )
+    # Configurar entorno para pruebas: SQLite embebido, sin red
+    self.tmpdir = tempfile.TemporaryDirectory()
+    self.env = unittest.mock.patch.dict(os.environ, {
+      'REMINDER_STORE': 'sqlite',
+      'SQLITE_PATH': os.path.join(self.tmpdir.name, 'reminders.db'),
+      'REMINDERS_TABLE': 'test-reminders',
+      'IF_OFFLINE': 'false'
+    })
+    self.env.start()
+    self.store = get_reminder_store()
     
     # Insertar datos de prueba
     self.test_user_id = 'test-user'
@@ -50,8 +44,7 @@ class TestListReminders(unittest.TestCase):
       }
     ]
     
-    for reminder in self.test_reminders:
-      self.table.put_item(Item=reminder)
+    self.store.batch_write(put_items=self.test_reminders)
     
     # Mock event base
     self.base_event = {
@@ -66,9 +59,10 @@ class TestListReminders(unittest.TestCase):
     }
 
   def tearDown(self):
-    # Limpiar mocks
-    self.dynamodb = None
-    self.table = None
+    # Limpiar store y entorno
+    reset_reminder_stores()
+    self.env.stop()
+    self.tmpdir.cleanup()
 
   def test_list_reminders_successfully(self):
     # Ejecutar función
@@ -140,24 +134,29 @@ class TestListReminders(unittest.TestCase):
     self.assertIsNone(response_body.get('nextToken'))
 
   def test_offline_mode(self):
-    # Configurar entorno offline
+    # Configurar entorno offline (DynamoDB Local)
+    os.environ['REMINDER_STORE'] = 'dynamodb'
     os.environ['IF_OFFLINE'] = 'true'
-    
-    # Ejecutar función
-    response = list_reminders(self.base_event, None)
+    with unittest.mock.patch('boto3.session.Session') as mock_session:
+      mock_resource = mock_session.return_value.resource
+      mock_resource.return_value.Table.return_value.query.side_effect = EndpointConnectionError(
+        endpoint_url='http://localhost:8000'
+      )
+      
+      # Ejecutar función
+      response = list_reminders(self.base_event, None)
     
     # Verificar que intentó usar DynamoDB local
-    self.assertEqual(response['statusCode'], 500)  # Fallará porque no hay DynamoDB local
+    mock_resource.assert_called_with('dynamodb', endpoint_url='http://localhost:8000')
+    self.assertEqual(response['statusCode'], 500)
 
   def test_dynamodb_error(self):
-    # Simular error de DynamoDB
-    with unittest.mock.patch('boto3.resource') as mock_resource:
-      mock_table = unittest.mock.MagicMock()
-      mock_table.query.side_effect = ClientError(
+    # Simular error del store
+    with unittest.mock.patch('list.list_reminders.get_reminder_store') as mock_store:
+      mock_store.return_value.query_by_user.side_effect = ClientError(
         {'Error': {'Code': '500', 'Message': 'Internal Server Error'}}, 
         'Query'
       )
-      mock_resource.return_value.Table.return_value = mock_table
       
       # Ejecutar función
       response = list_reminders(self.base_event, None)
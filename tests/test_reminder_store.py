@@ -0,0 +1,379 @@
+import unittest
+import os
+import tempfile
+import boto3
+import unittest.mock
+from abc import ABC, abstractmethod
+from moto import mock_dynamodb
+from store.reminder_store import (
+  ConditionFailedError,
+  ReminderStore,
+  get_reminder_store,
+  get_search_index,
+  get_summary_store,
+  get_sync_log,
+  reset_reminder_stores
+)
+from store.dynamodb_store import DynamoDBReminderStore, DynamoDBSearchIndex, DynamoDBSummaryStore, DynamoDBSyncLog
+from store.sqlite_store import SQLiteReminderStore
+
+class ReminderStoreContract(ABC):
+  # Casos comunes que deben cumplir todos los backends
+
+  @abstractmethod
+  def make_backend(self):
+    # {'reminders', 'search', 'summary', 'sync'}, como _get_backend
+    pass
+
+  def setUp(self):
+    backend = self.make_backend()
+    self.store = backend['reminders']
+    self.search_index = backend['search']
+    self.summaries = backend['summary']
+    self.sync_log = backend['sync']
+    self.test_reminders = [
+      {'userId': 'user1', 'reminderId': '1', 'title': 'Past', 'triggerAt': 1000, 'status': 'pending'},
+      {'userId': 'user1', 'reminderId': '2', 'title': 'Now', 'triggerAt': 2000, 'status': 'pending'},
+      {'userId': 'user1', 'reminderId': '3', 'title': 'Future', 'triggerAt': 9000, 'status': 'pending'},
+      {'userId': 'user2', 'reminderId': '4', 'title': 'Sent', 'triggerAt': 1000, 'status': 'sent'},
+      {'userId': 'user2', 'reminderId': '5', 'title': 'Other', 'triggerAt': 1500, 'status': 'pending'}
+    ]
+    self.store.batch_write(put_items=self.test_reminders)
+
+  def test_get(self):
+    item = self.store.get('user1', '2')
+    self.assertEqual(item['title'], 'Now')
+    self.assertEqual(item['triggerAt'], 2000)
+    self.assertIsNone(self.store.get('user1', 'missing'))
+
+  def test_query_by_user_paginates_descending(self):
+    pages = []
+    start_key = None
+    while True:
+      page, start_key = self.store.query_by_user('user1', limit=2, start_key=start_key)
+      pages.append([item['reminderId'] for item in page])
+      if not start_key:
+        break
+
+    self.assertEqual(len(pages), 2)
+    for page in pages:
+      self.assertEqual(page, sorted(page, reverse=True))
+    self.assertEqual(sorted(sum(pages, [])), ['1', '2', '3'])
+
+  def test_query_due(self):
+    items = []
+    start_key = None
+    while True:
+      page, start_key = self.store.query_due(2000, limit=1, start_key=start_key)
+      items.extend(page)
+      if not start_key:
+        break
+    self.assertEqual(sorted(item['reminderId'] for item in items), ['1', '2', '5'])
+
+  def test_conditional_update(self):
+    old_item, item = self.store.update('user1', '1', {'status': 'sent'}, expected={'status': 'pending'})
+    self.assertEqual(old_item['status'], 'pending')
+    self.assertEqual(item['status'], 'sent')
+    self.assertEqual(item['title'], 'Past')
+    self.assertEqual(self.store.get('user1', '1')['status'], 'sent')
+
+    with self.assertRaises(ConditionFailedError):
+      self.store.update('user1', '1', {'status': 'sent'}, expected={'status': 'pending'})
+    with self.assertRaises(ConditionFailedError):
+      self.store.update('user1', 'missing', {'title': 'New'})
+
+  def test_search_terms(self):
+    self.search_index.put_search_terms('user1', '1', {'pan': 3, 'panaderia': 1})
+    self.search_index.put_search_terms('user1', '2', {'pan': 1, 'leche': 3})
+    self.search_index.put_search_terms('user2', '3', {'pan': 3})
+
+    self.assertEqual(
+      sorted(self.search_index.query_search_terms('user1', 'pan')),
+      [('pan', '1', 3), ('pan', '2', 1), ('panaderia', '1', 1)]
+    )
+    self.assertEqual(self.search_index.query_search_terms('user1', 'queso'), [])
+
+    self.search_index.put_search_terms('user1', '1', {'pan': 5})
+    self.search_index.delete_search_terms('user1', '1', ['panaderia'])
+    self.assertEqual(
+      sorted(self.search_index.query_search_terms('user1', 'pan')),
+      [('pan', '1', 5), ('pan', '2', 1)]
+    )
+
+  def test_scan(self):
+    items = []
+    start_key = None
+    while True:
+      page, start_key = self.summaries.scan(start_key=start_key, limit=2)
+      items.extend(page)
+      if not start_key:
+        break
+    self.assertEqual(sorted(item['reminderId'] for item in items), ['1', '2', '3', '4', '5'])
+
+  def test_next_pending_trigger_at(self):
+    self.assertEqual(self.summaries.next_pending_trigger_at('user1'), 1000)
+    self.assertEqual(self.summaries.next_pending_trigger_at('user1', after=1001), 2000)
+    self.assertIsNone(self.summaries.next_pending_trigger_at('user1', after=9001))
+    self.assertEqual(self.summaries.next_pending_trigger_at('user2'), 1500)
+
+  def test_summary(self):
+    self.assertIsNone(self.summaries.get_summary('user1'))
+
+    self.summaries.adjust_summary('user1', {'pending': 2}, due_candidate=2000)
+    self.summaries.adjust_summary('user1', {'pending': 1}, due_candidate=1000)
+    self.summaries.adjust_summary('user1', {'pending': -1, 'sent': 1}, due_candidate=3000)
+    self.assertEqual(self.summaries.get_summary('user1'), {
+      'userId': 'user1',
+      'counts': {'pending': 2, 'sent': 1},
+      'nextDueAt': 1000
+    })
+
+    self.assertFalse(self.summaries.replace_next_due('user1', 2000, 5000))
+    self.assertTrue(self.summaries.replace_next_due('user1', 1000, 2000))
+    self.assertEqual(self.summaries.get_summary('user1')['nextDueAt'], 2000)
+    self.assertTrue(self.summaries.replace_next_due('user1', 2000, None))
+    self.assertIsNone(self.summaries.get_summary('user1')['nextDueAt'])
+
+    self.summaries.put_summary({'userId': 'user2', 'counts': {'sent': 4}, 'nextDueAt': None})
+    user_ids = []
+    start_key = None
+    while True:
+      page, start_key = self.summaries.scan_summaries(start_key=start_key, limit=1)
+      user_ids.extend(summary['userId'] for summary in page)
+      if not start_key:
+        break
+    self.assertEqual(sorted(user_ids), ['user1', 'user2'])
+    self.assertEqual(self.summaries.get_summary('user2')['counts'], {'sent': 4})
+
+  def test_replace_summary_is_conditional(self):
+    repaired = {'userId': 'user3', 'counts': {'pending': 1}, 'nextDueAt': 1000}
+    self.summaries.replace_summary(repaired, None)
+    with self.assertRaises(ConditionFailedError):
+      self.summaries.replace_summary(repaired, None)
+
+    stored = self.summaries.get_summary('user3')
+    # Una transición concurrente cambia el resumen después de leerlo
+    self.summaries.adjust_summary('user3', {'pending': -1, 'sent': 1})
+    with self.assertRaises(ConditionFailedError):
+      self.summaries.replace_summary({'userId': 'user3', 'counts': {'pending': 5}, 'nextDueAt': 1000}, stored)
+
+    stored = self.summaries.get_summary('user3')
+    self.summaries.replace_summary({'userId': 'user3', 'counts': {'sent': 1}, 'nextDueAt': None}, stored)
+    self.assertEqual(self.summaries.get_summary('user3'), {'userId': 'user3', 'counts': {'sent': 1}, 'nextDueAt': None})
+
+  def test_changes_and_tombstones(self):
+    self.store.batch_write(put_items=[
+      {'userId': 'user3', 'reminderId': 'a', 'syncKey': '2026-01-01T00:00:00.000Z#a'},
+      {'userId': 'user3', 'reminderId': 'b', 'syncKey': '2026-01-03T00:00:00.000Z#b'},
+      {'userId': 'user3', 'reminderId': 'c', 'syncKey': '2026-01-02T00:00:00.000Z#c'}
+    ])
+    changes = self.sync_log.query_changes('user3', '2026-01-01T00:00:00.000Z#a', 10)
+    self.assertEqual([item['reminderId'] for item in changes], ['c', 'b'])
+    self.assertEqual(len(self.sync_log.query_changes('user3', '', 1)), 1)
+    # Los recordatorios sin syncKey no aparecen en el índice de cambios
+    self.assertEqual(self.sync_log.query_changes('user1', '', 10), [])
+
+    self.sync_log.put_tombstones([
+      {'userId': 'user3', 'reminderId': 'd', 'syncKey': '2026-01-05T00:00:00.000Z#d'},
+      {'userId': 'user3', 'reminderId': 'e', 'syncKey': '2026-01-04T00:00:00.000Z#e'}
+    ])
+    tombstones = self.sync_log.query_tombstones('user3', '2026-01-04T00:00:00.000Z#', 10)
+    self.assertEqual([item['reminderId'] for item in tombstones], ['e', 'd'])
+    self.assertEqual(self.sync_log.query_tombstones('user1', '', 10), [])
+
+  def test_batch_write_deletes(self):
+    self.store.batch_write(delete_keys=[
+      {'userId': 'user1', 'reminderId': '1'},
+      {'userId': 'user2', 'reminderId': '4'}
+    ])
+    self.assertIsNone(self.store.get('user1', '1'))
+    self.assertIsNone(self.store.get('user2', '4'))
+    self.assertIsNotNone(self.store.get('user1', '2'))
+
+class TestSQLiteReminderStore(ReminderStoreContract, unittest.TestCase):
+  def make_backend(self):
+    store = SQLiteReminderStore(':memory:')
+    self.addCleanup(store.close)
+    return {'reminders': store, 'search': store, 'summary': store, 'sync': store}
+
+class TestGetReminderStore(unittest.TestCase):
+  def setUp(self):
+    self.tmpdir = tempfile.TemporaryDirectory()
+    self.env = unittest.mock.patch.dict(os.environ, {
+      'REMINDER_STORE': 'sqlite',
+      'SQLITE_PATH': os.path.join(self.tmpdir.name, 'reminders.db')
+    })
+    self.env.start()
+
+  def tearDown(self):
+    reset_reminder_stores()
+    self.env.stop()
+    self.tmpdir.cleanup()
+
+  def test_store_is_cached_per_process(self):
+    store = get_reminder_store()
+    store.batch_write(put_items=[{'userId': 'user1', 'reminderId': '1', 'status': 'pending'}])
+    self.assertIs(get_reminder_store(), store)
+    self.assertIsNotNone(get_reminder_store().get('user1', '1'))
+
+  def test_sqlite_serves_every_interface(self):
+    store = get_reminder_store()
+    self.assertIs(get_search_index(), store)
+    self.assertIs(get_summary_store(), store)
+    self.assertIs(get_sync_log(), store)
+
+  def test_sqlite_defaults_to_file(self):
+    del os.environ['SQLITE_PATH']
+    with unittest.mock.patch('store.sqlite_store.SQLiteReminderStore') as mock_store:
+      get_reminder_store()
+    mock_store.assert_called_once_with('reminders.db')
+
+  def test_incomplete_backend_fails_on_creation(self):
+    class IncompleteStore(ReminderStore):
+      def get(self, user_id, reminder_id):
+        return None
+
+    with self.assertRaises(TypeError):
+      IncompleteStore()
+
+  def test_reminder_store_does_not_require_feature_interfaces(self):
+    # Un backend solo de recordatorios no implementa búsqueda, resumen ni
+    # sincronización
+    class MinimalStore(ReminderStore):
+      def get(self, user_id, reminder_id):
+        return None
+
+      def query_by_user(self, user_id, limit=10, start_key=None, descending=True):
+        return [], None
+
+      def query_due(self, now, limit=None, start_key=None):
+        return [], None
+
+      def update(self, user_id, reminder_id, changes, expected=None):
+        raise ConditionFailedError(reminder_id)
+
+      def batch_write(self, put_items=(), delete_keys=()):
+        pass
+
+    self.assertIsNone(MinimalStore().get('user1', '1'))
+
+  def test_unsupported_backend(self):
+    os.environ['REMINDER_STORE'] = 'redis'
+    with self.assertRaises(ValueError):
+      get_reminder_store()
+
+class TestDynamoDBReminderStore(ReminderStoreContract, unittest.TestCase):
+  def make_backend(self):
+    env = unittest.mock.patch.dict(os.environ, {
+      'AWS_DEFAULT_REGION': 'us-east-1',
+      'AWS_ACCESS_KEY_ID': 'testing',
+      'AWS_SECRET_ACCESS_KEY': 'testing'
+    })
+    env.start()
+    self.addCleanup(env.stop)
+    self.mock = mock_dynamodb()
+    self.mock.start()
+    self.addCleanup(self.mock.stop)
+    dynamodb = boto3.resource('dynamodb', region_name='us-east-1')
+    table = dynamodb.create_table(
+      TableName='test-reminders',
+      KeySchema=[
+        {'AttributeName': 'userId', 'KeyType': 'HASH'},
+        {'AttributeName': 'reminderId', 'KeyType': 'RANGE'}
+      ],
+      AttributeDefinitions=[
+        {'AttributeName': 'userId', 'AttributeType': 'S'},
+        {'AttributeName': 'reminderId', 'AttributeType': 'S'},
+        {'AttributeName': 'triggerAt', 'AttributeType': 'N'},
+        {'AttributeName': 'status', 'AttributeType': 'S'},
+        {'AttributeName': 'syncKey', 'AttributeType': 'S'}
+      ],
+      GlobalSecondaryIndexes=[
+        {
+          'IndexName': 'TriggerTimeIndex',
+          'KeySchema': [
+            {'AttributeName': 'status', 'KeyType': 'HASH'},
+            {'AttributeName': 'triggerAt', 'KeyType': 'RANGE'}
+          ],
+          'Projection': {
+            'ProjectionType': 'ALL'
+          },
+          'ProvisionedThroughput': {
+            'ReadCapacityUnits': 1,
+            'WriteCapacityUnits': 1
+          }
+        },
+        {
+          'IndexName': 'UserSyncIndex',
+          'KeySchema': [
+            {'AttributeName': 'userId', 'KeyType': 'HASH'},
+            {'AttributeName': 'syncKey', 'KeyType': 'RANGE'}
+          ],
+          'Projection': {
+            'ProjectionType': 'ALL'
+          },
+          'ProvisionedThroughput': {
+            'ReadCapacityUnits': 1,
+            'WriteCapacityUnits': 1
+          }
+        },
+        {
+          'IndexName': 'UserTriggerIndex',
+          'KeySchema': [
+            {'AttributeName': 'userId', 'KeyType': 'HASH'},
+            {'AttributeName': 'triggerAt', 'KeyType': 'RANGE'}
+          ],
+          'Projection': {
+            'ProjectionType': 'ALL'
+          },
+          'ProvisionedThroughput': {
+            'ReadCapacityUnits': 1,
+            'WriteCapacityUnits': 1
+          }
+        }
+      ],
+      ProvisionedThroughput={'ReadCapacityUnits': 1, 'WriteCapacityUnits': 1}
+    )
+    search_table = dynamodb.create_table(
+      TableName='test-search-index',
+      KeySchema=[
+        {'AttributeName': 'userId', 'KeyType': 'HASH'},
+        {'AttributeName': 'termKey', 'KeyType': 'RANGE'}
+      ],
+      AttributeDefinitions=[
+        {'AttributeName': 'userId', 'AttributeType': 'S'},
+        {'AttributeName': 'termKey', 'AttributeType': 'S'}
+      ],
+      ProvisionedThroughput={'ReadCapacityUnits': 1, 'WriteCapacityUnits': 1}
+    )
+    summary_table = dynamodb.create_table(
+      TableName='test-summary',
+      KeySchema=[
+        {'AttributeName': 'userId', 'KeyType': 'HASH'}
+      ],
+      AttributeDefinitions=[
+        {'AttributeName': 'userId', 'AttributeType': 'S'}
+      ],
+      ProvisionedThroughput={'ReadCapacityUnits': 1, 'WriteCapacityUnits': 1}
+    )
+    tombstones_table = dynamodb.create_table(
+      TableName='test-tombstones',
+      KeySchema=[
+        {'AttributeName': 'userId', 'KeyType': 'HASH'},
+        {'AttributeName': 'syncKey', 'KeyType': 'RANGE'}
+      ],
+      AttributeDefinitions=[
+        {'AttributeName': 'userId', 'AttributeType': 'S'},
+        {'AttributeName': 'syncKey', 'AttributeType': 'S'}
+      ],
+      ProvisionedThroughput={'ReadCapacityUnits': 1, 'WriteCapacityUnits': 1}
+    )
+    return {
+      'reminders': DynamoDBReminderStore(table),
+      'search': DynamoDBSearchIndex(search_table),
+      'summary': DynamoDBSummaryStore(table, summary_table),
+      'sync': DynamoDBSyncLog(table, tombstones_table)
+    }
+
+if __name__ == '__main__':
+  unittest.main()
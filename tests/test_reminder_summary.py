@@ -0,0 +1,320 @@
+import unittest
+import os
+import json
+import tempfile
+import unittest.mock
+import boto3
+from moto import mock_dynamodb
+from edit.edit_reminder import edit_reminder
+from helpers.summary import record_transition
+from send.send_scheduled import send_scheduled_reminders
+from store.reminder_store import get_reminder_store, reset_reminder_stores
+from summary.get_user_summary import get_user_summary
+from summary.reconcile_summaries import _recompute, reconcile_summaries
+
+class TestReminderSummary(unittest.TestCase):
+  def setUp(self):
+    # Configurar entorno para pruebas: SQLite embebido, sin red
+    self.tmpdir = tempfile.TemporaryDirectory()
+    self.env = unittest.mock.patch.dict(os.environ, {
+      'REMINDER_STORE': 'sqlite',
+      'SQLITE_PATH': os.path.join(self.tmpdir.name, 'reminders.db'),
+      'NOTIFICATION_TOPIC': 'arn:aws:sns:us-east-1:123456789012:test-topic'
+    })
+    self.env.start()
+    self.store = get_reminder_store()
+    
+    # Insertar datos de prueba y registrarlos como lo haría createReminder
+    self.test_reminders = [
+      {'userId': 'test-user', 'reminderId': '1', 'title': 'Past', 'triggerAt': 1000, 'status': 'pending', 'notificationTypes': ['email']},
+      {'userId': 'test-user', 'reminderId': '2', 'title': 'Later', 'triggerAt': 32503680000000, 'status': 'pending', 'notificationTypes': ['email']},
+      {'userId': 'test-user', 'reminderId': '3', 'title': 'Done', 'triggerAt': 500, 'status': 'sent', 'notificationTypes': ['email']}
+    ]
+    self.store.batch_write(put_items=self.test_reminders)
+    for reminder in self.test_reminders:
+      record_transition(self.store, None, reminder)
+    
+    # Mock event base
+    self.base_event = {
+      'requestContext': {
+        'authorizer': {
+          'claims': {
+            'userId': 'test-user'
+          }
+        }
+      },
+      'pathParameters': {
+        'id': '1'
+      }
+    }
+
+  def tearDown(self):
+    # Limpiar store y entorno
+    reset_reminder_stores()
+    self.env.stop()
+    self.tmpdir.cleanup()
+
+  def get_summary(self):
+    response = get_user_summary(self.base_event, None)
+    self.assertEqual(response['statusCode'], 200)
+    return json.loads(response['body'])
+
+  def test_summary_after_create(self):
+    body = self.get_summary()
+    self.assertEqual(body['pending'], 2)
+    self.assertEqual(body['sent'], 1)
+    self.assertEqual(body['nextDueAt'], 1000)
+
+  def test_empty_summary(self):
+    event = dict(self.base_event, requestContext={'authorizer': {'claims': {'userId': 'empty-user'}}})
+    response = get_user_summary(event, None)
+    
+    body = json.loads(response['body'])
+    self.assertEqual(body['pending'], 0)
+    self.assertEqual(body['sent'], 0)
+    self.assertIsNone(body['nextDueAt'])
+
+  def test_edit_reschedules_next_due(self):
+    # Posponer el próximo vencimiento: pasa a serlo el siguiente pendiente
+    event = dict(self.base_event, body=json.dumps({'triggerAt': 32503690000000}))
+    self.assertEqual(edit_reminder(event, None)['statusCode'], 200)
+    self.assertEqual(self.get_summary()['nextDueAt'], 32503680000000)
+    
+    # Adelantarlo de nuevo
+    event = dict(self.base_event, body=json.dumps({'triggerAt': 2000}))
+    self.assertEqual(edit_reminder(event, None)['statusCode'], 200)
+    body = self.get_summary()
+    self.assertEqual(body['nextDueAt'], 2000)
+    self.assertEqual(body['pending'], 2)
+
+  def test_send_updates_counts(self):
+    # Sin USERS_TABLE el email se publica en el topic
+    with unittest.mock.patch('boto3.client') as client:
+      client.return_value.publish_batch.side_effect = lambda **params: {
+        'Successful': [{'Id': entry['Id']} for entry in params['PublishBatchRequestEntries']]
+      }
+      response = send_scheduled_reminders({}, None)
+    self.assertEqual(response['statusCode'], 200)
+    
+    body = self.get_summary()
+    self.assertEqual(body['pending'], 1)
+    self.assertEqual(body['sent'], 2)
+    self.assertEqual(body['nextDueAt'], 32503680000000)
+
+  def test_edit_uses_update_pre_image(self):
+    # El item anterior sale de update, sin una lectura aparte
+    event = dict(self.base_event, body=json.dumps({'title': 'Renamed', 'triggerAt': 2000}))
+    with unittest.mock.patch.object(self.store, 'get', side_effect=AssertionError('unexpected get')):
+      response = edit_reminder(event, None)
+
+    self.assertEqual(response['statusCode'], 200)
+    self.assertEqual(json.loads(response['body'])['title'], 'Renamed')
+    body = self.get_summary()
+    self.assertEqual(body['pending'], 2)
+    self.assertEqual(body['nextDueAt'], 2000)
+
+  def test_overlapping_send_counts_once(self):
+    # Otra ejecución marca el recordatorio como enviado mientras esta lo
+    # despacha: el cambio de estado falla y el resumen no se ajusta dos veces
+    def concurrent_dispatch(reminders, contacts, clients):
+      for reminder in reminders:
+        old_item, sent = self.store.update(
+          reminder['userId'], reminder['reminderId'], {'status': 'sent'}, expected={'status': 'pending'}
+        )
+        record_transition(self.store, old_item, sent)
+      return {(reminder['userId'], reminder['reminderId']): {'email'} for reminder in reminders}, {}, []
+
+    with unittest.mock.patch('boto3.client'), \
+         unittest.mock.patch('send.send_scheduled.dispatch', side_effect=concurrent_dispatch):
+      response = send_scheduled_reminders({}, None)
+
+    self.assertEqual(response['statusCode'], 200)
+    body = self.get_summary()
+    self.assertEqual(body['pending'], 1)
+    self.assertEqual(body['sent'], 2)
+
+  def test_delete_last_pending_clears_next_due(self):
+    for reminder in self.test_reminders:
+      self.store.batch_write(delete_keys=[{'userId': 'test-user', 'reminderId': reminder['reminderId']}])
+      record_transition(self.store, reminder, None)
+    
+    body = self.get_summary()
+    self.assertEqual(body['counts'], {'pending': 0, 'sent': 0})
+    self.assertIsNone(body['nextDueAt'])
+
+  def test_reconcile_repairs_drift(self):
+    # Simular deriva: contadores y vencimiento incorrectos, y un usuario huérfano
+    self.store.put_summary({'userId': 'test-user', 'counts': {'pending': 7}, 'nextDueAt': 5})
+    self.store.put_summary({'userId': 'ghost-user', 'counts': {'pending': 1}, 'nextDueAt': 5})
+    
+    response = reconcile_summaries({}, None)
+    
+    self.assertEqual(response['statusCode'], 200)
+    self.assertEqual(json.loads(response['body']), {
+      'phase': 'done',
+      'startKey': None,
+      'done': True,
+      'checked': 2,
+      'repaired': 2,
+      'conflicts': 0
+    })
+    body = self.get_summary()
+    self.assertEqual(body['pending'], 2)
+    self.assertEqual(body['sent'], 1)
+    self.assertEqual(body['nextDueAt'], 1000)
+    self.assertEqual(self.store.get_summary('ghost-user')['counts'], {})
+    
+    # Una segunda pasada no encuentra nada que reparar
+    response = reconcile_summaries({}, None)
+    self.assertEqual(json.loads(response['body'])['repaired'], 0)
+
+  def test_reconcile_selected_users(self):
+    self.store.put_summary({'userId': 'test-user', 'counts': {'pending': 7}, 'nextDueAt': 5})
+    
+    response = reconcile_summaries({'userIds': ['test-user']}, None)
+    
+    self.assertEqual(json.loads(response['body']), {'checked': 1, 'repaired': 1, 'conflicts': 0})
+    self.assertEqual(self.get_summary()['nextDueAt'], 1000)
+
+  def test_reconcile_resumes_from_returned_state(self):
+    # Un usuario con recordatorios pero sin resumen y otro con resumen huérfano
+    self.store.batch_write(put_items=[
+      {'userId': 'new-user', 'reminderId': '9', 'title': 'New', 'triggerAt': 3000, 'status': 'pending'}
+    ])
+    self.store.put_summary({'userId': 'ghost-user', 'counts': {'pending': 1}, 'nextDueAt': 5})
+
+    with unittest.mock.patch('summary.reconcile_summaries.SCAN_PAGE_SIZE', 1):
+      event = {'maxPages': 1}
+      invocations = 0
+      while True:
+        response = reconcile_summaries(event, None)
+        self.assertEqual(response['statusCode'], 200)
+        body = json.loads(response['body'])
+        invocations += 1
+        if body['done']:
+          break
+        event = dict(body, maxPages=1)
+
+    self.assertGreater(invocations, 2)
+    self.assertEqual(self.store.get_summary('ghost-user')['counts'], {})
+    self.assertEqual(self.store.get_summary('new-user'), {
+      'userId': 'new-user',
+      'counts': {'pending': 1},
+      'nextDueAt': 3000
+    })
+    self.assertEqual(self.get_summary()['counts'], {'pending': 2, 'sent': 1})
+
+  def test_reconcile_retries_when_summary_changes(self):
+    # Una transición concurrente ajusta el resumen entre la lectura y la
+    # reparación: la escritura condicional falla y se recalcula
+    self.store.put_summary({'userId': 'test-user', 'counts': {'pending': 7}, 'nextDueAt': 1000})
+    calls = []
+
+    def concurrent_recompute(store, user_id):
+      summary = _recompute(store, user_id)
+      if not calls:
+        old_item, sent = self.store.update('test-user', '2', {'status': 'sent'}, expected={'status': 'pending'})
+        record_transition(self.store, old_item, sent)
+      calls.append(user_id)
+      return summary
+
+    with unittest.mock.patch('summary.reconcile_summaries._recompute', side_effect=concurrent_recompute):
+      response = reconcile_summaries({'userIds': ['test-user']}, None)
+
+    self.assertEqual(json.loads(response['body']), {'checked': 1, 'repaired': 1, 'conflicts': 0})
+    self.assertEqual(len(calls), 2)
+    body = self.get_summary()
+    self.assertEqual(body['counts'], {'pending': 1, 'sent': 2})
+    self.assertEqual(body['nextDueAt'], 1000)
+
+class TestSummaryNotConfigured(unittest.TestCase):
+  def setUp(self):
+    # DynamoDB (moto, en proceso) sin SUMMARY_TABLE
+    self.env = unittest.mock.patch.dict(os.environ, {
+      'REMINDER_STORE': 'dynamodb',
+      'REMINDERS_TABLE': 'test-reminders',
+      'IF_OFFLINE': 'false',
+      'AWS_DEFAULT_REGION': 'us-east-1',
+      'AWS_ACCESS_KEY_ID': 'testing',
+      'AWS_SECRET_ACCESS_KEY': 'testing',
+      'NOTIFICATION_TOPIC': 'arn:aws:sns:us-east-1:123456789012:test-topic'
+    })
+    self.env.start()
+    os.environ.pop('SUMMARY_TABLE', None)
+    self.mock = mock_dynamodb()
+    self.mock.start()
+    self.table = boto3.resource('dynamodb', region_name='us-east-1').create_table(
+      TableName='test-reminders',
+      KeySchema=[
+        {'AttributeName': 'userId', 'KeyType': 'HASH'},
+        {'AttributeName': 'reminderId', 'KeyType': 'RANGE'}
+      ],
+      AttributeDefinitions=[
+        {'AttributeName': 'userId', 'AttributeType': 'S'},
+        {'AttributeName': 'reminderId', 'AttributeType': 'S'},
+        {'AttributeName': 'status', 'AttributeType': 'S'},
+        {'AttributeName': 'triggerAt', 'AttributeType': 'N'}
+      ],
+      GlobalSecondaryIndexes=[
+        {
+          'IndexName': 'TriggerTimeIndex',
+          'KeySchema': [
+            {'AttributeName': 'status', 'KeyType': 'HASH'},
+            {'AttributeName': 'triggerAt', 'KeyType': 'RANGE'}
+          ],
+          'Projection': {'ProjectionType': 'ALL'},
+          'ProvisionedThroughput': {'ReadCapacityUnits': 1, 'WriteCapacityUnits': 1}
+        }
+      ],
+      ProvisionedThroughput={'ReadCapacityUnits': 1, 'WriteCapacityUnits': 1}
+    )
+    for i in range(3):
+      self.table.put_item(Item={
+        'userId': 'test-user', 'reminderId': str(i), 'title': f'Reminder {i}',
+        'triggerAt': 1000 + i, 'status': 'pending', 'notificationTypes': ['sms']
+      })
+    self.base_event = {
+      'requestContext': {
+        'authorizer': {
+          'claims': {
+            'userId': 'test-user'
+          }
+        }
+      },
+      'pathParameters': {
+        'id': '0'
+      }
+    }
+
+  def tearDown(self):
+    reset_reminder_stores()
+    self.mock.stop()
+    self.env.stop()
+
+  def test_edit_reschedule_without_summary_table(self):
+    event = dict(self.base_event, body=json.dumps({'triggerAt': 5000}))
+    response = edit_reminder(event, None)
+    
+    self.assertEqual(response['statusCode'], 200)
+    self.assertEqual(json.loads(response['body'])['triggerAt'], 5000)
+
+  def test_send_without_summary_table(self):
+    sns = unittest.mock.MagicMock()
+    sns.publish_batch.side_effect = lambda **params: {
+      'Successful': [{'Id': entry['Id']} for entry in params['PublishBatchRequestEntries']]
+    }
+    with unittest.mock.patch('boto3.client', return_value=sns):
+      response = send_scheduled_reminders({}, None)
+    
+    self.assertEqual(response['statusCode'], 200)
+    self.assertEqual(response['body'], "Recordatorios procesados: 3")
+    for i in range(3):
+      item = self.table.get_item(Key={'userId': 'test-user', 'reminderId': str(i)})['Item']
+      self.assertEqual(item['status'], 'sent')
+
+  def test_summary_endpoints_report_missing_table(self):
+    self.assertEqual(get_user_summary(self.base_event, None)['statusCode'], 500)
+    self.assertEqual(reconcile_summaries({}, None)['statusCode'], 500)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,121 @@
+import unittest
+import os
+import json
+import tempfile
+import unittest.mock
+from edit.edit_reminder import edit_reminder
+from helpers.search_index import reindex, search_terms, tokenize
+from search.search_reminders import search_reminders
+from store.reminder_store import get_reminder_store, reset_reminder_stores
+
+class TestSearchReminders(unittest.TestCase):
+  def setUp(self):
+    # Configurar entorno para pruebas: SQLite embebido, sin red
+    self.tmpdir = tempfile.TemporaryDirectory()
+    self.env = unittest.mock.patch.dict(os.environ, {
+      'REMINDER_STORE': 'sqlite',
+      'SQLITE_PATH': os.path.join(self.tmpdir.name, 'reminders.db')
+    })
+    self.env.start()
+    self.store = get_reminder_store()
+    
+    # Insertar datos de prueba e indexarlos como lo haría createReminder
+    self.test_reminders = [
+      {'userId': 'test-user', 'reminderId': '1', 'tile': 'Comprar pan', 'description': 'En la panadería'},
+      {'userId': 'test-user', 'reminderId': '2', 'title': 'Reunión de equipo', 'description': 'Llevar pan'},
+      {'userId': 'test-user', 'reminderId': '3', 'title': 'Pagar factura', 'description': ''},
+      {'userId': 'other-user', 'reminderId': '4', 'title': 'Comprar pan', 'description': ''}
+    ]
+    self.store.batch_write(put_items=self.test_reminders)
+    for reminder in self.test_reminders:
+      reindex(self.store, None, reminder)
+    
+    # Mock event base
+    self.base_event = {
+      'requestContext': {
+        'authorizer': {
+          'claims': {
+            'userId': 'test-user'
+          }
+        }
+      },
+      'pathParameters': {
+        'id': '1'
+      },
+      'queryStringParameters': {}
+    }
+
+  def tearDown(self):
+    # Limpiar store y entorno
+    reset_reminder_stores()
+    self.env.stop()
+    self.tmpdir.cleanup()
+
+  def search(self, **params):
+    event = dict(self.base_event, queryStringParameters=params)
+    response = search_reminders(event, None)
+    self.assertEqual(response['statusCode'], 200)
+    return json.loads(response['body'])
+
+  def test_tokenize(self):
+    self.assertEqual(tokenize('Reunión con el_equipo a las 10!'), ['reunion', 'con', 'el', 'equipo', 'las', '10'])
+    self.assertEqual(search_terms({'tile': 'Comprar pan', 'description': 'pan integral'}), {
+      'comprar': 3, 'pan': 4, 'integral': 1
+    })
+
+  def test_ranked_results(self):
+    body = self.search(q='pan')
+    
+    # Título exacto > descripción exacta > prefijo en descripción
+    self.assertEqual([item['reminderId'] for item in body['items']], ['1', '2'])
+    self.assertGreater(body['items'][0]['score'], body['items'][1]['score'])
+    self.assertIsNone(body['nextToken'])
+
+  def test_prefix_matching(self):
+    body = self.search(q='reu')
+    self.assertEqual([item['reminderId'] for item in body['items']], ['2'])
+
+  def test_all_terms_must_match(self):
+    body = self.search(q='comprar pan')
+    self.assertEqual([item['reminderId'] for item in body['items']], ['1'])
+    body = self.search(q='comprar factura')
+    self.assertEqual(body['items'], [])
+
+  def test_pagination(self):
+    first_page = self.search(q='pan', limit='1')
+    self.assertEqual(len(first_page['items']), 1)
+    self.assertIsNotNone(first_page['nextToken'])
+    
+    second_page = self.search(q='pan', limit='1', nextToken=first_page['nextToken'])
+    self.assertEqual(len(second_page['items']), 1)
+    self.assertIsNone(second_page['nextToken'])
+    self.assertNotEqual(first_page['items'][0]['reminderId'], second_page['items'][0]['reminderId'])
+
+  def test_missing_query(self):
+    response = search_reminders(self.base_event, None)
+    
+    self.assertEqual(response['statusCode'], 400)
+    self.assertEqual(json.loads(response['body'])['error'], 'Missing search query')
+
+  def test_edit_updates_index(self):
+    event = dict(self.base_event, body=json.dumps({'title': 'Comprar leche'}))
+    response = edit_reminder(event, None)
+    self.assertEqual(response['statusCode'], 200)
+    
+    # "pan" solo sigue en la descripción del recordatorio 2 (y en "panadería")
+    self.assertEqual([item['reminderId'] for item in self.search(q='leche')['items']], ['1'])
+    body = self.search(q='pan')
+    self.assertEqual([item['reminderId'] for item in body['items']], ['2', '1'])
+    self.assertEqual(
+      sorted(token for token, reminder_id, _ in self.store.query_search_terms('test-user', '') if reminder_id == '1'),
+      ['comprar', 'en', 'la', 'leche', 'panaderia']
+    )
+
+  def test_deleted_reminder_is_skipped(self):
+    self.store.batch_write(delete_keys=[{'userId': 'test-user', 'reminderId': '1'}])
+    
+    body = self.search(q='pan')
+    self.assertEqual([item['reminderId'] for item in body['items']], ['2'])
+
+if __name__ == '__main__':
+  unittest.main()
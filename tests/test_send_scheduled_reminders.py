@@ -1,56 +1,84 @@
 import unittest
 import os
 import json
+import tempfile
+import unittest.mock
 import boto3
-from moto import mock_dynamodb, mock_sns
-from botocore.exceptions import ClientError
+from moto import mock_dynamodb, mock_ses, mock_sns
+from botocore.exceptions import ClientError, EndpointConnectionError
 from datetime import datetime, timedelta
 from freezegun import freeze_time
+from helpers.channel_router import send_sms_batch, send_topic_batch
 from send.send_scheduled import send_scheduled_reminders
+from store.reminder_store import get_reminder_store, reset_reminder_stores
 
 class TestSendScheduledReminders(unittest.TestCase):
   def setUp(self):
-    # Configurar entorno para pruebas
-    os.environ['REMINDERS_TABLE'] = 'test-reminders'
-    os.environ['NOTIFICATION_TOPIC'] = 'arn:aws:sns:us-east-1:123456789012:test-topic'
-    os.environ['IF_OFFLINE'] = 'false'
-    
-    # Crear tabla de DynamoDB mock
-    self.dynamodb = boto3.resource('dynamodb', region_name='us-east-1')
-    self.table = self.dynamodb.create_table(
-      TableName=os.environ['REMINDERS_TABLE'],
-      KeySchema=[
-        {'AttributeName': 'userId', 'KeyType': 'HASH'},
-        {'AttributeName': 'reminderId', 'KeyType': 'RANGE'}
-      ],
-      AttributeDefinitions=[
-        {'AttributeName': 'userId', 'AttributeType': 'S'},
-        {'AttributeName': 'reminderId', 'AttributeType': 'S'},
-        {'AttributeName': 'triggerAt', 'AttributeType': 'N'},
-        {'AttributeName': 'status', 'AttributeType': 'S'}
-      ],
-      GlobalSecondaryIndexes=[
-        {
-          'IndexName': 'TriggerTimeIndex',
-          'KeySchema': [
-            {'AttributeName': 'userId', 'KeyType': 'HASH'},
-            {'AttributeName': 'triggerAt', 'KeyType': 'RANGE'}
-          ],
-          'Projection': {
-            'ProjectionType': 'ALL'
-          },
-          'ProvisionedThroughput': {
-            'ReadCapacityUnits': 1,
-            'WriteCapacityUnits': 1
-          }
-        }
-      ],
-      ProvisionedThroughput={'ReadCapacityUnits': 1, 'WriteCapacityUnits': 1}
-    )
+    # Configurar entorno para pruebas: SQLite embebido, sin red
+    self.tmpdir = tempfile.TemporaryDirectory()
+    self.env = unittest.mock.patch.dict(os.environ, {
+      'REMINDER_STORE': 'sqlite',
+      'SQLITE_PATH': os.path.join(self.tmpdir.name, 'reminders.db'),
+      'REMINDERS_TABLE': 'test-reminders',
+      'IF_OFFLINE': 'false',
+      'AWS_DEFAULT_REGION': 'us-east-1',
+      'AWS_ACCESS_KEY_ID': 'testing',
+      'AWS_SECRET_ACCESS_KEY': 'testing',
+      'USERS_TABLE': 'test-users',
+      'EMAIL_SENDER': 'reminders@example.com',
+      'EMAIL_TEMPLATE': 'reminder'
+    })
+    self.env.start()
+    self.store = get_reminder_store()
     
-    # Crear topic SNS mock
+    # Crear topic SNS mock (moto, en proceso)
+    self.sns_mock = mock_sns()
+    self.sns_mock.start()
     self.sns = boto3.client('sns', region_name='us-east-1')
     self.topic_arn = self.sns.create_topic(Name='test-topic')['TopicArn']
+    os.environ['NOTIFICATION_TOPIC'] = self.topic_arn
+
+    # SES mock con remitente verificado y plantilla del envío masivo
+    self.ses_mock = mock_ses()
+    self.ses_mock.start()
+    self.ses = boto3.client('ses', region_name='us-east-1')
+    self.ses.verify_email_identity(EmailAddress='reminders@example.com')
+    self.ses.create_template(Template={
+      'TemplateName': 'reminder',
+      'SubjectPart': '{{subject}}',
+      'TextPart': '{{body}}'
+    })
+
+    # moto no devuelve el Status por destino de SendBulkTemplatedEmail
+    real_client = boto3.client
+    def client(name, *args, **kwargs):
+      client = real_client(name, *args, **kwargs)
+      if name == 'ses':
+        send_bulk = client.send_bulk_templated_email
+        def send_bulk_with_status(**params):
+          response = send_bulk(**params)
+          response.setdefault('Status', [{'Status': 'Success'} for _ in params['Destinations']])
+          return response
+        client.send_bulk_templated_email = send_bulk_with_status
+      return client
+    self.client_patch = unittest.mock.patch('boto3.client', side_effect=client)
+    self.client_patch.start()
+
+    # Tabla de usuarios con las direcciones de email
+    self.dynamodb_mock = mock_dynamodb()
+    self.dynamodb_mock.start()
+    users = boto3.resource('dynamodb', region_name='us-east-1').create_table(
+      TableName='test-users',
+      KeySchema=[{'AttributeName': 'userId', 'KeyType': 'HASH'}],
+      AttributeDefinitions=[{'AttributeName': 'userId', 'AttributeType': 'S'}],
+      ProvisionedThroughput={'ReadCapacityUnits': 1, 'WriteCapacityUnits': 1}
+    )
+    for user_id in ['user1', 'user2', 'user3', 'user4']:
+      users.put_item(Item={'userId': user_id, 'email': f'{user_id}@example.com'})
+    
+    # Congelar el reloj antes de calcular los tiempos de prueba
+    self.freezer = freeze_time(datetime.now())
+    self.freezer.start()
     
     # Insertar datos de prueba
     self.now = int(datetime.now().timestamp() * 1000)
@@ -96,20 +124,23 @@ class TestSendScheduledReminders(unittest.TestCase):
       }
     ]
     
-    for reminder in self.test_reminders:
-      self.table.put_item(Item=reminder)
+    self.store.batch_write(put_items=self.test_reminders)
     
     # Mock event y context (no se usan en la función pero son parámetros requeridos)
     self.mock_event = {}
     self.mock_context = {}
 
   def tearDown(self):
-    # Limpiar mocks
-    self.dynamodb = None
-    self.table = None
-    self.sns = None
+    # Limpiar mocks, store y entorno
+    self.freezer.stop()
+    self.client_patch.stop()
+    self.dynamodb_mock.stop()
+    self.ses_mock.stop()
+    self.sns_mock.stop()
+    reset_reminder_stores()
+    self.env.stop()
+    self.tmpdir.cleanup()
 
-  @freeze_time(datetime.now())
   def test_send_pending_reminders(self):
     # Ejecutar función
     response = send_scheduled_reminders(self.mock_event, self.mock_context)
@@ -120,33 +151,88 @@ class TestSendScheduledReminders(unittest.TestCase):
     
     # Verificar que se actualizó el estado a 'sent'
     for reminder in self.test_reminders[:2]:  # Solo los primeros 2 deberían haberse procesado
-      item = self.table.get_item(
-        Key={'userId': reminder['userId'], 'reminderId': reminder['reminderId']}
-      ).get('Item')
+      item = self.store.get(reminder['userId'], reminder['reminderId'])
       self.assertEqual(item['status'], 'sent')
     
     # Verificar que no se actualizaron los otros recordatorios
     for reminder in self.test_reminders[2:]:
-      item = self.table.get_item(
-        Key={'userId': reminder['userId'], 'reminderId': reminder['reminderId']}
-      ).get('Item')
-      self.assertNotEqual(item['status'], 'sent')
+      item = self.store.get(reminder['userId'], reminder['reminderId'])
+      self.assertEqual(item['status'], reminder['status'])
 
-  @mock_sns
   def test_sns_notification_sent(self):
     # Ejecutar función
     response = send_scheduled_reminders(self.mock_event, self.mock_context)
     
-    # Verificar que se enviaron notificaciones
-    # (moto no soporta completamente MessageAttributes en SNS, así que verificamos el número de publicaciones)
     self.assertEqual(response['statusCode'], 200)
+    
+    # Los dos emails salen en un único envío masivo de SES
+    self.assertEqual(self.ses.get_send_quota()['SentLast24Hours'], 2)
+
+  def test_email_without_address_falls_back_to_topic(self):
+    boto3.resource('dynamodb', region_name='us-east-1').Table('test-users').delete_item(Key={'userId': 'user2'})
+    
+    send_topic = unittest.mock.MagicMock(wraps=send_topic_batch)
+    with unittest.mock.patch.dict('helpers.channel_router.SENDERS', {'topic': send_topic}):
+      response = send_scheduled_reminders(self.mock_event, self.mock_context)
+    
+    self.assertEqual(response['statusCode'], 200)
+    self.assertEqual(self.ses.get_send_quota()['SentLast24Hours'], 1)
+    # El email de user2 se publica en el topic para sus suscripciones
+    batch = send_topic.call_args.args[1]
+    self.assertEqual([(reminder['reminderId'], channel) for reminder, channel in batch], [('2', 'email')])
+    self.assertEqual(self.store.get('user2', '2')['status'], 'sent')
+
+  def test_unknown_channel_marks_reminder_failed(self):
+    self.store.batch_write(put_items=[dict(self.test_reminders[1], notificationTypes=['fax'])])
+    
+    response = send_scheduled_reminders(self.mock_event, self.mock_context)
+    
+    self.assertEqual(response['statusCode'], 200)
+    item = self.store.get('user2', '2')
+    self.assertEqual(item['status'], 'failed')
+    self.assertEqual(item['failureReason'], 'Unsupported channel fax')
+
+  def test_failed_channel_keeps_reminder_pending(self):
+    # Sin plantilla el envío masivo falla: el SMS sí sale, pero user1 sigue
+    # pendiente porque su email no se entregó
+    self.ses.delete_template(TemplateName='reminder')
+    
+    response = send_scheduled_reminders(self.mock_event, self.mock_context)
+    
+    self.assertEqual(response['statusCode'], 500)
+    item = self.store.get('user1', '1')
+    self.assertEqual(item['status'], 'pending')
+    self.assertEqual(item['deliveredChannels'], ['sms'])
+    self.assertEqual(self.store.get('user2', '2')['status'], 'pending')
+
+  def test_retry_sends_only_missing_channels(self):
+    # Primera ejecución: el email falla y el SMS de user1 sí sale
+    self.ses.delete_template(TemplateName='reminder')
+    send_scheduled_reminders(self.mock_event, self.mock_context)
+    
+    # En el reintento solo se envía el email
+    self.ses.create_template(Template={
+      'TemplateName': 'reminder',
+      'SubjectPart': '{{subject}}',
+      'TextPart': '{{body}}'
+    })
+    send_sms = unittest.mock.MagicMock(wraps=send_sms_batch)
+    with unittest.mock.patch.dict('helpers.channel_router.SENDERS', {'sms': send_sms}):
+      response = send_scheduled_reminders(self.mock_event, self.mock_context)
+    
+    self.assertEqual(response['statusCode'], 200)
+    send_sms.assert_not_called()
+    self.assertEqual(self.ses.get_send_quota()['SentLast24Hours'], 2)
+    item = self.store.get('user1', '1')
+    self.assertEqual(item['status'], 'sent')
+    self.assertEqual(item['deliveredChannels'], ['email', 'sms'])
       
   def test_no_reminders_to_send(self):
     # Eliminar todos los recordatorios
-    for reminder in self.test_reminders:
-      self.table.delete_item(
-        Key={'userId': reminder['userId'], 'reminderId': reminder['reminderId']}
-      )
+    self.store.batch_write(delete_keys=[
+      {'userId': reminder['userId'], 'reminderId': reminder['reminderId']}
+      for reminder in self.test_reminders
+    ])
     
     # Ejecutar función
     response = send_scheduled_reminders(self.mock_event, self.mock_context)
@@ -156,24 +242,29 @@ class TestSendScheduledReminders(unittest.TestCase):
     self.assertEqual(response['body'], "Recordatorios procesados: 0")
 
   def test_offline_mode(self):
-    # Configurar entorno offline
+    # Configurar entorno offline (DynamoDB Local)
+    os.environ['REMINDER_STORE'] = 'dynamodb'
     os.environ['IF_OFFLINE'] = 'true'
-    
-    # Ejecutar función
-    response = send_scheduled_reminders(self.mock_event, self.mock_context)
+    with unittest.mock.patch('boto3.session.Session') as mock_session:
+      mock_resource = mock_session.return_value.resource
+      mock_resource.return_value.Table.return_value.query.side_effect = EndpointConnectionError(
+        endpoint_url='http://localhost:8000'
+      )
+      
+      # Ejecutar función
+      response = send_scheduled_reminders(self.mock_event, self.mock_context)
     
     # Verificar que intentó usar DynamoDB local
-    self.assertEqual(response['statusCode'], 500)  # Fallará porque no hay DynamoDB local
+    mock_resource.assert_called_with('dynamodb', endpoint_url='http://localhost:8000')
+    self.assertEqual(response['statusCode'], 500)
 
   def test_dynamodb_query_error(self):
-    # Simular error de DynamoDB en query
-    with unittest.mock.patch('boto3.resource') as mock_resource:
-      mock_table = unittest.mock.MagicMock()
-      mock_table.query.side_effect = ClientError(
-          {'Error': {'Code': '500', 'Message': 'Internal Server Error'}}, 
-          'Query'
+    # Simular error del store en query
+    with unittest.mock.patch('send.send_scheduled.get_reminder_store') as mock_store:
+      mock_store.return_value.query_due.side_effect = ClientError(
+        {'Error': {'Code': '500', 'Message': 'Internal Server Error'}}, 
+        'Query'
       )
-      mock_resource.return_value.Table.return_value = mock_table
       
       # Ejecutar función
       response = send_scheduled_reminders(self.mock_event, self.mock_context)
@@ -184,16 +275,13 @@ class TestSendScheduledReminders(unittest.TestCase):
       self.assertEqual(response_body['error'], 'Could not send scheduled reminders')
 
   def test_dynamodb_update_error(self):
-    # Simular error de DynamoDB en update
-    with unittest.mock.patch('boto3.resource') as mock_resource:
-      # Configurar mock para que query funcione pero update falle
-      mock_table = unittest.mock.MagicMock()
-      mock_table.query.return_value = {'Items': [self.test_reminders[0]]}
-      mock_table.update_item.side_effect = ClientError(
-          {'Error': {'Code': '500', 'Message': 'Internal Server Error'}}, 
-          'UpdateItem'
+    # Simular error del store en update (query funciona)
+    with unittest.mock.patch('send.send_scheduled.get_reminder_store') as mock_store:
+      mock_store.return_value.update.side_effect = ClientError(
+        {'Error': {'Code': '500', 'Message': 'Internal Server Error'}}, 
+        'UpdateItem'
       )
-      mock_resource.return_value.Table.return_value = mock_table
+      mock_store.return_value.query_due.return_value = ([self.test_reminders[0]], None)
       
       # Ejecutar función
       response = send_scheduled_reminders(self.mock_event, self.mock_context)
@@ -207,9 +295,9 @@ class TestSendScheduledReminders(unittest.TestCase):
     # Simular error de SNS
     with unittest.mock.patch('boto3.client') as mock_client:
       mock_sns = unittest.mock.MagicMock()
-      mock_sns.publish.side_effect = ClientError(
+      mock_sns.publish_batch.side_effect = ClientError(
           {'Error': {'Code': '500', 'Message': 'Internal Server Error'}}, 
-          'Publish'
+          'PublishBatch'
       )
       mock_client.return_value = mock_sns
       
@@ -0,0 +1,144 @@
+import unittest
+import os
+import json
+import tempfile
+import unittest.mock
+from freezegun import freeze_time
+from edit.edit_reminder import edit_reminder
+from helpers.sync import tombstone
+from store.reminder_store import get_reminder_store, reset_reminder_stores
+from sync.sync_reminders import sync_reminders
+
+class TestSyncReminders(unittest.TestCase):
+  def setUp(self):
+    # Configurar entorno para pruebas: SQLite embebido, sin red
+    self.tmpdir = tempfile.TemporaryDirectory()
+    self.env = unittest.mock.patch.dict(os.environ, {
+      'REMINDER_STORE': 'sqlite',
+      'SQLITE_PATH': os.path.join(self.tmpdir.name, 'reminders.db')
+    })
+    self.env.start()
+    self.store = get_reminder_store()
+    self.freezer = freeze_time('2026-01-01T00:00:00Z')
+    self.clock = self.freezer.start()
+
+    # Recordatorios anteriores a syncKey, como los de la tabla original
+    self.test_reminders = [
+      {'userId': 'test-user', 'reminderId': str(i), 'title': f'Reminder {i}', 'status': 'pending'}
+      for i in range(5)
+    ] + [
+      {'userId': 'other-user', 'reminderId': '9', 'title': 'Other', 'status': 'pending'}
+    ]
+    self.store.batch_write(put_items=self.test_reminders)
+
+    # Mock event base
+    self.base_event = {
+      'requestContext': {
+        'authorizer': {
+          'claims': {
+            'userId': 'test-user'
+          }
+        }
+      },
+      'queryStringParameters': {}
+    }
+
+  def tearDown(self):
+    # Limpiar store y entorno
+    self.freezer.stop()
+    reset_reminder_stores()
+    self.env.stop()
+    self.tmpdir.cleanup()
+
+  def sync(self, **params):
+    event = dict(self.base_event, queryStringParameters=params)
+    response = sync_reminders(event, None)
+    self.assertEqual(response['statusCode'], 200)
+    return json.loads(response['body'])
+
+  def edit(self, reminder_id, **changes):
+    event = dict(self.base_event, pathParameters={'id': reminder_id}, body=json.dumps(changes))
+    self.assertEqual(edit_reminder(event, None)['statusCode'], 200)
+
+  def full_sync(self, limit):
+    items = []
+    body = self.sync(limit=str(limit))
+    items.extend(body['items'])
+    while body['hasMore']:
+      body = self.sync(limit=str(limit), nextToken=body['nextToken'])
+      items.extend(body['items'])
+    return items, body['watermark']
+
+  def test_full_sync_pages_through_all_reminders(self):
+    items, watermark = self.full_sync(2)
+    self.assertEqual(sorted(item['reminderId'] for item in items), ['0', '1', '2', '3', '4'])
+    # La marca se fija al inicio con margen para escrituras en vuelo
+    self.assertEqual(watermark, '2025-12-31T23:59:55.000Z#')
+
+  def test_edit_maintains_updated_at(self):
+    self.edit('1', title='Changed')
+    item = self.store.get('test-user', '1')
+    self.assertEqual(item['updatedAt'], '2026-01-01T00:00:00.000Z')
+    self.assertEqual(item['syncKey'], '2026-01-01T00:00:00.000Z#1')
+
+  def test_delta_returns_changes_and_deletes(self):
+    _, watermark = self.full_sync(10)
+
+    self.clock.tick(60)
+    self.edit('1', title='Changed')
+    self.store.batch_write(delete_keys=[{'userId': 'test-user', 'reminderId': '2'}])
+    self.store.put_tombstones([tombstone('test-user', '2')])
+
+    body = self.sync(since=watermark)
+    self.assertEqual([item['reminderId'] for item in body['items']], ['1'])
+    self.assertEqual(body['items'][0]['title'], 'Changed')
+    self.assertEqual(body['deleted'], ['2'])
+    self.assertFalse(body['hasMore'])
+
+    # Las escrituras recientes se repiten hasta salir del margen
+    self.clock.tick(10)
+    body = self.sync(since=body['watermark'])
+    self.assertEqual([item['reminderId'] for item in body['items']], ['1'])
+    body = self.sync(since=body['watermark'])
+    self.assertEqual(body['items'], [])
+    self.assertEqual(body['deleted'], [])
+
+  def test_delta_pagination(self):
+    _, watermark = self.full_sync(10)
+    for reminder_id in ['0', '1', '2', '3']:
+      self.clock.tick(1)
+      self.edit(reminder_id, title='Changed')
+
+    seen = []
+    body = self.sync(since=watermark, limit='3')
+    seen.extend(item['reminderId'] for item in body['items'])
+    self.assertTrue(body['hasMore'])
+    # Las páginas intermedias no entregan marca: se sigue con nextToken
+    self.assertIsNone(body['watermark'])
+    body = self.sync(since=watermark, limit='3', nextToken=body['nextToken'])
+    seen.extend(item['reminderId'] for item in body['items'])
+    self.assertFalse(body['hasMore'])
+    self.assertIsNone(body['nextToken'])
+    self.assertEqual(seen, ['0', '1', '2', '3'])
+
+    # La marca final se limita al margen de escrituras en vuelo, así que
+    # los cambios recientes se repiten en la siguiente sincronización
+    self.assertEqual(body['watermark'], '2025-12-31T23:59:59.000Z#')
+    body = self.sync(since=body['watermark'])
+    self.assertEqual([item['reminderId'] for item in body['items']], ['0', '1', '2', '3'])
+
+  def test_expired_watermark_requires_full_resync(self):
+    body = self.sync(since='2025-11-01T00:00:00.000Z#')
+    self.assertTrue(body['fullResync'])
+    self.assertEqual(body['items'], [])
+
+  def test_sync_error(self):
+    with unittest.mock.patch('sync.sync_reminders.get_sync_log') as mock_sync_log:
+      mock_sync_log.return_value.query_changes.side_effect = Exception('boom')
+      event = dict(self.base_event, queryStringParameters={'since': '2026-01-01T00:00:00.000Z#'})
+      response = sync_reminders(event, None)
+    self.assertEqual(response['statusCode'], 500)
+    self.assertEqual(json.loads(response['body'])['error'], 'Could not sync reminders')
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import unittest.mock
+from decimal import Decimal
+from helpers import templates
+from helpers.templates import compile_template, render, sms_limit
+
+class TestTemplates(unittest.TestCase):
+  def setUp(self):
+    # Las pruebas que cambian TEMPLATES no deben dejar plantillas en el LRU
+    compile_template.cache_clear()
+    self.addCleanup(compile_template.cache_clear)
+    self.reminder = {
+      'userId': 'user1',
+      'reminderId': '1',
+      'title': 'Comprar pan',
+      'description': 'En la panadería',
+      'metadata': {'place': 'Centro', 'count': Decimal('2'), 'nested': {'a': 1}}
+    }
+
+  def test_render_email(self):
+    self.assertEqual(render(self.reminder, 'email'), {
+      'subject': 'Recordatorio',
+      'body': 'Comprar pan\nEn la panadería'
+    })
+
+  def test_render_by_locale(self):
+    self.assertEqual(render(self.reminder, 'sms', 'en')['body'], 'Reminder: Comprar pan')
+    # Variante regional y locale desconocido
+    self.assertEqual(render(self.reminder, 'sms', 'en-GB')['body'], 'Reminder: Comprar pan')
+    self.assertEqual(render(self.reminder, 'sms', 'fr')['body'], 'Recordatorio: Comprar pan')
+
+  def test_templates_compiled_once(self):
+    for _ in range(100):
+      render(self.reminder, 'sms', 'es')
+      render(self.reminder, 'push', 'es')
+    info = compile_template.cache_info()
+    self.assertEqual(info.misses, 2)
+    self.assertEqual(info.hits, 198)
+
+  def test_metadata_substitution_is_bounded(self):
+    with unittest.mock.patch.dict(templates.TEMPLATES, {
+      ('es', 'sms'): {'body': '{metadata.place} {metadata.count} [{metadata.nested}] [{metadata.missing}]'}
+    }):
+      compile_template.cache_clear()
+      self.assertEqual(render(self.reminder, 'sms')['body'], 'Centro 2 [] []')
+
+      # Los valores se recortan y no se interpretan como plantilla
+      reminder = dict(self.reminder, metadata={'place': '{title}' + 'x' * 1000})
+      body = render(reminder, 'sms')['body']
+      self.assertTrue(body.startswith('{title}x'))
+
+    with unittest.mock.patch.dict(templates.TEMPLATES, {('es', 'sms'): {'body': '{userId}'}}):
+      compile_template.cache_clear()
+      with self.assertRaises(ValueError):
+        render(self.reminder, 'sms')
+
+  def test_sms_length_limit(self):
+    self.assertEqual(sms_limit('hola'), 160)
+    # á no está en GSM-7: el SMS va en UCS-2
+    self.assertEqual(sms_limit('está'), 70)
+    self.assertEqual(sms_limit('hola', segments=3), 459)
+
+    body = render(dict(self.reminder, title='a' * 300), 'sms')['body']
+    self.assertEqual(len(body), 160)
+    self.assertTrue(body.endswith('...'))
+    body = render(dict(self.reminder, title='á' * 300), 'sms')['body']
+    self.assertEqual(len(body), 70)
+
+  def test_legacy_tile_field(self):
+    reminder = {'userId': 'user1', 'reminderId': '1', 'tile': 'Pagar factura'}
+    self.assertEqual(render(reminder, 'push')['body'], 'Recordatorio: Pagar factura')
+
+if __name__ == '__main__':
+  unittest.main()
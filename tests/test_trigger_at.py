@@ -0,0 +1,68 @@
+import unittest
+from decimal import Decimal
+from helpers.trigger_at import to_epoch_ms
+
+# Mismos casos que tests/triggerAt.test.js: ambas normalizaciones deben
+# aceptar y rechazar exactamente lo mismo
+SHARED_VALID = [
+  ('2023-12-31T00:00:00Z', 1703980800000),
+  ('2023-12-31t00:00:00z', 1703980800000),
+  ('2023-12-31T01:00:00+01:00', 1703980800000),
+  ('2023-12-31T05:30:00+0530', 1703980800000),
+  ('2023-12-30T20:00:00-04:00', 1703980800000),
+  ('2023-12-31T00:00:00.250Z', 1703980800250),
+  ('2023-12-31T00:00:00.2509Z', 1703980800250),
+  ('2023-12-31T00:00', 1703980800000),
+  ('2023-12-31 00:00:00', 1703980800000),
+  ('2023-12-31', 1703980800000),
+  ('0050-01-01', -60589296000000),
+  (' 1703980800000 ', 1703980800000),
+  ('-1000', -1000)
+]
+SHARED_INVALID = [
+  '', '   ', 'not-a-date', '12/31/2023', 'Dec 31 2023', 'Sun, 31 Dec 2023 00:00:00 GMT',
+  '2023-02-30', '2023-13-01', '2023-12-31T24:00:00Z', '2023-12-31T00:60:00Z',
+  '2023-12-31T00:00:60Z', '2023-12-31T00:00:00+24:00', '2023-12-31Z', '2023-1-31',
+  '2023-12-31T00', '0000-01-01', '1.5', '+1703980800000'
+]
+
+class TestToEpochMs(unittest.TestCase):
+  def test_shared_grammar(self):
+    for value, expected in SHARED_VALID:
+      self.assertEqual(to_epoch_ms(value), expected, value)
+    for value in SHARED_INVALID:
+      with self.assertRaises(ValueError, msg=value):
+        to_epoch_ms(value)
+
+  def test_iso_strings(self):
+    self.assertEqual(to_epoch_ms('2023-12-31T00:00:00Z'), 1703980800000)
+    self.assertEqual(to_epoch_ms('2023-12-31T01:00:00+01:00'), 1703980800000)
+    self.assertEqual(to_epoch_ms('2023-12-31T00:00:00.250Z'), 1703980800250)
+
+  def test_naive_dates_are_utc(self):
+    self.assertEqual(to_epoch_ms('2023-12-31T00:00:00'), 1703980800000)
+    self.assertEqual(to_epoch_ms('2023-12-31'), 1703980800000)
+
+  def test_numbers(self):
+    self.assertEqual(to_epoch_ms(1703980800000), 1703980800000)
+    self.assertEqual(to_epoch_ms(Decimal('1703980800000')), 1703980800000)
+    self.assertEqual(to_epoch_ms('1703980800000'), 1703980800000)
+    self.assertEqual(to_epoch_ms(1703980800000.4), 1703980800000)
+
+  def test_rounding_matches_math_round(self):
+    self.assertEqual(to_epoch_ms(2.5), 3)
+    self.assertEqual(to_epoch_ms(-2.5), -2)
+    self.assertEqual(to_epoch_ms(Decimal('2.5')), 3)
+    self.assertEqual(to_epoch_ms(Decimal('2.4')), 2)
+
+  def test_invalid_values(self):
+    invalid = [
+      '', 'not-a-date', None, True, float('nan'), float('inf'), {},
+      Decimal('NaN'), Decimal('Infinity'), Decimal('-Infinity')
+    ]
+    for value in invalid:
+      with self.assertRaises(ValueError):
+        to_epoch_ms(value)
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,43 @@
+// triggerAt.test.js
+const { toEpochMillis } = require('../helpers/triggerAt');
+
+// Mismos casos que tests/test_trigger_at.py: ambas normalizaciones deben
+// aceptar y rechazar exactamente lo mismo
+const SHARED_VALID = [
+  ['2023-12-31T00:00:00Z', 1703980800000],
+  ['2023-12-31t00:00:00z', 1703980800000],
+  ['2023-12-31T01:00:00+01:00', 1703980800000],
+  ['2023-12-31T05:30:00+0530', 1703980800000],
+  ['2023-12-30T20:00:00-04:00', 1703980800000],
+  ['2023-12-31T00:00:00.250Z', 1703980800250],
+  ['2023-12-31T00:00:00.2509Z', 1703980800250],
+  ['2023-12-31T00:00', 1703980800000],
+  ['2023-12-31 00:00:00', 1703980800000],
+  ['2023-12-31', 1703980800000],
+  ['0050-01-01', -60589296000000],
+  [' 1703980800000 ', 1703980800000],
+  ['-1000', -1000]
+];
+const SHARED_INVALID = [
+  '', '   ', 'not-a-date', '12/31/2023', 'Dec 31 2023', 'Sun, 31 Dec 2023 00:00:00 GMT',
+  '2023-02-30', '2023-13-01', '2023-12-31T24:00:00Z', '2023-12-31T00:60:00Z',
+  '2023-12-31T00:00:60Z', '2023-12-31T00:00:00+24:00', '2023-12-31Z', '2023-1-31',
+  '2023-12-31T00', '0000-01-01', '1.5', '+1703980800000'
+];
+
+describe('toEpochMillis', () => {
+  it.each(SHARED_VALID)('should accept %p', (value, expected) => {
+    expect(toEpochMillis(value)).toBe(expected);
+  });
+
+  it.each(SHARED_INVALID)('should reject %p', (value) => {
+    expect(() => toEpochMillis(value)).toThrow('Invalid triggerAt');
+  });
+
+  it('should round numbers like the Python normalization', () => {
+    expect(toEpochMillis(2.5)).toBe(3);
+    expect(toEpochMillis(-2.5)).toBe(-2);
+    expect(() => toEpochMillis(NaN)).toThrow('Invalid triggerAt');
+    expect(() => toEpochMillis(null)).toThrow('Invalid triggerAt');
+  });
+});